@@ -21,10 +21,12 @@ This module contains the core implementation of Zephyr MCP Agent, responsible fo
 import os
 import sys
 import json
+import inspect
 import traceback
 import logging
 import datetime
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 
 # 导入其他模块 / Import other modules
 from config_manager import load_config
@@ -80,6 +82,178 @@ except ImportError as e:
     sys.exit(1)
 
 
+# 支持的语言 / Supported languages
+_SUPPORTED_LANGUAGES = frozenset({"zh", "en"})
+
+# 语言代码到显示名称的只读映射 / Read-only mapping of language codes to display names
+_AVAILABLE_LANGUAGES = MappingProxyType(
+    {"zh": "中文 (Chinese)", "en": "English (英语)"}
+)
+
+# 分类名称显示表 / Category display name tables
+_CATEGORY_MAP_ZH = {
+    "git": "Git 工具",
+    "zephyr": "Zephyr 工具",
+    "west": "West 工具",
+    "llm": "LLM 工具",
+    "test": "测试工具",
+    "other": "其他工具",
+}
+
+_CATEGORY_MAP_EN = {
+    "git": "Git Tools",
+    "zephyr": "Zephyr Tools",
+    "west": "West Tools",
+    "llm": "LLM Tools",
+    "test": "Test Tools",
+    "other": "Other Tools",
+}
+
+# 配置键到Agent构造参数的映射 / Config key to Agent constructor keyword mapping
+_AGENT_CONFIG_KWARGS = (
+    ("agent_name", "name"),
+    ("version", "version"),
+    ("description", "description"),
+)
+
+
+def _probe_agent_params():
+    """
+    在导入时检查一次Agent构造函数签名 / Inspect the Agent constructor signature once at import
+
+    返回 / Returns:
+    - 可接受的关键字参数名集合；接受**kwargs时返回全部映射参数；
+      无法获取签名时返回None
+    - Set of accepted keyword names; all mapped names when **kwargs is
+      accepted; None when the signature cannot be inspected
+    """
+    try:
+        parameters = inspect.signature(Agent.__init__).parameters
+    except (TypeError, ValueError):
+        return None
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        return frozenset(param for _, param in _AGENT_CONFIG_KWARGS)
+    return frozenset(parameters)
+
+
+_AGENT_PARAMS = _probe_agent_params()
+
+
+# 传给add_tool/Tool的工具字段 / Tool fields passed to add_tool/Tool
+_TOOL_FIELDS = ("name", "description", "function", "parameters", "returns")
+
+
+def _probe_add_tool_kwargs() -> bool:
+    """
+    检查Agent.add_tool是否直接接受关键字参数 / Check whether Agent.add_tool accepts keyword fields directly
+
+    返回 / Returns:
+    - 仅以工具字段作为关键字参数即可调用add_tool时返回True，此时可跳过Tool包装；
+      例如add_tool(self, tool, **kwargs)仍需要tool参数，返回False
+    - True when add_tool can be called with just the tool fields as keywords, so the
+      Tool wrapper can be skipped; add_tool(self, tool, **kwargs) still needs `tool`
+      and returns False
+    """
+    add_tool = getattr(Agent, "add_tool", None)
+    if add_tool is None:
+        return False
+    try:
+        signature = inspect.signature(add_tool)
+        signature.bind(None, **dict.fromkeys(_TOOL_FIELDS))
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+_AGENT_ADD_TOOL_KWARGS = _probe_add_tool_kwargs()
+
+
+def _build_agent(config: Dict[str, Any]):
+    """
+    根据预先检查的签名创建Agent实例 / Create Agent instance using the pre-inspected signature
+
+    参数 / Parameters:
+    - config: Agent配置字典 / Agent configuration dictionary
+
+    返回 / Returns:
+    - Agent实例 / Agent instance
+    """
+    if _AGENT_PARAMS is None:
+        return Agent(config["agent_name"])
+    kwargs = {
+        param: config[key]
+        for key, param in _AGENT_CONFIG_KWARGS
+        if param in _AGENT_PARAMS
+    }
+    return Agent(**kwargs)
+
+
+def _register_one(tool_cls, register_fn, tool_info):
+    """
+    注册单个工具并返回要保存的注册表条目 / Register one tool and return the registry entry to store
+
+    两种注册方式都保存同一种值（注册表条目），self.tools的内容不依赖Agent的API
+    Both registration paths store the same kind of value (the registry entry), so
+    self.tools does not depend on the Agent API
+    """
+    fields = {field: tool_info[field] for field in _TOOL_FIELDS}
+    if tool_cls is None:
+        # add_tool接受原始字段，跳过Tool包装 / add_tool takes raw fields, skip the Tool wrapper
+        register_fn(**fields)
+    else:
+        tool = tool_cls(**fields)
+        if register_fn is not None:
+            register_fn(tool)
+    return tool_info
+
+
+def _register_tools(
+    tool_cls, register_fn, registered_tools, out_tools, tracer, on_error
+) -> int:
+    """
+    工具注册循环 / Tool registration loop
+
+    tool_cls为None时直接以关键字参数调用register_fn并保存原始tool_info，
+    不再创建Tool对象。
+    When tool_cls is None, register_fn is called with the tool fields as
+    keyword arguments and the raw tool_info is stored instead of a Tool.
+
+    返回 / Returns:
+    - 成功注册的工具数量 / Number of tools registered successfully
+    """
+    count = 0
+    for tool_name, tool_info in registered_tools.items():
+        try:
+            if tracer is not None:
+                with tracer.start_as_current_span(
+                    f"register_tool_{tool_name}"
+                ) as tool_span:
+                    tool_span.set_attribute("tool.name", tool_name)
+                    tool_span.set_attribute(
+                        "tool.description", tool_info["description"]
+                    )
+                    tool_span.set_attribute(
+                        "tool.param_count", len(tool_info.get("parameters", []))
+                    )
+                    out_tools[tool_name] = _register_one(
+                        tool_cls, register_fn, tool_info
+                    )
+                    tool_span.set_attribute("tool.registered", True)
+            else:
+                out_tools[tool_name] = _register_one(tool_cls, register_fn, tool_info)
+            count += 1
+        except Exception as tool_error:
+            if tracer is not None:
+                with tracer.start_as_current_span(
+                    f"register_tool_{tool_name}_error"
+                ) as error_span:
+                    error_span.set_attribute("tool.name", tool_name)
+                    error_span.set_attribute("error", True)
+                    error_span.set_attribute("error.message", str(tool_error))
+            on_error(tool_name, tool_error)
+    return count
+
+
 class ZephyrMCPAgent:
     """
     Zephyr MCP Agent核心类 / Zephyr MCP Agent Core Class
@@ -101,6 +275,25 @@ class ZephyrMCPAgent:
     - Generating tool documentation
     """
 
+    # 固定实例属性布局，避免每个实例的__dict__开销 / Fixed attribute layout, no per-instance __dict__
+    __slots__ = (
+        "config_path",
+        "config",
+        "language_config",
+        "default_language",
+        "language_manager",
+        "logger",
+        "agent",
+        "tool_registry",
+        "tools",
+        "current_language",
+        "otel_tracer",
+        "supported_languages",
+        "_category_fmt",
+        "_start_banner",
+        "_tr",
+    )
+
     def __init__(self, config_path: str = "config.json"):
         """
         初始化agent / Initialize Agent
@@ -130,29 +323,18 @@ class ZephyrMCPAgent:
         from src.utils.language_resources import LanguageManager
 
         self.language_manager = LanguageManager(self.default_language)
+        self._tr = self.language_manager.resources
 
         # 设置日志器 / Set up logger
         self.logger = self._setup_logger(self.config.get("log_level", "INFO"))
 
         # 创建Agent实例 / Create Agent instance
-        try:
-            # 尝试使用完整参数初始化 / Try to initialize with full parameters
-            self.agent = Agent(
-                name=self.config["agent_name"],
-                version=self.config["version"],
-                description=self.config["description"],
-            )
-        except TypeError:
-            # 如果参数不匹配，尝试使用名称初始化 / If parameters don't match, try name-only initialization
-            try:
-                self.agent = Agent(self.config["agent_name"])
-            except Exception:
-                # 最后使用默认初始化 / Finally use default initialization
-                self.agent = Agent()
+        self.agent = _build_agent(self.config)
 
         # 使用工具注册表 / Use tool registry
         self.tool_registry = get_default_tool_registry()
-        self.tools: Dict[str, Tool] = {}
+        # 工具名到注册表条目的映射 / Tool name to registry entry
+        self.tools: Dict[str, Any] = {}
 
         # 存储当前语言 / Store current language
         self.current_language = self.default_language
@@ -164,7 +346,7 @@ class ZephyrMCPAgent:
         self.logger.info(f"Agent initialized with language: {self.current_language}")
 
         # 检查是否支持双语 / Check if bilingual support is available
-        self.supported_languages = ["zh", "en"]
+        self.supported_languages = _SUPPORTED_LANGUAGES
         if self.current_language not in self.supported_languages:
             self.logger.warning(
                 f"Language '{self.current_language}' not supported, defaulting to 'zh'"
@@ -172,6 +354,30 @@ class ZephyrMCPAgent:
             self.current_language = "zh"
             setup_language("zh")
 
+        self._refresh_language_bindings()
+
+    def _refresh_language_bindings(self):
+        """
+        按当前语言预先解析显示相关的绑定 / Resolve language-dependent display bindings up front
+
+        功能 / Functionality:
+        - 选择分类名称格式化函数 / Select the category name formatter
+        - 预先生成启动标题 / Prebuild the start banner
+        - 绑定当前语言的文本表 / Bind the text table of the current language
+        """
+        self._tr = self.language_manager.resources
+        if self.current_language == "zh":
+            self._category_fmt = self._format_category_name
+            self._start_banner = (
+                f"\nZephyr MCP Agent {self.get_text('starting_agent')}"
+                f"\n\n{self.get_text('available_tools')}:"
+            )
+        else:
+            self._category_fmt = self._format_category_name_en
+            self._start_banner = (
+                "\nZephyr MCP Agent - Starting Agent\n\nAvailable Tools:"
+            )
+
     def _setup_logger(self, level="INFO"):
         """
         设置日志系统 / Set up logging system
@@ -286,70 +492,28 @@ class ZephyrMCPAgent:
             # 将注册的工具添加到Agent中 / Add registered tools to Agent
             registered_tools = self.tool_registry.get_registered_tools()
 
-            for tool_name, tool_info in registered_tools.items():
-                try:
-                    if span:
-                        with self.otel_tracer.start_as_current_span(
-                            f"register_tool_{tool_name}"
-                        ) as tool_span:
-                            tool_span.set_attribute("tool.name", tool_name)
-                            tool_span.set_attribute(
-                                "tool.description", tool_info["description"]
-                            )
-                            tool_span.set_attribute(
-                                "tool.param_count", len(tool_info.get("parameters", []))
-                            )
-
-                            # 创建Tool对象并注册到agent / Create Tool object and register to agent
-                            tool = Tool(
-                                name=tool_info["name"],
-                                description=tool_info["description"],
-                                function=tool_info["function"],
-                                parameters=tool_info["parameters"],
-                                returns=tool_info["returns"],
-                            )
-
-                            # 注册工具到agno Agent / Register tool to agno Agent
-                            if hasattr(self.agent, "add_tool"):
-                                self.agent.add_tool(tool)
-                            elif hasattr(self.agent, "register_tool"):
-                                self.agent.register_tool(
-                                    tool
-                                )  # 兼容旧版本 / Compatible with older versions
-
-                            self.tools[tool_name] = tool
-                            tool_span.set_attribute("tool.registered", True)
-                    else:
-                        # 不使用追踪的版本 / Version without tracing
-                        tool = Tool(
-                            name=tool_info["name"],
-                            description=tool_info["description"],
-                            function=tool_info["function"],
-                            parameters=tool_info["parameters"],
-                            returns=tool_info["returns"],
-                        )
-
-                        # 注册工具到agno Agent / Register tool to agno Agent
-                        if hasattr(self.agent, "add_tool"):
-                            self.agent.add_tool(tool)
-                        elif hasattr(self.agent, "register_tool"):
-                            self.agent.register_tool(
-                                tool
-                            )  # 兼容旧版本 / Compatible with older versions
-
-                        self.tools[tool_name] = tool
-                except Exception as tool_error:
-                    if span:
-                        with self.otel_tracer.start_as_current_span(
-                            f"register_tool_{tool_name}_error"
-                        ) as error_span:
-                            error_span.set_attribute("tool.name", tool_name)
-                            error_span.set_attribute("error", True)
-                            error_span.set_attribute("error.message", str(tool_error))
-
-                    self.logger.warning(
-                        self.get_text("tool_register_error", tool_name, str(tool_error))
-                    )
+            # 解析一次注册函数，避免每个工具都做hasattr检查 / Resolve the register function once instead of per tool
+            tool_cls = Tool
+            if hasattr(self.agent, "add_tool"):
+                register_fn = self.agent.add_tool
+                if _AGENT_ADD_TOOL_KWARGS:
+                    # 直接传递字段，无需构造Tool对象 / Pass fields directly, no Tool object needed
+                    tool_cls = None
+            elif hasattr(self.agent, "register_tool"):
+                register_fn = (
+                    self.agent.register_tool
+                )  # 兼容旧版本 / Compatible with older versions
+            else:
+                register_fn = None
+
+            _register_tools(
+                tool_cls,
+                register_fn,
+                registered_tools,
+                self.tools,
+                self.otel_tracer if span else None,
+                self._on_tool_register_error,
+            )
 
             success_count = sum(1 for success in results.values() if success)
             self.logger.info(
@@ -371,6 +535,12 @@ class ZephyrMCPAgent:
             self.logger.error(self.get_text("tool_register_error", "all", str(e)))
             return False
 
+    def _on_tool_register_error(self, tool_name: str, tool_error: Exception):
+        """记录单个工具注册失败 / Log a single tool registration failure"""
+        self.logger.warning(
+            self.get_text("tool_register_error", tool_name, str(tool_error))
+        )
+
     def register_llm_tools(self):
         """
         注册LLM相关工具 / Register LLM-related tools
@@ -410,7 +580,9 @@ class ZephyrMCPAgent:
             self.logger.info(self.get_text("llm_tools_registered"))
         except Exception as e:
             self.logger.error(self.get_text("llm_tool_register_error", str(e)))
-            self.logger.debug(traceback.format_exc())
+            # 仅在DEBUG级别启用时格式化堆栈 / Only format the traceback when DEBUG is enabled
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(traceback.format_exc())
 
     def start(self, show_language_info: bool = False):
         """
@@ -462,22 +634,14 @@ class ZephyrMCPAgent:
         categories = self.tool_registry.categorize_tools()
 
         # 双语显示标题 / Bilingual display title
-        if self.current_language == "zh":
-            print(f"\nZephyr MCP Agent {self.get_text('starting_agent')}")
-            print(f"\n{self.get_text('available_tools')}:")
-        else:
-            print(f"\nZephyr MCP Agent - Starting Agent")
-            print(f"\nAvailable Tools:")
+        _print = print
+        _print(self._start_banner)
 
+        # 分类格式化函数已按当前语言预先选择 / Category formatter is preselected for the current language
+        category_fmt = self._category_fmt
         for category, tool_names in categories.items():
             if tool_names:
-                # 根据当前语言显示分类名称 / Display category name based on current language
-                if self.current_language == "zh":
-                    category_display = self._format_category_name(category)
-                else:
-                    category_display = self._format_category_name_en(category)
-
-                print(f"\n{category_display} ({len(tool_names)}):")
+                _print(f"\n{category_fmt(category)} ({len(tool_names)}):")
                 for tool_name in tool_names:
                     tool_info = registered_tools[tool_name]
                     # 显示简短描述 / Display short description
@@ -486,7 +650,7 @@ class ZephyrMCPAgent:
                         if len(tool_info["description"]) > 60
                         else tool_info["description"]
                     )
-                    print(f"- {tool_name}: {short_desc}")
+                    _print(f"- {tool_name}: {short_desc}")
 
         # 生成工具文档 / Generate tool documentation
         self._generate_tool_documentation()
@@ -532,7 +696,8 @@ class ZephyrMCPAgent:
                     self.get_text("tool_health_check_failed", tool_name, str(e))
                 )
 
-    def _format_category_name(self, category: str) -> str:
+    @staticmethod
+    def _format_category_name(category: str) -> str:
         """
         格式化分类名称（中文） / Format category name (Chinese)
 
@@ -547,15 +712,7 @@ class ZephyrMCPAgent:
         - 提供统一的分类名称格式 / Provide unified category name formatting
         - 支持未知分类名称的默认处理 / Support default handling for unknown category names
         """
-        category_map = {
-            "git": "Git 工具",
-            "zephyr": "Zephyr 工具",
-            "west": "West 工具",
-            "llm": "LLM 工具",
-            "test": "测试工具",
-            "other": "其他工具",
-        }
-        return category_map.get(category, category)
+        return _CATEGORY_MAP_ZH.get(category, category)
 
     def get_text(self, key: str, *args, **kwargs) -> str:
         """
@@ -574,12 +731,27 @@ class ZephyrMCPAgent:
         - 支持文本格式化 / Support text formatting
         - 处理多语言文本替换 / Handle multi-language text substitution
         """
-        return self.language_manager.get(key, *args, **kwargs)
+        template = self._tr.get(key, key)
+        if args or kwargs:
+            return template.format(*args, **kwargs)
+        return template
+
+    def get_text_in(self, key: str, language: str, *args, **kwargs) -> str:
+        """
+        获取指定语言的本地化文本，不切换当前语言 / Get localized text in a given language without switching
+
+        参数 / Parameters:
+        - key: 文本键值 / Text key
+        - language: 语言代码 / Language code
+        - *args, **kwargs: 格式化参数 / Formatting arguments
+        """
+        return self.language_manager.get_in(language, key, *args, **kwargs)
 
     def set_current_language(self, language: str):
         """设置当前语言"""
         self.current_language = language
         setup_language(language)
+        self._refresh_language_bindings()
 
     def get_current_language(self) -> str:
         """获取当前语言"""
@@ -593,41 +765,43 @@ class ZephyrMCPAgent:
             # 获取注册的工具 / Get registered tools
             registered_tools = self.tool_registry.get_registered_tools()
 
-            # 生成Markdown文档 / Generate Markdown documentation
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write("# Zephyr MCP Agent 工具文档\n\n")
-                f.write(
-                    f"生成时间: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                )
+            # 生成Markdown文档，先拼接再一次性写入 / Generate Markdown documentation, built up then written once
+            parts: List[str] = ["# Zephyr MCP Agent 工具文档\n\n"]
+            parts.append(
+                f"生成时间: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            )
 
-                # 按分类显示工具 / Display tools by category
-                categories = self.tool_registry.categorize_tools()
+            # 按分类显示工具 / Display tools by category
+            categories = self.tool_registry.categorize_tools()
 
-                for category, tool_names in categories.items():
-                    if tool_names:
-                        f.write(
-                            f"## {self._format_category_name(category)} ({len(tool_names)})\n\n"
-                        )
+            for category, tool_names in categories.items():
+                if tool_names:
+                    parts.append(
+                        f"## {self._format_category_name(category)} ({len(tool_names)})\n\n"
+                    )
 
-                        for tool_name in tool_names:
-                            tool_info = registered_tools[tool_name]
-                            f.write(f"### {tool_name}\n\n")
-                            f.write(f"**描述**: {tool_info['description']}\n\n")
-
-                            if tool_info.get("parameters"):
-                                f.write("**参数**:\n\n")
-                                for param_name, param_info in tool_info[
-                                    "parameters"
-                                ].items():
-                                    f.write(
-                                        f"- `{param_name}`: {param_info.get('description', '无描述')}\n"
-                                    )
-                                f.write("\n")
-
-                            if tool_info.get("returns"):
-                                f.write(
-                                    f"**返回值**: {tool_info['returns'].get('description', '无描述')}\n\n"
+                    for tool_name in tool_names:
+                        tool_info = registered_tools[tool_name]
+                        parts.append(f"### {tool_name}\n\n")
+                        parts.append(f"**描述**: {tool_info['description']}\n\n")
+
+                        if tool_info.get("parameters"):
+                            parts.append("**参数**:\n\n")
+                            for param_name, param_info in tool_info[
+                                "parameters"
+                            ].items():
+                                parts.append(
+                                    f"- `{param_name}`: {param_info.get('description', '无描述')}\n"
                                 )
+                            parts.append("\n")
+
+                        if tool_info.get("returns"):
+                            parts.append(
+                                f"**返回值**: {tool_info['returns'].get('description', '无描述')}\n\n"
+                            )
+
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write("".join(parts))
 
             self.logger.info(self.get_text("tool_documentation_generated", output_file))
         except Exception as e:
@@ -656,7 +830,7 @@ class ZephyrMCPAgent:
         """
         if language not in self.supported_languages:
             self.logger.error(
-                f"Language '{language}' is not supported. Supported languages: {self.supported_languages}"
+                f"Language '{language}' is not supported. Supported languages: {sorted(self.supported_languages)}"
             )
             return False
 
@@ -670,6 +844,9 @@ class ZephyrMCPAgent:
             # 更新语言管理器 / Update language manager
             self.language_manager.set_language(language)
 
+            # 刷新预先解析的显示绑定 / Refresh the precomputed display bindings
+            self._refresh_language_bindings()
+
             self.logger.info(f"Language switched to: {language}")
             return True
 
@@ -677,12 +854,12 @@ class ZephyrMCPAgent:
             self.logger.error(f"Failed to switch language to '{language}': {str(e)}")
             return False
 
-    def get_available_languages(self) -> Dict[str, str]:
+    def get_available_languages(self) -> Mapping[str, str]:
         """
         获取可用语言列表 / Get available languages list
 
         返回 / Returns:
-        - 语言代码到语言名称的映射字典 / Dictionary mapping language codes to language names
+        - 语言代码到语言名称的只读映射 / Read-only mapping of language codes to language names
 
         功能 / Functionality:
         - 返回系统支持的所有语言 / Return all languages supported by the system
@@ -693,7 +870,7 @@ class ZephyrMCPAgent:
         - zh: 中文 (Chinese)
         - en: English (英语)
         """
-        return {"zh": "中文 (Chinese)", "en": "English (英语)"}
+        return _AVAILABLE_LANGUAGES
 
     def get_language_info(self) -> Dict[str, Any]:
         """
@@ -717,7 +894,7 @@ class ZephyrMCPAgent:
         return {
             "current": self.current_language,
             "name": available_languages.get(self.current_language, "Unknown"),
-            "supported_languages": available_languages,
+            "supported_languages": dict(available_languages),
             "default": self.default_language,
         }
 
@@ -741,49 +918,52 @@ class ZephyrMCPAgent:
             # 获取注册的工具 / Get registered tools
             registered_tools = self.tool_registry.get_registered_tools()
 
-            # 生成双语Markdown文档 / Generate bilingual Markdown documentation
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write("# Zephyr MCP Agent 工具文档 / Tool Documentation\n\n")
-                f.write(
-                    f"生成时间 / Generated at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                )
+            # 生成双语Markdown文档，先拼接再一次性写入 / Generate bilingual Markdown documentation, built up then written once
+            parts: List[str] = ["# Zephyr MCP Agent 工具文档 / Tool Documentation\n\n"]
+            parts.append(
+                f"生成时间 / Generated at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            )
 
-                # 按分类显示工具 / Display tools by category
-                categories = self.tool_registry.categorize_tools()
+            # 按分类显示工具 / Display tools by category
+            categories = self.tool_registry.categorize_tools()
 
-                for category, tool_names in categories.items():
-                    if tool_names:
-                        # 双语分类标题 / Bilingual category title
-                        category_name_zh = self._format_category_name(category)
-                        category_name_en = self._format_category_name_en(category)
-                        f.write(
-                            f"## {category_name_zh} / {category_name_en} ({len(tool_names)})\n\n"
+            for category, tool_names in categories.items():
+                if tool_names:
+                    # 双语分类标题 / Bilingual category title
+                    category_name_zh = self._format_category_name(category)
+                    category_name_en = self._format_category_name_en(category)
+                    parts.append(
+                        f"## {category_name_zh} / {category_name_en} ({len(tool_names)})\n\n"
+                    )
+
+                    for tool_name in tool_names:
+                        tool_info = registered_tools[tool_name]
+                        parts.append(f"### {tool_name}\n\n")
+
+                        # 双语描述 / Bilingual description
+                        parts.append(
+                            f"**描述 / Description**: {tool_info['description']}\n\n"
                         )
 
-                        for tool_name in tool_names:
-                            tool_info = registered_tools[tool_name]
-                            f.write(f"### {tool_name}\n\n")
-
-                            # 双语描述 / Bilingual description
-                            f.write("**描述 / Description**: ")
-                            f.write(f"{tool_info['description']}\n\n")
-
-                            if tool_info.get("parameters"):
-                                f.write("**参数 / Parameters**:\n\n")
-                                for param_name, param_info in tool_info[
-                                    "parameters"
-                                ].items():
-                                    param_desc = param_info.get(
-                                        "description", "无描述 / No description"
-                                    )
-                                    f.write(f"- `{param_name}`: {param_desc}\n")
-                                f.write("\n")
-
-                            if tool_info.get("returns"):
-                                return_desc = tool_info["returns"].get(
+                        if tool_info.get("parameters"):
+                            parts.append("**参数 / Parameters**:\n\n")
+                            for param_name, param_info in tool_info[
+                                "parameters"
+                            ].items():
+                                param_desc = param_info.get(
                                     "description", "无描述 / No description"
                                 )
-                                f.write(f"**返回值 / Returns**: {return_desc}\n\n")
+                                parts.append(f"- `{param_name}`: {param_desc}\n")
+                            parts.append("\n")
+
+                        if tool_info.get("returns"):
+                            return_desc = tool_info["returns"].get(
+                                "description", "无描述 / No description"
+                            )
+                            parts.append(f"**返回值 / Returns**: {return_desc}\n\n")
+
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write("".join(parts))
 
             self.logger.info(f"Bilingual documentation generated: {output_file}")
             return True
@@ -792,17 +972,10 @@ class ZephyrMCPAgent:
             self.logger.error(f"Failed to generate bilingual documentation: {str(e)}")
             return False
 
-    def _format_category_name_en(self, category: str) -> str:
+    @staticmethod
+    def _format_category_name_en(category: str) -> str:
         """格式化英文分类名称 / Format English category name"""
-        category_map = {
-            "git": "Git Tools",
-            "zephyr": "Zephyr Tools",
-            "west": "West Tools",
-            "llm": "LLM Tools",
-            "test": "Test Tools",
-            "other": "Other Tools",
-        }
-        return category_map.get(category, category)
+        return _CATEGORY_MAP_EN.get(category, category)
 
     def start_with_language_selection(self):
         """启动agent并显示语言选择 / Start agent and display language selection"""
@@ -812,21 +985,11 @@ class ZephyrMCPAgent:
     def get_bilingual_text(self, key: str, *args, **kwargs) -> Dict[str, str]:
         """获取双语文本 / Get bilingual text"""
         try:
-            # 保存当前语言 / Save current language
-            original_language = self.current_language
-
-            # 获取中文文本 / Get Chinese text
-            self.switch_language("zh")
-            text_zh = self.get_text(key, *args, **kwargs)
-
-            # 获取英文文本 / Get English text
-            self.switch_language("en")
-            text_en = self.get_text(key, *args, **kwargs)
-
-            # 恢复原始语言 / Restore original language
-            self.switch_language(original_language)
-
-            return {"zh": text_zh, "en": text_en}
+            # 直接按语言查表，不切换当前语言 / Look up each language directly, no language switching
+            return {
+                "zh": self.get_text_in(key, "zh", *args, **kwargs),
+                "en": self.get_text_in(key, "en", *args, **kwargs),
+            }
 
         except Exception as e:
             self.logger.error(f"Failed to get bilingual text for key '{key}': {str(e)}")
@@ -9,6 +9,13 @@ import shlex
 import subprocess
 from typing import Sequence
 
+# git路径在git_session模块加载时解析一次，避免每次调用都遍历PATH
+try:
+    from check.git_session import GIT_EXECUTABLE, GitSession
+except ImportError:
+    # 直接运行本脚本时check目录位于sys.path中
+    from git_session import GIT_EXECUTABLE, GitSession
+
 ZEPHYR_PROJECT_DIR = "c:/zephyr_project/zephyr"
 
 
@@ -18,11 +25,14 @@ def run_git_command(command: str | Sequence[str], get_output: bool = True):
     try:
         cmd = shlex.split(command) if isinstance(command, str) else list(command)
         print(f"执行: {' '.join(cmd)}")
+        if cmd and cmd[0] == "git":
+            cmd[0] = GIT_EXECUTABLE
         result = subprocess.run(
             cmd,
             cwd=ZEPHYR_PROJECT_DIR,
             capture_output=True,
             text=True,
+            shell=False,
             check=False,
         )
         if get_output:
@@ -41,35 +51,88 @@ def run_git_command(command: str | Sequence[str], get_output: bool = True):
 
 
 
+def parse_porcelain_v2(output: str) -> dict:
+    """解析 git status --porcelain=v2 --branch 的输出"""
+    info = {"branch": "", "oid": "", "conflicts": [], "changes": []}
+    for line in output.splitlines():
+        if line.startswith("# branch.head "):
+            info["branch"] = line[len("# branch.head "):]
+        elif line.startswith("# branch.oid "):
+            info["oid"] = line[len("# branch.oid "):]
+        elif line.startswith("u "):
+            # u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>
+            info["conflicts"].append(line.split(" ", 10)[10])
+        elif line.startswith("1 "):
+            # 1 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <path>
+            fields = line.split(" ", 8)
+            info["changes"].append((fields[1], fields[8]))
+        elif line.startswith("2 "):
+            # 2 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <X><score> <path>\t<origPath>
+            fields = line.split(" ", 9)
+            info["changes"].append((fields[1], fields[9].split("\t", 1)[0]))
+    return info
+
+
+def conflict_preview(session: GitSession, path: str, max_lines: int = 20) -> list:
+    """读取冲突文件共同祖先版本(:1:path)的前max_lines行"""
+    obj = session.read_object(f":1:{path}")
+    if obj is None:
+        # 双方新增的文件没有共同祖先版本
+        return []
+    return obj[2].decode("utf-8", "replace").splitlines()[:max_lines]
+
+
 def main():
     print("检查zephyr项目的rebase最终状态...")
 
+    # 一次 porcelain 调用同时获取分支、HEAD和冲突文件
     print("\n--- 当前Git状态 ---")
-    status = run_git_command(["git", "status"])
+    status = run_git_command(
+        ["git", "status", "--porcelain=v2", "--branch", "--untracked-files=no"]
+    )
     if status["success"]:
-        print(status["output"])
-        is_rebasing = "rebase in progress" in status["output"].lower()
+        info = parse_porcelain_v2(status["output"])
+        print(f"HEAD: {info['oid']}")
+        if info["changes"]:
+            for xy, path in info["changes"]:
+                print(f"  {xy} {path}")
+        else:
+            print("工作区没有已跟踪文件的修改")
     else:
         print(f"获取状态失败: {status['error']}")
-        is_rebasing = False
+        info = None
+
+    # 通过文件系统检查rebase状态，而不是匹配 git status 文本
+    git_dir = os.path.join(ZEPHYR_PROJECT_DIR, ".git")
+    rebase_merge_dir = os.path.join(git_dir, "rebase-merge")
+    is_rebasing = os.path.exists(rebase_merge_dir) or os.path.exists(
+        os.path.join(git_dir, "rebase-apply")
+    )
 
     print("\n--- 当前分支信息 ---")
-    branch = run_git_command(["git", "branch", "--show-current"])
-    if branch["success"]:
-        print(f"当前分支: {branch['output']}")
+    if info is not None:
+        print(f"当前分支: {info['branch']}")
 
     print("\n--- 冲突检查 ---")
-    conflicts = run_git_command(["git", "diff", "--name-only", "--diff-filter=U"])
-    if conflicts["success"]:
-        if conflicts["output"]:
+    if info is not None:
+        if info["conflicts"]:
             print("仍然存在以下冲突文件:")
-            for file in conflicts["output"].splitlines():
+            for file in info["conflicts"]:
                 print(f"  - {file}")
+            # 所有文件的预览共用一个 cat-file 进程，不再为每个文件启动 git show | head
+            print("\n--- 冲突文件共同祖先版本预览 ---")
+            try:
+                with GitSession(ZEPHYR_PROJECT_DIR) as session:
+                    for file in info["conflicts"]:
+                        print(f"=== {file} ===")
+                        for line in conflict_preview(session, file):
+                            print(line)
+            except OSError as e:
+                print(f"读取冲突文件失败: {e}")
         else:
             print("当前没有检测到冲突文件")
 
     print("\n--- 检查是否等待提交信息编辑 ---")
-    rebase_merge_dir = os.path.join(ZEPHYR_PROJECT_DIR, ".git", "rebase-merge")
     if os.path.exists(rebase_merge_dir):
         print("检测到rebase-merge目录，可能在等待编辑提交信息")
         msg_file = os.path.join(rebase_merge_dir, "git-rebase-todo")
@@ -91,9 +154,12 @@ def main():
         print("✅ Rebase操作似乎已经完成或未在进行中")
 
     print("\n--- 最近提交历史 ---")
-    log = run_git_command(["git", "log", "--oneline", "-5"])
-    if log["success"]:
-        print(log["output"])
+    # 合并历史需要git log的遍历顺序和缩写规则，这里保留git log
+    log_result = run_git_command(["git", "log", "--oneline", "-5"])
+    if log_result["success"]:
+        print(log_result["output"])
+    else:
+        print(f"获取提交历史失败: {log_result['error']}")
 
     print("\n--- 操作完成 ---")
     print("rebase状态检查完成")
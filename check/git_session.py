@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+常驻的 git cat-file --batch 进程，用于多次读取对象而无需每次启动新的git进程
+"""
+
+import shutil
+import subprocess
+from typing import Optional, Tuple
+
+GIT_EXECUTABLE = shutil.which("git") or "git"
+
+
+class GitSession:
+    """通过一个常驻的 git cat-file --batch 进程解析引用和读取对象"""
+
+    def __init__(self, cwd: str):
+        self.cwd = cwd
+        self._proc: Optional[subprocess.Popen] = None
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """首次使用时才启动git进程"""
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                [GIT_EXECUTABLE, "cat-file", "--batch"],
+                cwd=self.cwd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def read_object(self, ref: str) -> Optional[Tuple[str, str, bytes]]:
+        """读取对象，返回 (oid, 类型, 内容)，对象不存在时返回None"""
+        proc = self._ensure_started()
+        proc.stdin.write(ref.encode("utf-8") + b"\n")
+        proc.stdin.flush()
+        header = proc.stdout.readline().decode("utf-8").rstrip("\n")
+        # "<ref> missing" 或 "<ref> ambiguous"；ref中可能含空格，先按结尾判断
+        if header.endswith((" missing", " ambiguous")):
+            return None
+        parts = header.split(" ")
+        if len(parts) != 3 or not parts[2].isdigit():
+            return None
+        oid, obj_type, size = parts
+        content = proc.stdout.read(int(size))
+        proc.stdout.read(1)  # 内容后的换行符
+        return oid, obj_type, content
+
+    def resolve(self, ref: str) -> Optional[Tuple[str, str]]:
+        """解析引用，返回 (对象类型, oid)"""
+        obj = self.read_object(ref)
+        if obj is None:
+            return None
+        return obj[1], obj[0]
+
+    def close(self):
+        """关闭git进程"""
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                self._proc.stdin.close()
+                self._proc.wait()
+            self._proc = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -9,10 +9,42 @@ from __future__ import annotations
 import json
 import os
 import platform
+import re
 import subprocess
+import sys
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Dict, Tuple
+from typing import Any, Dict, Tuple
+
+# 直接运行本脚本时仓库根目录不在 sys.path 中
+_repo_root = Path(__file__).resolve().parent.parent
+if str(_repo_root) not in sys.path:
+    sys.path.insert(0, str(_repo_root))
+
+from config_manager import IO_BUFSIZE  # noqa: E402  # pylint: disable=wrong-import-position
+
+# 本工具写入 shell 配置文件的注释行和导出语句
+_SHELL_BLOCK_HEADER = "# Zephyr MCP 环境变量"
+_SHELL_BLOCK_RE = re.compile(
+    r"^(?:# Zephyr MCP 环境变量|export GIT_(?:USERNAME|PASSWORD)=.*)(?:\n|$)",
+    re.M,
+)
+
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时回退到标准库 json
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """解析 JSON 字节串"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为缩进 4 格的 UTF-8 JSON（orjson 只支持 2 格缩进，这里保持原有格式）"""
+    return json.dumps(obj, indent=4, ensure_ascii=False).encode("utf-8")
 
 
 class MCPEnvManager:
@@ -23,57 +55,74 @@ class MCPEnvManager:
         self.vscode_dir = self.project_root / ".vscode"
         self.mcp_config_file = self.vscode_dir / "mcp.json"
         self.env_file = self.project_root / ".env"
+        # (文件戳, 检查结果)，文件 mtime/大小未变时直接复用
+        self._config_cache: Tuple[Tuple[int, int], Dict] | None = None
+        self._env_cache: Dict | None = None
 
     def check_current_config(self) -> Dict:
-        """检查当前 MCP 配置"""
-        if not self.mcp_config_file.exists():
+        """检查当前 MCP 配置，文件未修改时返回缓存结果"""
+        try:
+            st = self.mcp_config_file.stat()
+        except FileNotFoundError:
+            self._config_cache = None
             return {"error": "MCP 配置文件不存在"}
 
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._config_cache is not None and self._config_cache[0] == stamp:
+            return self._config_cache[1]
+
         try:
-            with open(self.mcp_config_file, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            config = _json_loads(self.mcp_config_file.read_bytes())
 
             mcp_server = config.get("mcp", {}).get("servers", {}).get("zephyr-mcp", {})
             env_config = mcp_server.get("env", {})
 
-            return {
+            has_hardcoded, uses_env_refs = self._classify_env(env_config)
+            result = {
                 "config": config,
                 "env_config": env_config,
-                "has_hardcoded_creds": self._has_hardcoded_credentials(env_config),
-                "uses_env_vars": self._uses_env_references(env_config),
+                "has_hardcoded_creds": has_hardcoded,
+                "uses_env_vars": uses_env_refs,
             }
+            self._config_cache = (stamp, result)
+            return result
         except Exception as e:
             return {"error": f"读取配置文件失败: {e}"}
 
-    def _has_hardcoded_credentials(self, env_config: Dict) -> bool:
-        """检查是否有硬编码的凭据"""
-        git_username = env_config.get("GIT_USERNAME", "")
-        git_password = env_config.get("GIT_PASSWORD", "")
-        return (git_username and not git_username.startswith("${")) or (
-            git_password and not git_password.startswith("${")
-        )
-
-    def _uses_env_references(self, env_config: Dict) -> bool:
-        """检查是否使用了环境变量引用"""
-        git_username = env_config.get("GIT_USERNAME", "")
-        git_password = env_config.get("GIT_PASSWORD", "")
-        return (git_username and "${env:" in git_username) or (
-            git_password and "${env:" in git_password
-        )
+    def _classify_env(self, env_config: Dict) -> Tuple[bool, bool]:
+        """一次遍历凭据字段，返回 (是否有硬编码凭据, 是否使用环境变量引用)"""
+        has_hardcoded = False
+        uses_env_refs = False
+        for key in ("GIT_USERNAME", "GIT_PASSWORD"):
+            value = env_config.get(key, "")
+            if not value:
+                continue
+            if not value.startswith("${"):
+                has_hardcoded = True
+            if not uses_env_refs and "${env:" in value:
+                uses_env_refs = True
+        return has_hardcoded, uses_env_refs
 
     def get_system_env_vars(self) -> Dict:
-        """获取系统环境变量"""
-        return {
-            "GIT_USERNAME": os.environ.get("GIT_USERNAME", "未设置"),
-            "GIT_PASSWORD": "已设置" if os.environ.get("GIT_PASSWORD") else "未设置",
-            "mcp_name": os.environ.get("mcp_name", "未设置"),
-        }
+        """获取系统环境变量
+
+        结果在进程内缓存：set_system_env_vars 只写入注册表/shell 配置文件，
+        不会修改当前进程的 os.environ，因此无需失效。
+        """
+        if self._env_cache is None:
+            self._env_cache = {
+                "GIT_USERNAME": os.environ.get("GIT_USERNAME", "未设置"),
+                "GIT_PASSWORD": "已设置" if os.environ.get("GIT_PASSWORD") else "未设置",
+                "mcp_name": os.environ.get("mcp_name", "未设置"),
+            }
+        return self._env_cache
 
     def create_secure_config(self) -> bool:
         """创建安全的配置文件"""
         try:
-            with open(self.mcp_config_file, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            # 保留原始字节用于备份，备份内容即修改前的文件
+            original_bytes = self.mcp_config_file.read_bytes()
+            config = _json_loads(original_bytes)
 
             mcp_server = config.get("mcp", {}).get("servers", {}).get("zephyr-mcp", {})
             if "env" not in mcp_server:
@@ -88,11 +137,9 @@ class MCPEnvManager:
             )
 
             backup_file = self.mcp_config_file.with_suffix(".json.backup")
-            with open(backup_file, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
-
-            with open(self.mcp_config_file, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+            backup_file.write_bytes(original_bytes)
+            self.mcp_config_file.write_bytes(_json_dumps(config))
+            self._config_cache = None
 
             print("✅ 已创建安全配置文件")
             print(f"📁 备份文件: {backup_file}")
@@ -119,8 +166,7 @@ MCP_NAME=ZephyrMcpServer
 """
 
         try:
-            with open(self.env_file, "w", encoding="utf-8") as f:
-                f.write(env_template)
+            self.env_file.write_text(env_template, encoding="utf-8")
 
             print(f"✅ 已创建环境变量模板文件: {self.env_file}")
             return True
@@ -128,64 +174,61 @@ MCP_NAME=ZephyrMcpServer
             print(f"❌ 创建环境变量模板失败: {e}")
             return False
 
-    def _set_windows_user_env(self, name: str, value: str) -> None:
-        script = (
-            '[Environment]::SetEnvironmentVariable('
-            '$env:ZEPHYR_MCP_ENV_NAME, '
-            '$env:ZEPHYR_MCP_ENV_VALUE, '
-            '"User")'
-        )
-        with NamedTemporaryFile("w", suffix=".ps1", delete=False, encoding="utf-8") as tmp:
-            tmp.write(script)
-            script_path = tmp.name
+    def _set_windows_user_env(self, values: Dict[str, str]) -> None:
+        """用一次 PowerShell 调用设置多个用户级环境变量
+
+        变量值通过子进程环境传入，不出现在命令行中，避免特殊字符被解释。
+        """
         env = os.environ.copy()
-        env["ZEPHYR_MCP_ENV_NAME"] = name
-        env["ZEPHYR_MCP_ENV_VALUE"] = value
-        try:
-            subprocess.run(
-                ["powershell", "-NoProfile", "-File", script_path],
-                check=True,
-                capture_output=True,
-                text=True,
-                env=env,
+        statements = []
+        for index, (name, value) in enumerate(values.items()):
+            if not name.isidentifier():
+                raise ValueError(f"无效的环境变量名: {name}")
+            env[f"ZEPHYR_MCP_ENV_VALUE_{index}"] = value
+            statements.append(
+                f"[Environment]::SetEnvironmentVariable('{name}', "
+                f"$env:ZEPHYR_MCP_ENV_VALUE_{index}, 'User')"
             )
-        finally:
-            env.pop("ZEPHYR_MCP_ENV_NAME", None)
-            env.pop("ZEPHYR_MCP_ENV_VALUE", None)
-            try:
-                os.remove(script_path)
-            except OSError:
-                pass
-
-    def _append_shell_export(self, shell_rc: Path, name: str, value: str) -> None:
+        subprocess.run(
+            [
+                "powershell",
+                "-NoProfile",
+                "-NonInteractive",
+                "-Command",
+                "; ".join(statements),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+
+    @staticmethod
+    def _format_shell_export(name: str, value: str) -> str:
         escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-        with open(shell_rc, "a", encoding="utf-8") as f:
-            f.write(f'export {name}="{escaped}"\n')
+        return f'export {name}="{escaped}"\n'
+
+    def _write_shell_exports(self, shell_rc: Path, values: Dict[str, str]) -> bool:
+        """在 shell 配置文件中写入导出语句，替换之前写入的同名语句
+
+        返回文件内容是否发生变化。
+        """
+        text = shell_rc.read_text(encoding="utf-8") if shell_rc.exists() else ""
+        kept = _SHELL_BLOCK_RE.sub("", text).rstrip("\n")
+        block = _SHELL_BLOCK_HEADER + "\n" + "".join(
+            self._format_shell_export(name, value) for name, value in values.items()
+        )
+        new_text = f"{kept}\n\n{block}" if kept else block
+        if new_text == text:
+            return False
+        with open(shell_rc, "w", encoding="utf-8", buffering=IO_BUFSIZE) as f:
+            f.write(new_text)
+        return True
 
     def set_system_env_vars(self, username: str, password: str) -> bool:
         """设置系统环境变量"""
         try:
-            system = platform.system()
-
-            if system == "Windows":
-                self._set_windows_user_env("GIT_USERNAME", username)
-                self._set_windows_user_env("GIT_PASSWORD", password)
-                print("✅ Windows 系统环境变量设置完成")
-                print("💡 请重启 VS Code 使环境变量生效")
-            else:
-                home = Path.home()
-                shell_rc = home / ".bashrc"
-                if not shell_rc.exists():
-                    shell_rc = home / ".zshrc"
-
-                with open(shell_rc, "a", encoding="utf-8") as f:
-                    f.write("\n# Zephyr MCP 环境变量\n")
-                self._append_shell_export(shell_rc, "GIT_USERNAME", username)
-                self._append_shell_export(shell_rc, "GIT_PASSWORD", password)
-
-                print(f"✅ {system} 系统环境变量已添加到 {shell_rc}")
-                print("💡 请运行 'source ~/.bashrc' 或重启终端使环境变量生效")
-
+            _SET_ENV_IMPL(self, {"GIT_USERNAME": username, "GIT_PASSWORD": password})
             return True
         except Exception as e:
             print(f"❌ 设置系统环境变量失败: {e}")
@@ -237,6 +280,31 @@ MCP_NAME=ZephyrMcpServer
 
 
 
+def _set_env_windows(manager: MCPEnvManager, values: Dict[str, str]) -> None:
+    """Windows: 写入用户级环境变量"""
+    manager._set_windows_user_env(values)
+    print("✅ Windows 系统环境变量设置完成")
+    print("💡 请重启 VS Code 使环境变量生效")
+
+
+def _set_env_posix(manager: MCPEnvManager, values: Dict[str, str]) -> None:
+    """Linux/macOS: 写入 shell 配置文件"""
+    home = Path.home()
+    shell_rc = home / ".bashrc"
+    if not shell_rc.exists():
+        shell_rc = home / ".zshrc"
+
+    manager._write_shell_exports(shell_rc, values)
+
+    print(f"✅ {_SYSTEM} 系统环境变量已添加到 {shell_rc}")
+    print("💡 请运行 'source ~/.bashrc' 或重启终端使环境变量生效")
+
+
+# 平台在导入时确定一次，set_system_env_vars 直接调用对应实现
+_SYSTEM = platform.system()
+_SET_ENV_IMPL = _set_env_windows if _SYSTEM == "Windows" else _set_env_posix
+
+
 def main():
     """主函数"""
     manager = MCPEnvManager()
@@ -5,22 +5,105 @@
 处理配置文件的加载、验证和管理 / Handle configuration file loading, validation and management
 """
 
+import copy
 import json
 import os
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, Tuple
+
+# orjson可用时使用它解析/序列化JSON，否则回退到标准库
+# Use orjson for JSON parsing/serialisation when available, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 导入语言资源
-from src.utils.language_resources import get_text
+from src.utils.language_resources import get_text, get_texts, get_current_language
+
+# 配置/环境文件读写使用的缓冲区大小 (128 KiB)
+# Buffer size used for config/env file I/O (128 KiB)
+IO_BUFSIZE = 1 << 17
+
+# 已解析配置的缓存，键为绝对路径，值为 (文件戳, 补全后的配置)
+# Cache of parsed configs keyed by absolute path: (file stamp, completed config)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int, str], Dict[str, Any]]] = {}
+_CONFIG_CACHE_MAXSIZE = 8
+
+# 区分"键不存在"与值为None的哨兵 / Sentinel distinguishing a missing key from a None value
+_MISSING = object()
+
+# 合法的日志级别和导出器 / Valid log levels and exporters
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_EXPORTERS = frozenset({"console", "otlp"})
+
+# 按语言缓存的默认配置模板 / Default config templates cached per language
+_DEFAULTS_BY_LANGUAGE: Dict[str, Dict[str, Any]] = {}
+
+
+def _json_loads(data: bytes) -> Any:
+    """解析JSON字节串 / Parse JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """将对象序列化为缩进2格的UTF-8 JSON / Serialise to 2-space indented UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _intern_keys(obj: Any) -> Any:
+    """
+    递归驻留字典中的字符串键 / Recursively intern the string keys of dicts
+
+    JSON解析出的键不是驻留字符串；驻留后与代码中的字面量键查找时可直接按指针命中。
+    Keys decoded from JSON are not interned; once interned, lookups with literal keys in
+    the code match by pointer.
+    """
+    if isinstance(obj, dict):
+        return {
+            (sys.intern(key) if type(key) is str else key): _intern_keys(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_intern_keys(item) for item in obj]
+    return obj
 
 
 def load_config(config_path: str = "config.json") -> Dict[str, Any]:
-    """加载配置文件 / Load configuration file"""
+    """
+    加载配置文件 / Load configuration file
+
+    以 (路径, mtime, 大小, 当前语言) 为键缓存补全后的配置，文件未变化时不再重新解析。
+    返回深拷贝，调用方可以安全地修改结果。
+    The completed config is cached keyed on (path, mtime, size, current language),
+    so an unchanged file is not re-parsed. A deep copy is returned so callers may
+    mutate the result.
+    """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        path = os.path.abspath(config_path)
+        st = os.stat(path)
+        # 补全时的默认文本取决于当前语言 / Completion defaults depend on the current language
+        stamp = (st.st_mtime_ns, st.st_size, get_current_language())
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+
+        with open(path, 'rb', buffering=IO_BUFSIZE) as f:
+            config = _intern_keys(_json_loads(f.read()))
         
         # 验证和补充配置
-        return validate_and_complete_config(config)
+        config = validate_and_complete_config(config)
+
+        _CONFIG_CACHE.pop(path, None)
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAXSIZE:
+            # 淘汰最早加入的条目 / Evict the oldest entry
+            _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)))
+        _CONFIG_CACHE[path] = (stamp, config)
+        return copy.deepcopy(config)
         
     except Exception as e:
         print(get_text("config_load_error", str(e)))
@@ -28,73 +111,42 @@ def load_config(config_path: str = "config.json") -> Dict[str, Any]:
         return get_default_config()
 
 
+def _defaults() -> Dict[str, Any]:
+    """
+    获取当前语言的默认配置模板，每种语言只构建一次 / Default config template for the current language, built once per language
+
+    返回的模板是共享的，调用方不得修改 / The returned template is shared and must not be mutated
+    """
+    language = get_current_language()
+    defaults = _DEFAULTS_BY_LANGUAGE.get(language)
+    if defaults is None:
+        defaults = _DEFAULTS_BY_LANGUAGE[language] = get_default_config()
+    return defaults
+
+
 def validate_and_complete_config(config: Dict[str, Any]) -> Dict[str, Any]:
-    """验证和补充配置 / Validate and complete configuration"""
-    # 确保必需字段存在 / Ensure required fields exist
-    if "agent_name" not in config:
-        config["agent_name"] = get_text("agent_name")
-    
-    if "version" not in config:
-        config["version"] = "1.0.0"
-    
-    if "description" not in config:
-        config["description"] = get_text("agent_description")
-    
-    # 确保工具目录配置 / Ensure tool directory configuration
-    if "tools_directory" not in config:
-        config["tools_directory"] = "./src/tools"
-    
-    if "utils_directory" not in config:
-        config["utils_directory"] = "./src/utils"
-    
-    # 确保日志级别配置 / Ensure log level configuration
-    if "log_level" not in config:
-        config["log_level"] = "INFO"
-    
-    # 确保语言配置 / Ensure language configuration
-    if "language" not in config:
-        config["language"] = {
-            "default": "zh",
-            "available": ["zh", "en"],
-            "auto_detect": True
-        }
-    
-    # 确保OpenTelemetry配置 / Ensure OpenTelemetry configuration
-    if "opentelemetry" not in config:
-        config["opentelemetry"] = get_default_opentelemetry_config()
-    
-    # 确保服务器配置 / Ensure server configuration
-    if "port" not in config:
-        config["port"] = 8001
-    
-    if "host" not in config:
-        config["host"] = "localhost"
-    
-    # 确保LLM配置 / Ensure LLM configuration
-    if "llm" not in config:
-        config["llm"] = {
-            "enabled": False,
-            "providers": {
-                "openai": {
-                    "api_key": "",
-                    "model": "gpt-3.5-turbo"
-                },
-                "anthropic": {
-                    "api_key": "",
-                    "model": "claude-3-sonnet-20240229"
-                }
-            }
-        }
-    
-    return config
+    """
+    验证和补充配置 / Validate and complete configuration
+
+    返回补全了缺失顶层字段的新字典，不修改传入的配置。
+    Returns a new dict with missing top-level fields filled in; the input is not mutated.
+    """
+    completed = dict(config)
+    for key, value in _defaults().items():
+        if key not in completed:
+            # 复制默认值，避免调用方修改共享模板 / Copy so callers cannot mutate the shared template
+            completed[key] = copy.deepcopy(value)
+    return completed
 
 
 def get_default_config() -> Dict[str, Any]:
     """获取默认配置 / Get default configuration"""
+    # 一次取出所需的本地化文本 / Fetch all localised strings in one lookup
+    texts = get_texts(("agent_name", "agent_description"))
     return {
-        "agent_name": get_text("agent_name"),
+        "agent_name": texts["agent_name"],
         "version": "1.0.0",
-        "description": get_text("agent_description"),
+        "description": texts["agent_description"],
         "tools_directory": "./src/tools",
         "utils_directory": "./src/utils",
         "log_level": "INFO",
@@ -103,9 +155,10 @@ def get_default_config() -> Dict[str, Any]:
             "available": ["zh", "en"],
             "auto_detect": True
         },
-        "opentelemetry": get_default_opentelemetry_config(),
+        "opentelemetry": get_default_opentelemetry_config(texts["agent_name"]),
         "port": 8001,
         "host": "localhost",
+        "http_backend": "threading",  # threading, aiohttp / 线程服务器, aiohttp
         "llm": {
             "enabled": False,
             "providers": {
@@ -122,12 +175,20 @@ def get_default_config() -> Dict[str, Any]:
     }
 
 
-def get_default_opentelemetry_config() -> Dict[str, Any]:
-    """获取默认的OpenTelemetry配置 / Get default OpenTelemetry configuration"""
+def get_default_opentelemetry_config(service_name: str = None) -> Dict[str, Any]:
+    """
+    获取默认的OpenTelemetry配置 / Get default OpenTelemetry configuration
+
+    参数 / Parameters:
+    - service_name: 服务名，未提供时使用本地化的agent名称 / Service name, defaults to the localised agent name
+    """
+    if service_name is None:
+        service_name = get_text("agent_name")
     return {
         "enabled": False,
-        "service_name": get_text("agent_name"),
+        "service_name": service_name,
         "exporter": "console",  # console, otlp / 控制台, OTLP
+        "processor": "batch",  # batch, simple / 批量导出, 同步导出（调试用）
         "otlp_endpoint": "http://localhost:4318/v1/traces",
         "sampler": "always_on",
         "headers": {},  # OTLP导出器的自定义头部 / Custom headers for OTLP exporter
@@ -138,25 +199,33 @@ def get_default_opentelemetry_config() -> Dict[str, Any]:
 
 def save_config(config: Dict[str, Any], config_path: str = "config.json") -> bool:
     """保存配置到文件 / Save configuration to file"""
+    tmp_path = config_path + '.tmp'
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        data = _json_dumps(config)
+        # 先写临时文件再原子替换，写入中断时保留原配置 / Write a temp file then replace atomically, an interrupted write keeps the old config
+        with open(tmp_path, 'wb', buffering=IO_BUFSIZE) as f:
+            f.write(data)
+        os.replace(tmp_path, config_path)
+        # mtime精度较粗时文件戳可能不变，显式失效缓存 / Stamp may not change on coarse mtime filesystems
+        _CONFIG_CACHE.pop(os.path.abspath(config_path), None)
         return True
     except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         print(get_text("config_save_error", str(e)))
         return False
 
 
 def get_config_value(config: Dict[str, Any], key_path: str, default: Any = None) -> Any:
     """通过路径获取配置值 / Get configuration value by path"""
-    keys = key_path.split('.')
     current = config
     
-    # 遍历路径键 / Traverse path keys
-    for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
+    # 遍历路径键，每层只做一次查找 / Traverse path keys with one lookup per level
+    for key in key_path.split('.'):
+        if not isinstance(current, dict):
+            return default
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
             return default
     
     return current
@@ -164,17 +233,18 @@ def get_config_value(config: Dict[str, Any], key_path: str, default: Any = None)
 
 def set_config_value(config: Dict[str, Any], key_path: str, value: Any) -> bool:
     """通过路径设置配置值 / Set configuration value by path"""
-    keys = key_path.split('.')
+    *parents, last = key_path.split('.')
     current = config
     
-    # 遍历到最后一个键的父级 / Traverse to the parent of the last key
-    for key in keys[:-1]:
-        if key not in current or not isinstance(current[key], dict):
-            current[key] = {}
-        current = current[key]
+    # 遍历到最后一个键的父级，非字典节点替换为空字典 / Traverse to the parent of the last key, replacing non-dict nodes
+    for key in parents:
+        node = current.get(key)
+        if not isinstance(node, dict):
+            node = current[key] = {}
+        current = node
     
     # 设置最终值 / Set the final value
-    current[keys[-1]] = value
+    current[last] = value
     return True
 
 
@@ -195,9 +265,8 @@ def validate_config(config: Dict[str, Any]) -> Dict[str, Any]:
         errors.append("port must be an integer between 1 and 65535")
     
     # 验证日志级别 / Validate log level
-    valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-    if config.get("log_level") not in valid_log_levels:
-        errors.append(f"log_level must be one of {valid_log_levels}")
+    if config.get("log_level") not in _VALID_LOG_LEVELS:
+        errors.append(f"log_level must be one of {sorted(_VALID_LOG_LEVELS)}")
     
     # 验证语言配置 / Validate language configuration
     language_config = config.get("language", {})
@@ -207,7 +276,7 @@ def validate_config(config: Dict[str, Any]) -> Dict[str, Any]:
     # 验证OpenTelemetry配置 / Validate OpenTelemetry configuration
     otel_config = config.get("opentelemetry", {})
     if otel_config.get("enabled", False):
-        if otel_config.get("exporter") not in ["console", "otlp"]:
+        if otel_config.get("exporter") not in _VALID_EXPORTERS:
             errors.append("opentelemetry.exporter must be 'console' or 'otlp'")
     
     return {
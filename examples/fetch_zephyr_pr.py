@@ -4,8 +4,11 @@
 import os
 import sys
 
-# 添加src目录到Python路径
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# 添加src目录到Python路径（已存在时不重复添加）
+SCRIPT_DIR = os.path.dirname(__file__)
+SRC_DIR = os.path.join(SCRIPT_DIR, 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 try:
     # 导入内部函数，因为公共工具函数需要通过MCP服务器调用
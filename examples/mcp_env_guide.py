@@ -6,65 +6,72 @@ MCP 环境变量获取指南
 
 import os
 
+# 指南全文，格式化一次后用单次 print 输出
+_GUIDE_TEMPLATE = """=== MCP 环境变量配置指南 ===
+
+1. 当前环境变量状态:
+   GIT_USERNAME: {git_username}
+   GIT_PASSWORD: {git_password_mask}
+
+2. 环境变量获取逻辑:
+   在 west_init_interactive 函数中:
+   - 当 username 参数为 None 时
+   - 系统会自动从环境变量获取:
+     username = os.environ.get('GIT_USERNAME', 'None')
+     token = os.environ.get('GIT_PASSWORD', 'None')
+
+3. 认证方法 (auth_method):
+   - embedded: 将凭据嵌入URL中
+   - env: 使用环境变量认证
+   - config: 使用Git配置认证
+
+4. 设置环境变量方法:
+
+   Windows PowerShell:
+   # 临时设置（当前会话有效）
+   $env:GIT_USERNAME = 'your_username'
+   $env:GIT_PASSWORD = 'your_token'
+
+   # 永久设置（用户级别）
+   [Environment]::SetEnvironmentVariable('GIT_USERNAME', 'your_username', 'User')
+   [Environment]::SetEnvironmentVariable('GIT_PASSWORD', 'your_token', 'User')
+
+   Windows CMD:
+   # 临时设置
+   set GIT_USERNAME=your_username
+   set GIT_PASSWORD=your_token
+
+   Linux/Mac:
+   # 临时设置
+   export GIT_USERNAME='your_username'
+   export GIT_PASSWORD='your_token'
+
+   # 永久设置（添加到 ~/.bashrc 或 ~/.zshrc）
+   echo 'export GIT_USERNAME="your_username"' >> ~/.bashrc
+   echo 'export GIT_PASSWORD="your_token"' >> ~/.bashrc
+   source ~/.bashrc
+
+5. 使用示例:
+   # 在 Python 中设置
+   os.environ['GIT_USERNAME'] = 'your_username'
+   os.environ['GIT_PASSWORD'] = 'your_token'
+
+6. 验证设置:
+   # 检查是否设置成功
+   python -c "import os; print(os.environ.get('GIT_USERNAME'))"
+
+=== 指南完成 ==="""
+
 def show_env_variables():
     """显示当前环境变量设置"""
-    print("=== MCP 环境变量配置指南 ===\n")
-    
     # 检查当前环境变量
     git_username = os.environ.get("GIT_USERNAME", "未设置")
     git_password = os.environ.get("GIT_PASSWORD", "未设置")
-    
-    print("1. 当前环境变量状态:")
-    print(f"   GIT_USERNAME: {git_username}")
-    print(f"   GIT_PASSWORD: {'*' * len(git_password) if git_password != '未设置' else '未设置'}")
-    
-    print("\n2. 环境变量获取逻辑:")
-    print("   在 west_init_interactive 函数中:")
-    print("   - 当 username 参数为 None 时")
-    print("   - 系统会自动从环境变量获取:")
-    print("     username = os.environ.get('GIT_USERNAME', 'None')")
-    print("     token = os.environ.get('GIT_PASSWORD', 'None')")
-    
-    print("\n3. 认证方法 (auth_method):")
-    print("   - embedded: 将凭据嵌入URL中")
-    print("   - env: 使用环境变量认证")
-    print("   - config: 使用Git配置认证")
-    
-    print("\n4. 设置环境变量方法:")
-    print("\n   Windows PowerShell:")
-    print("   # 临时设置（当前会话有效）")
-    print("   $env:GIT_USERNAME = 'your_username'")
-    print("   $env:GIT_PASSWORD = 'your_token'")
-    
-    print("\n   # 永久设置（用户级别）")
-    print("   [Environment]::SetEnvironmentVariable('GIT_USERNAME', 'your_username', 'User')")
-    print("   [Environment]::SetEnvironmentVariable('GIT_PASSWORD', 'your_token', 'User')")
-    
-    print("\n   Windows CMD:")
-    print("   # 临时设置")
-    print("   set GIT_USERNAME=your_username")
-    print("   set GIT_PASSWORD=your_token")
-    
-    print("\n   Linux/Mac:")
-    print("   # 临时设置")
-    print("   export GIT_USERNAME='your_username'")
-    print("   export GIT_PASSWORD='your_token'")
-    
-    print("\n   # 永久设置（添加到 ~/.bashrc 或 ~/.zshrc）")
-    print("   echo 'export GIT_USERNAME=\"your_username\"' >> ~/.bashrc")
-    print("   echo 'export GIT_PASSWORD=\"your_token\"' >> ~/.bashrc")
-    print("   source ~/.bashrc")
-    
-    print("\n5. 使用示例:")
-    print("   # 在 Python 中设置")
-    print("   os.environ['GIT_USERNAME'] = 'your_username'")
-    print("   os.environ['GIT_PASSWORD'] = 'your_token'")
-    
-    print("\n6. 验证设置:")
-    print("   # 检查是否设置成功")
-    print("   python -c \"import os; print(os.environ.get('GIT_USERNAME'))\"")
-    
-    print("\n=== 指南完成 ===")
+
+    print(_GUIDE_TEMPLATE.format(
+        git_username=git_username,
+        git_password_mask='*' * len(git_password) if git_password != '未设置' else '未设置',
+    ))
 
 def demo_env_usage():
     """演示环境变量的使用"""
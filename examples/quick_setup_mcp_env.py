@@ -9,6 +9,11 @@ import platform
 import subprocess
 from pathlib import Path
 
+
+def _dump_json(obj) -> bytes:
+    """序列化为缩进4格的UTF-8 JSON（orjson只支持2格缩进，这里保持原有格式）"""
+    return json.dumps(obj, indent=4, ensure_ascii=False).encode('utf-8')
+
 def quick_setup():
     """快速设置环境变量"""
     print("🚀 Zephyr MCP 环境变量快速设置")
@@ -50,16 +55,16 @@ def quick_setup():
     
     if system == "Windows":
         try:
-            # 设置用户环境变量
-            subprocess.run([
-                'powershell', '-Command',
-                f'[Environment]::SetEnvironmentVariable("GIT_USERNAME", "{username}", "User")'
-            ], check=True)
-            
-            subprocess.run([
-                'powershell', '-Command',
-                f'[Environment]::SetEnvironmentVariable("GIT_PASSWORD", "{password}", "User")'
-            ], check=True)
+            # 一次PowerShell调用设置两个用户环境变量
+            # 取值通过子进程环境传入，不拼接进命令，含 " 或 $ 的密码也不会被解释
+            env = dict(os.environ,
+                       ZEPHYR_MCP_SETUP_USERNAME=username,
+                       ZEPHYR_MCP_SETUP_PASSWORD=password)
+            env_cmd = (
+                '[Environment]::SetEnvironmentVariable("GIT_USERNAME", $env:ZEPHYR_MCP_SETUP_USERNAME, "User"); '
+                '[Environment]::SetEnvironmentVariable("GIT_PASSWORD", $env:ZEPHYR_MCP_SETUP_PASSWORD, "User")'
+            )
+            subprocess.run(['powershell', '-NoProfile', '-Command', env_cmd], env=env, check=True)
             
             print("✅ Windows 环境变量设置完成")
             print("💡 请重启 VS Code 使设置生效")
@@ -98,9 +103,9 @@ def quick_setup():
     
     if mcp_config_file.exists():
         try:
-            # 读取当前配置
-            with open(mcp_config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            # 读取当前配置，保留原始文本用于备份
+            original_text = mcp_config_file.read_text(encoding='utf-8')
+            config = json.loads(original_text)
             
             # 更新为安全配置
             mcp_server = config.get('mcp', {}).get('servers', {}).get('zephyr-mcp', {})
@@ -113,14 +118,12 @@ def quick_setup():
                 'GIT_PASSWORD': '${env:GIT_PASSWORD}'
             })
             
-            # 备份原文件
+            # 备份原文件：直接写入修改前的原始文本，无需再次序列化
             backup_file = mcp_config_file.with_suffix('.json.backup')
-            with open(backup_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+            backup_file.write_text(original_text, encoding='utf-8')
             
-            # 写入新配置
-            with open(mcp_config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+            # 写入新配置，一次序列化一次写入
+            mcp_config_file.write_bytes(_dump_json(config))
             
             print("✅ 安全配置创建完成")
             print(f"📁 备份文件: {backup_file}")
@@ -5,14 +5,16 @@ West init 演示脚本
 """
 
 import os
+import shlex
 import subprocess
 import sys
 
 def run_command(cmd, cwd=None):
-    """运行命令并返回结果"""
+    """运行命令并返回结果，cmd 可以是字符串或参数列表"""
     print(f"运行命令: {cmd}")
+    argv = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
     try:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
+        result = subprocess.run(argv, shell=False, cwd=cwd, capture_output=True, text=True)
         print(f"退出码: {result.returncode}")
         if result.stdout:
             print(f"输出:\n{result.stdout}")
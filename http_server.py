@@ -5,104 +5,404 @@ HTTP服务器模块 / HTTP Server Module
 处理JSON-RPC HTTP接口和请求处理 / Handle JSON-RPC HTTP interface and request processing
 """
 
+import asyncio
+import email.utils
+import functools
+import hashlib
 import http.server
-import socketserver
 import json
-import subprocess
 import os
-import sys
 import uuid
-import traceback
 import urllib.parse
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import time
 
+# orjson可用时使用它解析/序列化JSON，否则回退到标准库
+# Use orjson for JSON parsing/serialisation when available, stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 可选的aiohttp后端，配置 "http_backend": "aiohttp" 时使用
+# Optional aiohttp backend, used when the config sets "http_backend": "aiohttp"
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
 # 导入OpenTelemetry集成 / Import OpenTelemetry integration
-from opentelemetry_integration import OpenTelemetryManager
+from opentelemetry_integration import OpenTelemetryManager, shutdown_opentelemetry
+from language_manager import detect_language
 from src.utils.logging_utils import (
     capture_debug_logs,
     get_logger,
-    print_to_logger,
+    redirect_print_to_logger,
     redirect_stdio_to_logger,
 )
 
+# 请求体大小上限及分块读取大小 / Request body size cap and chunked read size
+MAX_BODY_BYTES = 16 * 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+# 超过该大小的响应以分块传输编码发送 / Responses larger than this are sent with chunked transfer encoding
+STREAM_THRESHOLD = 1024 * 1024
+WRITE_CHUNK_SIZE = 64 * 1024
+
+
+def _json_loads(data: bytes) -> Any:
+    """解析JSON请求体 / Parse a JSON request body"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """序列化为UTF-8编码的JSON / Serialise to UTF-8 encoded JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode('utf-8')
+
+
+# 可缓存GET响应的Cache-Control值 / Cache-Control value of cacheable GET responses
+_CACHE_CONTROL = 'public, max-age=60'
+
+
+def _encode_cached(response: Dict[str, Any]) -> Tuple[bytes, str, bytes]:
+    """编码响应并计算ETag和缓存头 / Encode a response and compute its ETag and cache headers"""
+    body = _json_dumps(response)
+    etag = '"%s"' % hashlib.sha1(body).hexdigest()
+    headers = b'Cache-Control: %s\r\nETag: %s\r\n' % (_CACHE_CONTROL.encode('ascii'), etag.encode('ascii'))
+    return body, etag, headers
+
+
+def _cached_json_parts(cached: Tuple[bytes, str, bytes],
+                       if_none_match: Optional[str]) -> Tuple[int, bytes, Dict[str, str]]:
+    """按If-None-Match选择缓存响应的 (状态码, 响应体, 头部) / Pick (status, body, headers) of a cached response from If-None-Match"""
+    body, etag, _ = cached
+    if if_none_match == etag:
+        return 304, b'', {'ETag': etag}
+    return 200, body, {'Cache-Control': _CACHE_CONTROL, 'ETag': etag}
+
+
+# 路由表：路径 -> span endpoint名，两种后端共用 / Route tables: path -> span endpoint name, shared by both backends
+GET_ROUTES = {
+    "/api/tools": "api_tools",
+    "/api/docs": "api_docs",
+    "/api/tool/info": "api_tool_info",
+}
+POST_ROUTES = {
+    "/api/tool": "api_tool",
+    "/api/ai_assistant": "api_ai_assistant",
+}
+
+
+def _match_route(routes: Dict[str, str], path: str) -> Optional[str]:
+    """查找路径对应的endpoint名，未匹配时返回None / Look up the endpoint name for a path, None when unmatched"""
+    endpoint = routes.get(path)
+    if endpoint is None and path.startswith("/api/tool/info"):
+        # 兼容 /api/tool/info 的前缀匹配 / Keep prefix matching for /api/tool/info
+        endpoint = routes.get("/api/tool/info")
+    return endpoint
+
+
+# 200 JSON响应的固定状态行和头部，模块加载时拼好 / Fixed status line and headers of a 200 JSON response, assembled at import
+_OK_JSON_PRELUDE = (
+    b'HTTP/1.1 200 OK\r\n'
+    b'Server: %s %s\r\n'
+    b'Content-Type: application/json\r\n'
+) % (http.server.BaseHTTPRequestHandler.server_version.encode('ascii'),
+     http.server.BaseHTTPRequestHandler.sys_version.encode('ascii'))
+
+# (秒, Date头)，同一秒内的响应复用 / (second, Date header), reused by responses within the same second
+_date_cache: Tuple[int, bytes] = (0, b'')
+
+
+def _date_header() -> bytes:
+    """返回当前的Date头，每秒格式化一次 / Return the current Date header, formatted once per second"""
+    global _date_cache
+    now = int(time.time())
+    second, header = _date_cache
+    if second != now:
+        header = b'Date: %s\r\n' % email.utils.formatdate(now, usegmt=True).encode('ascii')
+        _date_cache = (now, header)
+    return header
+
+
+# 参数名包含这些片段时在调试输出中隐藏其值 / Parameter values whose names contain these parts are masked in debug output
+_SECRET_KEY_PARTS = ("password", "passwd", "token", "secret", "apikey", "api_key", "pat", "private_key")
+
+
+def _mask_params(d: Dict[str, Any]) -> Dict[str, Any]:
+    """隐藏敏感参数值 / Mask sensitive parameter values"""
+    masked: Dict[str, Any] = {}
+    for k, v in d.items():
+        key = str(k).lower()
+        if any(s in key for s in _SECRET_KEY_PARTS):
+            masked[k] = "<redacted>"
+        else:
+            masked[k] = v
+    return masked
+
+
+def _request_language(accept_language: str, default: str) -> str:
+    """根据Accept-Language头选择响应语言 / Pick the response language from an Accept-Language header"""
+    # 与language_manager共用同一个带缓存、按q值选择的解析器 / Shares language_manager's cached, q-aware parser
+    return detect_language(accept_language, default)
+
+
+def _check_request_params(agent, tool_name: str, params: Dict[str, Any],
+                          registered_tools: Dict[str, Any]) -> Optional[Tuple[int, str]]:
+    """验证请求参数，失败时返回 (状态码, 错误信息) / Validate request parameters, return (status, message) on failure"""
+    get_text = agent.get_text
+    tool_info = registered_tools.get(tool_name)
+    if tool_info is None:
+        return 404, get_text('tool_not_found', tool_name)
+    
+    # 工具模块注册的参数验证器 / Parameter validator registered by the tool module
+    validator = tool_info.get('validator')
+    if validator is not None:
+        message = validator(params, get_text)
+        if message:
+            return 400, message
+    
+    agent.logger.info(get_text('tool_params_valid', tool_name))
+    return None
+
+
+def _invoke_tool(agent, tool_name: str, tool_func, params: Dict[str, Any],
+                 trace_id: str, debug: List[str]) -> Dict[str, Any]:
+    """执行工具并返回附带调试信息的结果 / Run a tool and return its result with debug output attached"""
+    # 记录工具调用，包含trace_id / Log tool call, including trace_id
+    agent.logger.info(f"[{trace_id}] 执行工具: {tool_name}，参数: {params}")
+
+    debug.append(f"INFO http_server: Invoking tool {tool_name}")
+    debug.append(f"INFO http_server: Params: {_mask_params(params)}")
+    started = time.time()
+    
+    # 执行工具函数 / Execute tool function
+    # print和stdio重定向只作用于当前线程的上下文，并发请求互不干扰
+    # The print/stdio redirects are context-local, so concurrent requests do not interfere
+    with capture_debug_logs(debug):
+        tool_logger = get_logger(f"tools.{tool_name}")
+        strict_stdio = os.getenv("ZEPHYR_MCP_STRICT_STDIO", "1") != "0"
+        debug.append(f"INFO http_server: Strict stdio={strict_stdio}")
+
+        with redirect_print_to_logger(tool_logger):
+            with redirect_stdio_to_logger(tool_logger, strict=strict_stdio):
+                result = tool_func(**params)
+
+    debug.append(f"INFO http_server: Finished in {round(time.time() - started, 3)}s")
+
+    # Ensure debug is visible to caller (and merge if tool already returns debug)
+    if isinstance(result, dict):
+        existing = result.get("debug")
+        if isinstance(existing, list):
+            merged: List[Any] = []
+            seen: set[str] = set()
+            for item in existing + debug:
+                key = str(item)
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append(item)
+            result["debug"] = merged
+        else:
+            result["debug"] = debug
+    else:
+        result = {"status": "success", "result": result, "debug": debug}
+    return result
+
+
+def _tools_payload(agent) -> Dict[str, Any]:
+    """构建/api/tools响应 / Build the /api/tools response"""
+    # 工具摘要由注册表预先构建 / Tool summaries are prebuilt by the registry
+    tools_info = agent.tool_registry.get_tools_info()
+    return {
+        "tools": tools_info,
+        "total": len(tools_info),
+        "llm_integration": agent.config.get("llm", {}).get("enabled", False)
+    }
+
+
+def _tool_info_payload(tool_name: str, tool_info: Dict[str, Any]) -> Dict[str, Any]:
+    """构建/api/tool/info响应 / Build the /api/tool/info response"""
+    return {
+        "name": tool_name,
+        "description": tool_info.get('description', ''),
+        "parameters": tool_info.get('parameters', []),
+        "returns": tool_info.get('returns', []),
+        "module": tool_info.get('module', '')
+    }
+
+
+def _docs_payload(agent, host: str, port: int, current_language: str) -> Dict[str, Any]:
+    """构建/api/docs响应 / Build the /api/docs response"""
+    get_text = agent.get_text
+    
+    # 基础API端点 / Basic API endpoints
+    endpoints = [
+        {
+            "url": "/api/tools",
+            "method": "GET",
+            "description": get_text('api_docs_get_tools'),
+            "response_format": {
+                "tools": get_text('api_docs_tools_list'),
+                "total": get_text('api_docs_total_tools'),
+                "llm_integration": get_text('api_docs_llm_integration')
+            },
+            "example": f"curl -X GET http://{host}:{port}/api/tools"
+        },
+        {
+            "url": "/api/tool/info",
+            "method": "GET",
+            "description": get_text('api_docs_get_tool_info'),
+            "parameters": [
+                {"name": "name", "type": "query", "description": get_text('api_docs_tool_name'), "required": True}
+            ],
+            "response_format": {
+                "name": get_text('api_docs_tool_name'),
+                "description": get_text('api_docs_tool_description'),
+                "parameters": get_text('api_docs_parameters_list'),
+                "returns": get_text('api_docs_returns_list'),
+                "module": get_text('api_docs_tool_module')
+            },
+            "example": f"curl -X GET http://{host}:{port}/api/tool/info?name=test_git_connection"
+        },
+        {
+            "url": "/api/tool",
+            "method": "POST",
+            "description": get_text('api_docs_execute_tool'),
+            "request_format": {
+                "tool": get_text('api_docs_tool_name'),
+                "params": get_text('api_docs_tool_params')
+            },
+            "response_format": {
+                "success": get_text('api_docs_success'),
+                "result": get_text('api_docs_execution_result'),
+                "error": get_text('api_docs_error_info'),
+                "tool": get_text('api_docs_called_tool')
+            },
+            "example": f"curl -X POST http://{host}:{port}/api/tool -H 'Content-Type: application/json' -d '{{\"tool\":\"test_git_connection\",\"params\":{{\"url\":\"https://github.com/zephyrproject-rtos/zephyr\"}}}}'"
+        }
+    ]
+    
+    # 如果启用了LLM集成，添加AI助手端点 / If LLM integration is enabled, add AI assistant endpoint
+    if agent.config.get("llm", {}).get("enabled", False):
+        endpoints.append({
+            "url": "/api/ai_assistant",
+            "method": "POST",
+            "description": get_text('api_docs_ai_assistant'),
+            "request_format": {
+                "messages": get_text('api_docs_messages_list'),
+                "model": get_text('api_docs_model_name'),
+                "temperature": get_text('api_docs_temperature'),
+                "max_tokens": get_text('api_docs_max_tokens')
+            },
+            "response_format": {
+                "success": get_text('api_docs_success'),
+                "response": get_text('api_docs_ai_response'),
+                "model": get_text('api_docs_used_model'),
+                "usage": get_text('api_docs_token_usage')
+            },
+            "example": f"curl -X POST http://{host}:{port}/api/ai_assistant -H 'Content-Type: application/json' -d '{{\"messages\":[{{\"role\":\"user\",\"content\":\"你好\"}}]}}'"
+        })
+    
+    return {
+        "endpoints": endpoints,
+        "version": agent.config.get("version", "1.0.0"),
+        "agent_name": agent.config.get("agent_name", "Zephyr MCP Agent"),
+        "language": current_language,
+        "supported_languages": ["zh", "en"]
+    }
+
 
 class JSONToolHandler(http.server.BaseHTTPRequestHandler):
     """处理JSON工具请求的HTTP处理器 / HTTP handler for JSON tool requests"""
     
+    # 所有响应都带Content-Length，可以保持连接复用 / Every response carries Content-Length, so connections can be kept alive
+    protocol_version = "HTTP/1.1"
+    # 在setup()中为连接设置TCP_NODELAY，小JSON响应不会被Nagle算法延迟
+    # setup() sets TCP_NODELAY on the connection so small JSON responses are not held back by Nagle
+    disable_nagle_algorithm = True
+    
+    # endpoint名 -> 处理方法名，路由见模块级GET_ROUTES/POST_ROUTES
+    # Endpoint name -> handler method name, routes are the module-level GET_ROUTES/POST_ROUTES
+    HANDLERS = {
+        "api_tools": "_handle_api_tools_request",
+        "api_docs": "_handle_api_docs_request",
+        "api_tool_info": "_handle_api_tool_info_request",
+        "api_tool": "_handle_tool_request",
+        "api_ai_assistant": "_handle_ai_assistant_request",
+    }
+    
+    # 当前请求的trace_id，未生成时为None / Trace id of the current request, None until generated
+    _request_trace_id = None
+    
     def __init__(self, *args, **kwargs):
         self.agent = kwargs.pop('agent', None)
         super().__init__(*args, **kwargs)
     
+    def _trace_id(self) -> str:
+        """获取当前请求的trace_id，未提供时按需生成 / Get the current request's trace_id, generated on demand when not supplied"""
+        trace_id = self._request_trace_id
+        if trace_id is None:
+            trace_id = self._request_trace_id = str(uuid.uuid4())
+        return trace_id
+    
     def _get_request_language(self) -> str:
         """从请求头获取语言设置 / Get language setting from request headers"""
-        accept_language = self.headers.get('Accept-Language', '')
-        if 'zh' in accept_language:
-            return 'zh'
-        elif 'en' in accept_language:
-            return 'en'
-        else:
-            return self.server.agent.current_language
+        return _request_language(self.headers.get('Accept-Language', ''), self.server.agent.current_language)
     
-    def _validate_request_params(self, tool_name: str, params: Dict[str, Any]):
-        """验证请求参数 / Validate request parameters"""
-        # 获取注册的工具信息 / Get registered tool information
-        registered_tools = self.server.agent.tool_registry.get_registered_tools()
-        if tool_name not in registered_tools:
-            self.send_error(404, self.server.agent.get_text('tool_not_found', tool_name))
-            return
-        
-        # 特定工具的参数验证 / Parameter validation for specific tools
-        if tool_name == 'west_flash':
-            if 'build_dir' not in params:
-                self.send_error(400, self.server.agent.get_text('parameter_required', 'west_flash', 'build_dir'))
-                return
-        elif tool_name == 'west_update':
-            if 'project_dir' not in params:
-                self.send_error(400, self.server.agent.get_text('parameter_required', 'west_update', 'project_dir'))
-                return
-        elif tool_name == 'test_git_connection':
-            if 'url' not in params:
-                self.send_error(400, self.server.agent.get_text('missing_required_param', 'url'))
-                return
-            
-            # 验证URL格式 / Validate URL format
-            import re
-            url_pattern = re.compile(r'^(https?|git)://[^\s/$.?#].[^\s]*$')
-            if not url_pattern.match(params['url']):
-                self.send_error(400, self.server.agent.get_text('invalid_param_format', 'URL'))
-                return
-        
-        self.server.agent.logger.info(self.server.agent.get_text('tool_params_valid', tool_name))
+    def _validate_request_params(self, tool_name: str, params: Dict[str, Any],
+                                 registered_tools: Dict[str, Any]) -> bool:
+        """验证请求参数，失败时已发送错误响应 / Validate request parameters, an error response has been sent on failure"""
+        error = _check_request_params(self.server.agent, tool_name, params, registered_tools)
+        if error is not None:
+            self.send_error(*error)
+            return False
+        return True
     
-    def _handle_tool_request(self, trace_id: str, span=None):
+    def _handle_tool_request(self, span=None):
         """处理工具执行请求 / Handle tool execution request"""
+        # 工具响应总是携带trace_id / Tool responses always carry the trace_id
+        trace_id = self._trace_id()
+        agent = self.server.agent
+        get_text = agent.get_text
         content_length = int(self.headers.get('Content-Length', 0))
         if content_length == 0:
-            self.send_error(400, self.server.agent.get_text('missing_request_body'))
+            self.send_error(400, get_text('missing_request_body'))
             if span:
                 span.set_attribute("http.status_code", 400)
                 span.set_attribute("error", True)
                 span.set_attribute("error.message", "Missing request body")
             return
         
-        post_data = self.rfile.read(content_length)
+        if content_length > MAX_BODY_BYTES:
+            # 请求体未读取，不能复用该连接 / The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            self.send_error(413)
+            if span:
+                span.set_attribute("http.status_code", 413)
+                span.set_attribute("error", True)
+                span.set_attribute("error.message", "Request body too large")
+            return
+        
+        # 分块读取，避免单次大块读取 / Read in bounded chunks instead of one large read
+        post_data = bytearray()
+        remaining = content_length
+        while remaining > 0:
+            chunk = self.rfile.read(min(READ_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            post_data += chunk
+            remaining -= len(chunk)
         
         debug: List[str] = []
 
-        def _mask_params(d: Dict[str, Any]) -> Dict[str, Any]:
-            masked: Dict[str, Any] = {}
-            for k, v in d.items():
-                key = str(k).lower()
-                if any(s in key for s in ("password", "passwd", "token", "secret", "apikey", "api_key", "pat", "private_key")):
-                    masked[k] = "<redacted>"
-                else:
-                    masked[k] = v
-            return masked
-
         try:
             # 解析JSON请求 / Parse JSON request
-            request = json.loads(post_data.decode('utf-8'))
+            request = _json_loads(post_data)
             
             # 获取工具名称和参数 / Get tool name and parameters
             tool_name = request.get('tool')
@@ -112,7 +412,7 @@ class JSONToolHandler(http.server.BaseHTTPRequestHandler):
                 span.set_attribute("tool.name", tool_name)
             
             if not tool_name:
-                self.send_error(400, self.server.agent.get_text('missing_tool_name'))
+                self.send_error(400, get_text('missing_tool_name'))
                 if span:
                     span.set_attribute("http.status_code", 400)
                     span.set_attribute("error", True)
@@ -120,9 +420,9 @@ class JSONToolHandler(http.server.BaseHTTPRequestHandler):
                 return
             
             # 获取注册的工具 / Get registered tools
-            registered_tools = self.server.agent.tool_registry.get_registered_tools()
+            registered_tools = self.server.registered_tools
             if tool_name not in registered_tools:
-                self.send_error(404, self.server.agent.get_text('tool_not_found', tool_name))
+                self.send_error(404, get_text('tool_not_found', tool_name))
                 if span:
                     span.set_attribute("http.status_code", 404)
                     span.set_attribute("error", True)
@@ -130,65 +430,16 @@ class JSONToolHandler(http.server.BaseHTTPRequestHandler):
                 return
             
             # 执行参数验证 / Execute parameter validation
-            self._validate_request_params(tool_name, params)
+            if not self._validate_request_params(tool_name, params, registered_tools):
+                if span:
+                    span.set_attribute("http.status_code", 400)
+                    span.set_attribute("error", True)
+                    span.set_attribute("error.message", "Invalid parameters")
+                return
             
             # 执行工具 / Execute tool
-            tool_info = registered_tools[tool_name]
-            tool_func = tool_info['function']
-            
-            # 记录工具调用，包含trace_id / Log tool call, including trace_id
-            self.server.agent.logger.info(f"[{trace_id}] 执行工具: {tool_name}，参数: {params}")
-
-            debug.append(f"INFO http_server: Invoking tool {tool_name}")
-            debug.append(f"INFO http_server: Params: {_mask_params(params)}")
-            started = time.time()
-            
-            # 导入必要的模块并注入到工具函数的全局命名空间 / Import necessary modules and inject into tool function's global namespace
-            tool_func_globals = tool_func.__globals__
-            tool_func_globals['subprocess'] = subprocess
-            tool_func_globals['sys'] = sys
-            tool_func_globals['os'] = __import__('os')
-            tool_func_globals['importlib'] = __import__('importlib')
-            tool_func_globals['traceback'] = traceback
-            
-            # 执行工具函数 / Execute tool function
-            with capture_debug_logs(debug):
-                import builtins
-
-                tool_logger = get_logger(f"tools.{tool_name}")
-                old_print = builtins.print
-                strict_stdio = os.getenv("ZEPHYR_MCP_STRICT_STDIO", "1") != "0"
-                debug.append(f"INFO http_server: Strict stdio={strict_stdio}")
-
-                def tool_print(*args, **kwargs):
-                    return print_to_logger(tool_logger, *args, **kwargs)
-
-                builtins.print = tool_print
-                try:
-                    with redirect_stdio_to_logger(tool_logger, strict=strict_stdio):
-                        result = tool_func(**params)
-                finally:
-                    builtins.print = old_print
-
-            debug.append(f"INFO http_server: Finished in {round(time.time() - started, 3)}s")
-
-            # Ensure debug is visible to caller (and merge if tool already returns debug)
-            if isinstance(result, dict):
-                existing = result.get("debug")
-                if isinstance(existing, list):
-                    merged: List[Any] = []
-                    seen: set[str] = set()
-                    for item in existing + debug:
-                        key = str(item)
-                        if key in seen:
-                            continue
-                        seen.add(key)
-                        merged.append(item)
-                    result["debug"] = merged
-                else:
-                    result["debug"] = debug
-            else:
-                result = {"status": "success", "result": result, "debug": debug}
+            tool_func = registered_tools[tool_name]['function']
+            result = _invoke_tool(agent, tool_name, tool_func, params, trace_id, debug)
             
             # 构造响应 / Construct response
             response = {
@@ -199,22 +450,15 @@ class JSONToolHandler(http.server.BaseHTTPRequestHandler):
             }
             
             # 发送响应 / Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            self._send_json(200, response)
             
         except json.JSONDecodeError:
             # 添加trace_id到错误响应 / Add trace_id to error response
-            self.send_response(400)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('X-Trace-ID', trace_id)
-            self.end_headers()
             error_response = {
-                "error": self.server.agent.get_text('invalid_json'),
+                "error": get_text('invalid_json'),
                 "trace_id": trace_id
             }
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
+            self._send_json(400, error_response, {'X-Trace-ID': trace_id})
         except Exception as e:  # noqa: BLE001
             # 发送错误响应 / Send error response
             error_response = {
@@ -225,368 +469,234 @@ class JSONToolHandler(http.server.BaseHTTPRequestHandler):
                 "error_code": "TOOL_EXECUTION_ERROR",
                 "debug": debug,
             }
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('X-Trace-ID', trace_id)
-            self.end_headers()
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
+            self._send_json(500, error_response, {'X-Trace-ID': trace_id})
             
             if span:
                 span.set_attribute("http.status_code", 500)
                 span.set_attribute("error", True)
                 span.set_attribute("error.message", str(e))
     
-    def _handle_api_tools_request(self, trace_id: str, span=None):
+    def _send_json(self, status: int, obj: Any, extra_headers: Dict[str, str] = None):
+        """编码JSON并连同Content-Length一起发送 / Encode JSON and send it with Content-Length"""
+        body = _json_dumps(obj)
+        # 大响应（如构建日志）分块发送，客户端可以更早收到数据 / Large bodies (e.g. build logs) are streamed so clients see data sooner
+        chunked = len(body) > STREAM_THRESHOLD and self.request_version == 'HTTP/1.1'
+        if status == 200 and not extra_headers and not chunked and self.request_version == 'HTTP/1.1':
+            self._write_ok_json(body)
+            return
+        # 错误等其他响应走标准头部方法 / Errors and other responses use the stock header methods
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.send_header('Content-Length', str(len(body)))
+        if extra_headers:
+            for name, value in extra_headers.items():
+                self.send_header(name, value)
+        self.end_headers()
+        if chunked:
+            self._write_chunked(body)
+        else:
+            self.wfile.write(body)
+
+    def _write_ok_json(self, body: bytes, extra_headers: bytes = b''):
+        """用预先拼好的头部一次写出200 JSON响应 / Write a 200 JSON response in one call using the preassembled headers"""
+        self.log_request(200)
+        self.wfile.write(b''.join((
+            _OK_JSON_PRELUDE, _date_header(), extra_headers,
+            b'Content-Length: %d\r\n\r\n' % len(body), body,
+        )))
+
+    def _write_chunked(self, body: bytes):
+        """按HTTP/1.1分块传输编码写出响应体 / Write a body using HTTP/1.1 chunked transfer encoding"""
+        view = memoryview(body)
+        for offset in range(0, len(view), WRITE_CHUNK_SIZE):
+            chunk = view[offset:offset + WRITE_CHUNK_SIZE]
+            self.wfile.write(b'%x\r\n' % len(chunk))
+            self.wfile.write(chunk)
+            self.wfile.write(b'\r\n')
+            self.wfile.flush()
+        self.wfile.write(b'0\r\n\r\n')
+
+    def _discard_request_body(self):
+        """丢弃未读取的请求体，保证连接可复用 / Drain an unread request body so the connection can be reused"""
+        content_length = int(self.headers.get('Content-Length', 0))
+        if content_length > 0:
+            self.rfile.read(content_length)
+
+    def _send_cached_json(self, cached: Tuple[bytes, str, bytes]):
+        """发送缓存的JSON响应，支持ETag协商 / Send a cached JSON response with ETag negotiation"""
+        status, body, headers = _cached_json_parts(cached, self.headers.get('If-None-Match'))
+        if status == 200 and self.request_version == 'HTTP/1.1':
+            self._write_ok_json(body, cached[2])
+            return
+        self.send_response(status)
+        if status == 200:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle_api_tools_request(self, span=None):
         """处理/api/tools端点请求 / Handle /api/tools endpoint request"""
-        _ = trace_id
-        registered_tools = self.server.agent.tool_registry.get_registered_tools()
+        server = self.server
+        registered_tools = server.registered_tools
         
-        # 构建工具信息列表 / Build tool information list
-        tools_info = []
-        for tool_name, tool_info in registered_tools.items():
-            tools_info.append({
-                "name": tool_name,
-                "description": str(tool_info.get('description', '')),
-                "parameters": tool_info.get('parameters', []),
-                "returns": tool_info.get('returns', []),
-                "module": str(tool_info.get('module', ''))
-            })
+        # 工具在启动时注册，编码后的响应只构建一次 / Tools are registered at startup, so the encoded response is built once
+        if server.tools_cache is None:
+            server.tools_cache = _encode_cached(_tools_payload(server.agent))
         
-        response = {
-            "tools": tools_info,
-            "total": len(tools_info),
-            "llm_integration": self.server.agent.config.get("llm", {}).get("enabled", False)
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        self._send_cached_json(server.tools_cache)
         
         if span:
             span.set_attribute("http.status_code", 200)
-            span.set_attribute("returned_tools_count", len(tools_info))
+            span.set_attribute("returned_tools_count", len(registered_tools))
     
-    def _handle_api_docs_request(self, trace_id: str, span=None):
+    def _handle_api_docs_request(self, span=None):
         """处理/api/docs端点请求 / Handle /api/docs endpoint request"""
-        _ = trace_id
-        host = self.server.server_address[0]
-        port = self.server.server_address[1]
+        server = self.server
+        agent = server.agent
+        host = server.server_address[0]
+        port = server.server_address[1]
         
         # 获取当前请求的语言 / Get current request language
         current_language = self._get_request_language()
         
-        # 基础API端点 / Basic API endpoints
-        endpoints = [
-            {
-                "url": "/api/tools",
-                "method": "GET",
-                "description": self.server.agent.get_text('api_docs_get_tools'),
-                "response_format": {
-                    "tools": self.server.agent.get_text('api_docs_tools_list'),
-                    "total": self.server.agent.get_text('api_docs_total_tools'),
-                    "llm_integration": self.server.agent.get_text('api_docs_llm_integration')
-                },
-                "example": f"curl -X GET http://{host}:{port}/api/tools"
-            },
-            {
-                "url": "/api/tool/info",
-                "method": "GET",
-                "description": self.server.agent.get_text('api_docs_get_tool_info'),
-                "parameters": [
-                    {"name": "name", "type": "query", "description": self.server.agent.get_text('api_docs_tool_name'), "required": True}
-                ],
-                "response_format": {
-                    "name": self.server.agent.get_text('api_docs_tool_name'),
-                    "description": self.server.agent.get_text('api_docs_tool_description'),
-                    "parameters": self.server.agent.get_text('api_docs_parameters_list'),
-                    "returns": self.server.agent.get_text('api_docs_returns_list'),
-                    "module": self.server.agent.get_text('api_docs_tool_module')
-                },
-                "example": f"curl -X GET http://{host}:{port}/api/tool/info?name=test_git_connection"
-            },
-            {
-                "url": "/api/tool",
-                "method": "POST",
-                "description": self.server.agent.get_text('api_docs_execute_tool'),
-                "request_format": {
-                    "tool": self.server.agent.get_text('api_docs_tool_name'),
-                    "params": self.server.agent.get_text('api_docs_tool_params')
-                },
-                "response_format": {
-                    "success": self.server.agent.get_text('api_docs_success'),
-                    "result": self.server.agent.get_text('api_docs_execution_result'),
-                    "error": self.server.agent.get_text('api_docs_error_info'),
-                    "tool": self.server.agent.get_text('api_docs_called_tool')
-                },
-                "example": f"curl -X POST http://{host}:{port}/api/tool -H 'Content-Type: application/json' -d '{{\"tool\":\"test_git_connection\",\"params\":{{\"url\":\"https://github.com/zephyrproject-rtos/zephyr\"}}}}'"
-            }
-        ]
+        # 文档内容只随语言变化，按语言缓存编码结果 / Docs only vary by language, cache the encoded body per language
+        cache_key = (current_language, agent.current_language)
+        cached = server.docs_cache.get(cache_key)
+        if cached is None:
+            cached = _encode_cached(_docs_payload(agent, host, port, current_language))
+            server.docs_cache[cache_key] = cached
+        self._send_cached_json(cached)
         
-        # 如果启用了LLM集成，添加AI助手端点 / If LLM integration is enabled, add AI assistant endpoint
-        if self.server.agent.config.get("llm", {}).get("enabled", False):
-            endpoints.append({
-                "url": "/api/ai_assistant",
-                "method": "POST",
-                "description": self.server.agent.get_text('api_docs_ai_assistant'),
-                "request_format": {
-                    "messages": self.server.agent.get_text('api_docs_messages_list'),
-                    "model": self.server.agent.get_text('api_docs_model_name'),
-                    "temperature": self.server.agent.get_text('api_docs_temperature'),
-                    "max_tokens": self.server.agent.get_text('api_docs_max_tokens')
-                },
-                "response_format": {
-                    "success": self.server.agent.get_text('api_docs_success'),
-                    "response": self.server.agent.get_text('api_docs_ai_response'),
-                    "model": self.server.agent.get_text('api_docs_used_model'),
-                    "usage": self.server.agent.get_text('api_docs_token_usage')
-                },
-                "example": f"curl -X POST http://{host}:{port}/api/ai_assistant -H 'Content-Type: application/json' -d '{{\"messages\":[{{\"role\":\"user\",\"content\":\"你好\"}}]}}'"
-            })
+        if span:
+            span.set_attribute("http.status_code", 200)
+            span.set_attribute("response_language", current_language)
+    
+    def _handle_ai_assistant_request(self, span=None):
+        """AI助手端点处理（简化版本） / AI assistant endpoint handling (simplified version)"""
+        self._discard_request_body()
+        self._send_json(501, {
+            "error": "AI Assistant endpoint not implemented in this module",
+            "trace_id": self._trace_id()
+        })
+        if span:
+            span.set_attribute("http.status_code", 501)
+    
+    def _handle_api_tool_info_request(self, span=None):
+        """处理/api/tool/info端点请求 / Handle /api/tool/info endpoint request"""
+        get_text = self.server.agent.get_text
+        # 解析查询参数获取工具名称 / Parse query parameters to get tool name
+        query_components = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+        tool_name = query_components.get('name', [None])[0]
         
-        response = {
-            "endpoints": endpoints,
-            "version": self.server.agent.config.get("version", "1.0.0"),
-            "agent_name": self.server.agent.config.get("agent_name", "Zephyr MCP Agent"),
-            "language": current_language,
-            "supported_languages": ["zh", "en"]
-        }
+        if not tool_name:
+            trace_id = self._trace_id()
+            error_response = {
+                "error": get_text('missing_tool_name'),
+                "trace_id": trace_id
+            }
+            self._send_json(400, error_response, {'X-Trace-ID': trace_id})
+            if span:
+                span.set_attribute("http.status_code", 400)
+                span.set_attribute("error", True)
+                span.set_attribute("error.message", "Missing tool name")
+            return
         
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        if span:
+            span.set_attribute("tool.name", tool_name)
+        registered_tools = self.server.registered_tools
+        
+        if tool_name not in registered_tools:
+            trace_id = self._trace_id()
+            error_response = {
+                "error": get_text('tool_not_found', tool_name),
+                "trace_id": trace_id
+            }
+            self._send_json(404, error_response, {'X-Trace-ID': trace_id})
+            if span:
+                span.set_attribute("http.status_code", 404)
+                span.set_attribute("error", True)
+                span.set_attribute("error.message", f"Tool not found: {tool_name}")
+            return
         
+        self._send_json(200, _tool_info_payload(tool_name, registered_tools[tool_name]))
         if span:
             span.set_attribute("http.status_code", 200)
-            span.set_attribute("response_language", current_language)
+    
+    def _send_not_found(self, path: str, span=None):
+        """未找到路径，返回404 / Path not found, return 404"""
+        trace_id = self._trace_id()
+        error_response = {
+            "error": "Not Found",
+            "path": path,
+            "trace_id": trace_id
+        }
+        self._send_json(404, error_response, {'X-Trace-ID': trace_id})
+        if span:
+            span.set_attribute("http.status_code", 404)
+            span.set_attribute("error", True)
+            span.set_attribute("error.message", f"Path not found: {path}")
     
     def do_POST(self):
         """处理POST请求 / Handle POST request"""
-        # 生成或获取trace_id / Generate or get trace_id
-        trace_id = self.headers.get('X-Trace-ID', str(uuid.uuid4()))
-        
-        # 检查是否启用OpenTelemetry / Check if OpenTelemetry is enabled
-        otel_manager = OpenTelemetryManager(self.server.agent.config, self.server.agent.logger)
+        # 客户端提供的trace_id；未提供时在首次使用时生成 / Client-supplied trace_id, otherwise generated on first use
+        self._request_trace_id = self.headers.get('X-Trace-ID')
         
-        if otel_manager.is_enabled():
-            # 使用追踪的版本 / Version with tracing
-            span = otel_manager.create_span("HTTP_POST", {
-                "http.method": "POST",
-                "http.url": self.path,
-                "trace_id": trace_id
-            })
-            
+        # 未启用OpenTelemetry时得到空Span / A no-op span is used when OpenTelemetry is disabled
+        attributes = {
+            "http.method": "POST",
+            "http.url": self.path,
+            "trace_id": self._trace_id()
+        } if self.server.otel_enabled else None
+        with self.server.otel_manager.span("HTTP_POST", attributes) as span:
             try:
-                if self.path == "/api/tool":
-                    self._handle_tool_request(trace_id, span)
-                elif self.path == "/api/ai_assistant":
-                    # AI助手端点处理（简化版本） / AI assistant endpoint handling (simplified version)
-                    self.send_response(501)
-                    self.send_header('Content-Type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({
-                        "error": "AI Assistant endpoint not implemented in this module",
-                        "trace_id": trace_id
-                    }).encode('utf-8'))
-                    span.set_attribute("http.status_code", 501)
+                endpoint = _match_route(POST_ROUTES, self.path)
+                if endpoint is not None:
+                    span.set_attribute("endpoint", endpoint)
+                    getattr(self, self.HANDLERS[endpoint])(span)
                 else:
-                    # 未找到路径，返回404 / Path not found, return 404
-                    self.send_response(404)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('X-Trace-ID', trace_id)
-                    self.end_headers()
-                    error_response = {
-                        "error": "Not Found",
-                        "path": self.path,
-                        "trace_id": trace_id
-                    }
-                    self.wfile.write(json.dumps(error_response).encode('utf-8'))
-                    span.set_attribute("http.status_code", 404)
-                    span.set_attribute("error", True)
-                    span.set_attribute("error.message", f"Path not found: {self.path}")
+                    self._discard_request_body()
+                    self._send_not_found(self.path, span)
             except Exception as e:  # noqa: BLE001
-                self.server.agent.logger.error(f"[{trace_id}] POST请求处理错误: {str(e)}")
+                self.server.agent.logger.error(f"[{self._trace_id()}] POST请求处理错误: {str(e)}")
                 span.set_attribute("error", True)
                 span.set_attribute("error.message", str(e))
-            finally:
-                otel_manager.end_span(span)
-        else:
-            # 不使用追踪的版本 / Version without tracing
-            if self.path == "/api/tool":
-                self._handle_tool_request(trace_id)
-            elif self.path == "/api/ai_assistant":
-                self.send_response(501)
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    "error": "AI Assistant endpoint not implemented in this module",
-                    "trace_id": trace_id
-                }).encode('utf-8'))
-            else:
-                self.send_response(404)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('X-Trace-ID', trace_id)
-                self.end_headers()
-                error_response = {
-                    "error": "Not Found",
-                    "path": self.path,
-                    "trace_id": trace_id
-                }
-                self.wfile.write(json.dumps(error_response).encode('utf-8'))
+                # 响应状态未知，不复用该连接 / Response state is unknown, do not reuse the connection
+                self.close_connection = True
     
     def do_GET(self):
         """处理GET请求 / Handle GET request"""
-        # 生成或获取trace_id / Generate or get trace_id
-        trace_id = self.headers.get('X-Trace-ID', str(uuid.uuid4()))
-        
-        # 解析路径和查询参数 / Parse path and query parameters
-        parsed_path = urllib.parse.urlparse(self.path)
-        path = parsed_path.path
-        query_components = urllib.parse.parse_qs(parsed_path.query)
+        # 客户端提供的trace_id；未提供时在首次使用时生成 / Client-supplied trace_id, otherwise generated on first use
+        self._request_trace_id = self.headers.get('X-Trace-ID')
         
-        # 检查是否启用OpenTelemetry / Check if OpenTelemetry is enabled
-        otel_manager = OpenTelemetryManager(self.server.agent.config, self.server.agent.logger)
+        # 解析路径 / Parse path
+        path = urllib.parse.urlparse(self.path).path
         
-        if otel_manager.is_enabled():
-            span = otel_manager.create_span("HTTP_GET", {
-                "http.method": "GET",
-                "http.url": self.path,
-                "trace_id": trace_id
-            })
-            
+        # 未启用OpenTelemetry时得到空Span / A no-op span is used when OpenTelemetry is disabled
+        attributes = {
+            "http.method": "GET",
+            "http.url": self.path,
+            "trace_id": self._trace_id()
+        } if self.server.otel_enabled else None
+        with self.server.otel_manager.span("HTTP_GET", attributes) as span:
             try:
-                if path == "/api/tools":
-                    span.set_attribute("endpoint", "api_tools")
-                    self._handle_api_tools_request(trace_id, span)
-                elif path == "/api/docs":
-                    span.set_attribute("endpoint", "api_docs")
-                    self._handle_api_docs_request(trace_id, span)
-                elif path.startswith("/api/tool/info"):
-                    # 解析查询参数获取工具名称 / Parse query parameters to get tool name
-                    tool_name = query_components.get('name', [None])[0]
-                    span.set_attribute("endpoint", "api_tool_info")
-                    
-                    if not tool_name:
-                        self.send_response(400)
-                        self.send_header('Content-Type', 'application/json')
-                        self.send_header('X-Trace-ID', trace_id)
-                        self.end_headers()
-                        error_response = {
-                            "error": self.server.agent.get_text('missing_tool_name'),
-                            "trace_id": trace_id
-                        }
-                        self.wfile.write(json.dumps(error_response).encode('utf-8'))
-                        span.set_attribute("http.status_code", 400)
-                        span.set_attribute("error", True)
-                        span.set_attribute("error.message", "Missing tool name")
-                    else:
-                        span.set_attribute("tool.name", tool_name)
-                        registered_tools = self.server.agent.tool_registry.get_registered_tools()
-                        
-                        if tool_name not in registered_tools:
-                            self.send_response(404)
-                            self.send_header('Content-Type', 'application/json')
-                            self.send_header('X-Trace-ID', trace_id)
-                            self.end_headers()
-                            error_response = {
-                                "error": self.server.agent.get_text('tool_not_found', tool_name),
-                                "trace_id": trace_id
-                            }
-                            self.wfile.write(json.dumps(error_response).encode('utf-8'))
-                            span.set_attribute("http.status_code", 404)
-                            span.set_attribute("error", True)
-                            span.set_attribute("error.message", f"Tool not found: {tool_name}")
-                        else:
-                            tool_info = registered_tools[tool_name]
-                            response = {
-                                "name": tool_name,
-                                "description": tool_info.get('description', ''),
-                                "parameters": tool_info.get('parameters', []),
-                                "returns": tool_info.get('returns', []),
-                                "module": tool_info.get('module', '')
-                            }
-                            self.send_response(200)
-                            self.send_header('Content-Type', 'application/json')
-                            self.end_headers()
-                            self.wfile.write(json.dumps(response).encode('utf-8'))
-                            span.set_attribute("http.status_code", 200)
+                endpoint = _match_route(GET_ROUTES, path)
+                if endpoint is not None:
+                    span.set_attribute("endpoint", endpoint)
+                    getattr(self, self.HANDLERS[endpoint])(span)
                 else:
-                    self.send_response(404)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('X-Trace-ID', trace_id)
-                    self.end_headers()
-                    error_response = {
-                        "error": "Not Found",
-                        "path": path,
-                        "trace_id": trace_id
-                    }
-                    self.wfile.write(json.dumps(error_response).encode('utf-8'))
-                    span.set_attribute("http.status_code", 404)
-                    span.set_attribute("error", True)
-                    span.set_attribute("error.message", f"Path not found: {path}")
+                    self._send_not_found(path, span)
             except Exception as e:  # noqa: BLE001
-                self.server.agent.logger.error(f"[{trace_id}] GET请求处理错误: {str(e)}")
+                self.server.agent.logger.error(f"[{self._trace_id()}] GET请求处理错误: {str(e)}")
                 span.set_attribute("error", True)
                 span.set_attribute("error.message", str(e))
-            finally:
-                otel_manager.end_span(span)
-        else:
-            # 不使用追踪的版本 / Version without tracing
-            if path == "/api/tools":
-                self._handle_api_tools_request(trace_id)
-            elif path == "/api/docs":
-                self._handle_api_docs_request(trace_id)
-            elif path.startswith("/api/tool/info"):
-                tool_name = query_components.get('name', [None])[0]
-                
-                if not tool_name:
-                    self.send_response(400)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('X-Trace-ID', trace_id)
-                    self.end_headers()
-                    error_response = {
-                        "error": self.server.agent.get_text('missing_tool_name'),
-                        "trace_id": trace_id
-                    }
-                    self.wfile.write(json.dumps(error_response).encode('utf-8'))
-                else:
-                    registered_tools = self.server.agent.tool_registry.get_registered_tools()
-                    
-                    if tool_name not in registered_tools:
-                        self.send_response(404)
-                        self.send_header('Content-Type', 'application/json')
-                        self.send_header('X-Trace-ID', trace_id)
-                        self.end_headers()
-                        error_response = {
-                            "error": self.server.agent.get_text('tool_not_found', tool_name),
-                            "trace_id": trace_id
-                        }
-                        self.wfile.write(json.dumps(error_response).encode('utf-8'))
-                    else:
-                        tool_info = registered_tools[tool_name]
-                        response = {
-                            "name": tool_name,
-                            "description": tool_info.get('description', ''),
-                            "parameters": tool_info.get('parameters', []),
-                            "returns": tool_info.get('returns', []),
-                            "module": tool_info.get('module', '')
-                        }
-                        self.send_response(200)
-                        self.send_header('Content-Type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps(response).encode('utf-8'))
-            else:
-                self.send_response(404)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('X-Trace-ID', trace_id)
-                self.end_headers()
-                error_response = {
-                    "error": "Not Found",
-                    "path": path,
-                    "trace_id": trace_id
-                }
-                self.wfile.write(json.dumps(error_response).encode('utf-8'))
+                # 响应状态未知，不复用该连接 / Response state is unknown, do not reuse the connection
+                self.close_connection = True
 
     def log_message(self, format_str, *args):
         """自定义日志消息格式 / Custom log message format"""
@@ -595,17 +705,191 @@ class JSONToolHandler(http.server.BaseHTTPRequestHandler):
         )
 
 
+def _log_endpoints(agent, host: str, port: int):
+    """记录服务器地址和可用端点 / Log the server address and available endpoints"""
+    agent.logger.info(agent.get_text('server_started_full', f"{host}:{port}"))
+    agent.logger.info(agent.get_text('available_endpoints'))
+    agent.logger.info(f"  GET  http://{host}:{port}/api/tools - {agent.get_text('endpoint_get_tools')}")
+    agent.logger.info(f"  GET  http://{host}:{port}/api/tool/info?name=<tool_name> - {agent.get_text('endpoint_get_tool_info')}")
+    agent.logger.info(f"  POST http://{host}:{port}/api/tool - {agent.get_text('endpoint_execute_tool')}")
+    agent.logger.info(f"  GET  http://{host}:{port}/api/docs - {agent.get_text('endpoint_get_docs')}")
+    
+    if agent.config.get("llm", {}).get("enabled", False):
+        agent.logger.info(f"  POST http://{host}:{port}/api/ai_assistant - {agent.get_text('endpoint_ai_assistant')}")
+
+
+def _create_aiohttp_app(agent, host: str, port: int):
+    """
+    创建aiohttp应用，与线程服务器共用路由表、缓存协商和响应构建函数
+    Create the aiohttp application, sharing the route tables, cache negotiation and response builders with the threaded server
+    
+    工具函数在默认线程池中执行，阻塞的子进程不会卡住事件循环。
+    Tool functions run in the default executor so blocking subprocesses do not stall the event loop.
+    """
+    get_text = agent.get_text
+    registered_tools = agent.tool_registry.get_registered_tools()
+    tools_cache = _encode_cached(_tools_payload(agent))
+    docs_cache: Dict[Tuple[str, str], Tuple[bytes, str, bytes]] = {}
+    # 每个应用只创建一次，与线程服务器相同 / Built once per application, as in the threaded server
+    otel_manager = OpenTelemetryManager(agent.config, agent.logger)
+    otel_enabled = otel_manager.is_enabled()
+    
+    def json_response(obj: Any, status: int = 200, trace_id: Optional[str] = None):
+        headers = {'X-Trace-ID': trace_id} if trace_id else None
+        return web.Response(body=_json_dumps(obj), status=status,
+                            content_type='application/json', headers=headers)
+    
+    def cached_response(request, cached: Tuple[bytes, str, bytes]):
+        status, body, headers = _cached_json_parts(cached, request.headers.get('If-None-Match'))
+        if status != 200:
+            return web.Response(status=status, headers=headers)
+        return web.Response(body=body, content_type='application/json', headers=headers)
+    
+    async def api_tools(request, span, trace_id):
+        span.set_attribute("returned_tools_count", len(registered_tools))
+        return cached_response(request, tools_cache)
+    
+    async def api_docs(request, span, trace_id):
+        language = _request_language(request.headers.get('Accept-Language', ''), agent.current_language)
+        span.set_attribute("response_language", language)
+        cache_key = (language, agent.current_language)
+        cached = docs_cache.get(cache_key)
+        if cached is None:
+            cached = docs_cache[cache_key] = _encode_cached(_docs_payload(agent, host, port, language))
+        return cached_response(request, cached)
+    
+    async def api_tool_info(request, span, trace_id):
+        tool_name = request.query.get('name')
+        if not tool_name:
+            return json_response({"error": get_text('missing_tool_name'), "trace_id": trace_id}, 400, trace_id)
+        span.set_attribute("tool.name", tool_name)
+        tool_info = registered_tools.get(tool_name)
+        if tool_info is None:
+            return json_response({"error": get_text('tool_not_found', tool_name), "trace_id": trace_id}, 404, trace_id)
+        return json_response(_tool_info_payload(tool_name, tool_info))
+    
+    async def api_tool(request, span, trace_id):
+        body = await request.read()
+        if not body:
+            return json_response({"error": get_text('missing_request_body')}, 400)
+        try:
+            payload = _json_loads(body)
+        except json.JSONDecodeError:
+            return json_response({"error": get_text('invalid_json'), "trace_id": trace_id}, 400, trace_id)
+        
+        tool_name = payload.get('tool')
+        params = payload.get('params', {})
+        if not tool_name:
+            return json_response({"error": get_text('missing_tool_name')}, 400)
+        span.set_attribute("tool.name", tool_name)
+        error = _check_request_params(agent, tool_name, params, registered_tools)
+        if error is not None:
+            return json_response({"error": error[1]}, error[0])
+        
+        debug: List[str] = []
+        tool_func = registered_tools[tool_name]['function']
+        loop = asyncio.get_running_loop()
+        # 工具在默认线程池中运行；_invoke_tool的print/stdio重定向只作用于当前线程上下文，可安全并发
+        # Tools run on the default thread pool; _invoke_tool's print/stdio redirects are context-local
+        try:
+            result = await loop.run_in_executor(
+                None, functools.partial(_invoke_tool, agent, tool_name, tool_func, params, trace_id, debug)
+            )
+        except Exception as e:  # noqa: BLE001
+            return json_response({
+                "success": False,
+                "error": str(e),
+                "tool": tool_name,
+                "trace_id": trace_id,
+                "error_code": "TOOL_EXECUTION_ERROR",
+                "debug": debug,
+            }, 500, trace_id)
+        return json_response({"success": True, "result": result, "tool": tool_name, "trace_id": trace_id})
+    
+    async def api_ai_assistant(request, span, trace_id):
+        return json_response({
+            "error": "AI Assistant endpoint not implemented in this module",
+            "trace_id": trace_id
+        }, 501)
+    
+    handlers = {
+        "api_tools": api_tools,
+        "api_docs": api_docs,
+        "api_tool_info": api_tool_info,
+        "api_tool": api_tool,
+        "api_ai_assistant": api_ai_assistant,
+    }
+    method_routes = {"GET": GET_ROUTES, "POST": POST_ROUTES}
+    
+    async def dispatch(request):
+        """按共用路由表分发请求，并与线程服务器一样包裹在span中 / Dispatch via the shared route tables, wrapped in a span like the threaded server"""
+        method = request.method
+        # 客户端提供的trace_id，未提供时生成 / Client-supplied trace_id, otherwise generated
+        trace_id = request.headers.get('X-Trace-ID') or str(uuid.uuid4())
+        endpoint = _match_route(method_routes.get(method, {}), request.path)
+        
+        # 未启用OpenTelemetry时得到空Span / A no-op span is used when OpenTelemetry is disabled
+        attributes = {
+            "http.method": method,
+            "http.url": str(request.rel_url),
+            "trace_id": trace_id
+        } if otel_enabled else None
+        with otel_manager.span(f"HTTP_{method}", attributes) as span:
+            if endpoint is None:
+                    response = json_response({"error": "Not Found", "path": request.path, "trace_id": trace_id}, 404, trace_id)
+            else:
+                span.set_attribute("endpoint", endpoint)
+                response = await handlers[endpoint](request, span, trace_id)
+            span.set_attribute("http.status_code", response.status)
+            if response.status >= 400:
+                span.set_attribute("error", True)
+                span.set_attribute("error.message", response.reason)
+            return response
+    
+    app = web.Application(client_max_size=MAX_BODY_BYTES)
+    app.router.add_route('*', '/{tail:.*}', dispatch)
+    return app
+
+
 def start_json_server(agent):
     """启动JSON HTTP接口服务器 / Start JSON HTTP interface server"""
     # 获取配置中的端口，默认为8001 / Get port from config, default to 8001
     port = agent.config.get("port", 8001)
     host = agent.config.get("host", "localhost")
     
+    if agent.config.get("http_backend", "threading") == "aiohttp":
+        if web is not None:
+            _log_endpoints(agent, host, port)
+            try:
+                web.run_app(_create_aiohttp_app(agent, host, port), host=host, port=port, print=None)
+            except Exception as e:  # noqa: BLE001
+                agent.logger.error(agent.get_text('server_error', str(e)))
+            finally:
+                # 导出剩余的Span并停止导出线程 / Export remaining spans and stop the exporter thread
+                shutdown_opentelemetry()
+                agent.logger.info(agent.get_text('server_closed'))
+            return
+        agent.logger.warning("aiohttp未安装，使用线程HTTP服务器 / aiohttp is not installed, using the threaded HTTP server")
+    
     # 创建自定义的HTTP服务器类 / Create custom HTTP server class
-    class JSONHTTPServer(socketserver.TCPServer):
+    # 每个连接在独立线程中处理，慢工具不会阻塞其他请求
+    # Each connection runs on its own thread so a slow tool does not stall other requests
+    class JSONHTTPServer(http.server.ThreadingHTTPServer):
+        allow_reuse_address = True
+        daemon_threads = True
+        request_queue_size = 128
+
         def __init__(self, server_address, handler_class):
             super().__init__(server_address, handler_class)
             self.agent = agent
+            # 启动时对工具注册表做只读快照，并发请求无需加锁 / Read-only registry snapshot taken at start, safe for concurrent readers
+            self.registered_tools = agent.tool_registry.get_registered_tools()
+            # 编码后的GET响应缓存 / Encoded GET response caches
+            self.tools_cache = None
+            self.docs_cache = {}
+            # 每个服务器只创建一次，避免每个请求重新构造 / Built once per server instead of per request
+            self.otel_manager = OpenTelemetryManager(agent.config, agent.logger)
+            self.otel_enabled = self.otel_manager.is_enabled()
     
     # 创建处理器类工厂 / Create handler class factory
     def handler_factory(*args, **kwargs):
@@ -613,15 +897,7 @@ def start_json_server(agent):
     
     # 启动服务器 / Start server
     with JSONHTTPServer((host, port), handler_factory) as httpd:
-        agent.logger.info(agent.get_text('server_started_full', f"{host}:{port}"))
-        agent.logger.info(agent.get_text('available_endpoints'))
-        agent.logger.info(f"  GET  http://{host}:{port}/api/tools - {agent.get_text('endpoint_get_tools')}")
-        agent.logger.info(f"  GET  http://{host}:{port}/api/tool/info?name=<tool_name> - {agent.get_text('endpoint_get_tool_info')}")
-        agent.logger.info(f"  POST http://{host}:{port}/api/tool - {agent.get_text('endpoint_execute_tool')}")
-        agent.logger.info(f"  GET  http://{host}:{port}/api/docs - {agent.get_text('endpoint_get_docs')}")
-        
-        if agent.config.get("llm", {}).get("enabled", False):
-            agent.logger.info(f"  POST http://{host}:{port}/api/ai_assistant - {agent.get_text('endpoint_ai_assistant')}")
+        _log_endpoints(agent, host, port)
         
         try:
             httpd.serve_forever()
@@ -631,4 +907,6 @@ def start_json_server(agent):
             agent.logger.error(agent.get_text('server_error', str(e)))
         finally:
             httpd.server_close()
+            # 导出剩余的Span并停止导出线程 / Export remaining spans and stop the exporter thread
+            shutdown_opentelemetry()
             agent.logger.info(agent.get_text('server_closed'))
\ No newline at end of file
@@ -5,13 +5,32 @@
 处理多语言支持和资源管理
 """
 
+import functools
 import os
+import re
 import sys
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 # 导入语言资源
 from src.utils.language_resources import LanguageManager, get_text, set_language
 
+# 可用语言表，只读常量，不在每次调用时重建
+_AVAILABLE_LANGUAGES: Mapping[str, str] = MappingProxyType({
+    "zh": "中文 (Chinese)",
+    "en": "English (英语)"
+})
+
+# 每种可用语言的信息，只读且只构建一次
+_LANGUAGE_INFO: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    code: MappingProxyType({"code": code, "name": name, "available": True})
+    for code, name in _AVAILABLE_LANGUAGES.items()
+})
+
+# Accept-Language中的语言标签及可选q值，模块加载时编译一次
+# 主语言子标签后不能紧跟字母，避免"eng"等更长的标签按前缀匹配为"en"
+_LANG_RE = re.compile(r'(?:^|,)\s*([a-zA-Z]{2})(?![a-zA-Z])(?:-[a-zA-Z0-9]+)*\s*(?:;\s*q\s*=\s*([0-9.]+))?')
+
 
 def setup_language(default_language: str = "zh") -> None:
     """设置全局语言"""
@@ -28,18 +47,14 @@ def create_language_manager(default_language: str = "zh") -> LanguageManager:
     return LanguageManager(default_language)
 
 
-def get_available_languages() -> Dict[str, str]:
-    """获取可用语言列表"""
-    return {
-        "zh": "中文 (Chinese)",
-        "en": "English (英语)"
-    }
+def get_available_languages() -> Mapping[str, str]:
+    """获取可用语言列表（只读）"""
+    return _AVAILABLE_LANGUAGES
 
 
 def validate_language(language: str) -> bool:
     """验证语言代码是否有效"""
-    available_languages = get_available_languages()
-    return language in available_languages
+    return language in _AVAILABLE_LANGUAGES
 
 
 def switch_language(language: str, language_manager: Optional[LanguageManager] = None) -> bool:
@@ -55,21 +70,16 @@ def switch_language(language: str, language_manager: Optional[LanguageManager] =
     return True
 
 
-def get_language_info(language: str) -> Dict[str, Any]:
-    """获取语言信息"""
-    available_languages = get_available_languages()
-    
-    if language not in available_languages:
-        return {
-            "code": language,
-            "name": "Unknown",
-            "available": False
-        }
+def get_language_info(language: str) -> Mapping[str, Any]:
+    """获取语言信息；可用语言返回共享的只读映射"""
+    info = _LANGUAGE_INFO.get(language)
+    if info is not None:
+        return info
     
     return {
         "code": language,
-        "name": available_languages[language],
-        "available": True
+        "name": "Unknown",
+        "available": False
     }
 
 
@@ -102,17 +112,40 @@ def get_language_config(config: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@functools.lru_cache(maxsize=256)
+def _detect_language(accept_language: str, default: str = 'zh') -> str:
+    """解析Accept-Language头，没有可用语言时返回default；常见的头部取值很少，结果按参数缓存"""
+    # 快速路径：第一个标签没有q参数时其q值为1（最高），且排在最前，可直接采用
+    first = accept_language.split(',', 1)[0].strip()
+    if ';' not in first and (len(first) == 2 or first[2:3] == '-'):
+        tag = first[:2].lower()
+        if tag in _AVAILABLE_LANGUAGES:
+            return tag
+    
+    # 一次扫描，选择q值最高的可用语言；q值相同时取先列出的
+    best_language = default
+    best_quality = 0.0
+    for tag, quality in _LANG_RE.findall(accept_language):
+        tag = tag.lower()
+        if tag not in _AVAILABLE_LANGUAGES:
+            continue
+        try:
+            q = float(quality) if quality else 1.0
+        except ValueError:
+            continue
+        if q > best_quality:
+            best_language, best_quality = tag, q
+    return best_language
+
+
+def detect_language(accept_language: str, default: str = 'zh') -> str:
+    """从Accept-Language头检测语言，没有可用语言时返回default"""
+    return _detect_language(accept_language, default)
+
+
 def detect_language_from_request(headers: Dict[str, str]) -> str:
     """从HTTP请求头检测语言"""
-    accept_language = headers.get('Accept-Language', '')
-    
-    # 简单的语言检测逻辑
-    if 'zh' in accept_language:
-        return 'zh'
-    elif 'en' in accept_language:
-        return 'en'
-    else:
-        return 'zh'  # 默认中文
+    return detect_language(headers.get('Accept-Language', ''))
 
 
 def get_language_aware_text(language_manager: LanguageManager, key: str, *args, **kwargs) -> str:
@@ -126,29 +159,35 @@ def create_language_aware_logger(logger, language_manager: LanguageManager):
         def __init__(self, logger, language_manager):
             self.logger = logger
             self.language_manager = language_manager
+            # 预先绑定热路径上的方法，每次调用不再重复解析属性
+            self._get_text = language_manager.get_text
+            self._debug = logger.debug
+            self._info = logger.info
+            self._warning = logger.warning
+            self._error = logger.error
+            self._critical = logger.critical
         
         def debug(self, key, *args, **kwargs):
-            message = self.language_manager.get_text(key, *args, **kwargs)
-            self.logger.debug(message)
+            self._debug(self._get_text(key, *args, **kwargs))
         
         def info(self, key, *args, **kwargs):
-            message = self.language_manager.get_text(key, *args, **kwargs)
-            self.logger.info(message)
+            self._info(self._get_text(key, *args, **kwargs))
         
         def warning(self, key, *args, **kwargs):
-            message = self.language_manager.get_text(key, *args, **kwargs)
-            self.logger.warning(message)
+            self._warning(self._get_text(key, *args, **kwargs))
         
         def error(self, key, *args, **kwargs):
-            message = self.language_manager.get_text(key, *args, **kwargs)
-            self.logger.error(message)
+            self._error(self._get_text(key, *args, **kwargs))
         
         def critical(self, key, *args, **kwargs):
-            message = self.language_manager.get_text(key, *args, **kwargs)
-            self.logger.critical(message)
+            self._critical(self._get_text(key, *args, **kwargs))
         
-        # 传递其他方法
+        # 传递其他方法；方法缓存到实例上，之后不再经过__getattr__
+        # 普通属性（如level）不缓存，始终读取日志器的当前值
         def __getattr__(self, name):
-            return getattr(self.logger, name)
+            attr = getattr(self.logger, name)
+            if callable(attr):
+                self.__dict__[name] = attr
+            return attr
     
     return LanguageAwareLogger(logger, language_manager)
\ No newline at end of file
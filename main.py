@@ -8,18 +8,19 @@ Zephyr MCP Agent - 主入口脚本
 import os
 import sys
 import argparse
+import functools
 
 # 添加项目根目录到Python路径，确保可以正确导入模块
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# 导入核心模块
-from agent_core import ZephyrMCPAgent
-from config_manager import load_config, create_sample_config
+# 导入核心模块；agent_core依赖较重，只在启动Agent时导入
+from config_manager import load_config
 from language_manager import setup_language
 
 
-def main():
-    """主函数"""
+@functools.lru_cache(maxsize=None)
+def _get_parser() -> argparse.ArgumentParser:
+    """构建命令行解析器，同一进程内只构建一次"""
     parser = argparse.ArgumentParser(description="Zephyr MCP Agent")
     parser.add_argument(
         "--config", "-c", default="config.json", help="配置文件路径 (默认: config.json)"
@@ -35,11 +36,21 @@ def main():
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         help="设置日志级别 (覆盖配置文件)",
     )
+    return parser
 
-    args = parser.parse_args()
+
+def main(argv=None):
+    """主函数
+
+    Args:
+        argv: 命令行参数列表，默认使用sys.argv[1:]；测试可在同一进程中多次调用
+    """
+    args = _get_parser().parse_args(argv)
 
     # 处理创建配置文件选项
     if args.create_config:
+        from config_manager import create_sample_config
+
         if create_sample_config(args.config):
             print(f"示例配置文件已创建: {args.config}")
             return 0
@@ -65,6 +76,8 @@ def main():
 
     try:
         # 创建并启动Agent
+        from agent_core import ZephyrMCPAgent
+
         agent = ZephyrMCPAgent(config)
         agent.start()
         return 0
@@ -7,16 +7,52 @@ OpenTelemetry集成模块 / OpenTelemetry Integration Module
 
 import os
 import sys
+from contextlib import contextmanager
 from typing import Dict, Any, Optional, TYPE_CHECKING
 
-# OpenTelemetry相关导入 / OpenTelemetry related imports
-try:
+# OpenTelemetry SDK在首次启用追踪时才导入，默认禁用时不加载
+# The OpenTelemetry SDK is imported the first time tracing is enabled, never on the default disabled path
+OPENTELEMETRY_AVAILABLE: Optional[bool] = None  # None表示尚未尝试导入 / None means no import attempted yet
+AGNO_INSTRUMENTOR_AVAILABLE = False
+trace = None
+TracerProvider = None
+BatchSpanProcessor = None
+ConsoleSpanExporter = None
+SimpleSpanProcessor = None
+OTLPSpanExporter = None
+SERVICE_NAME = None
+Resource = None
+HTTPInstrumentor = None
+AgnoInstrumentor = None
+
+if TYPE_CHECKING:
     from opentelemetry import trace
-    from opentelemetry.sdk.trace import TracerProvider, Span
-    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor
-    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-    from opentelemetry.instrumentation.http import HTTPInstrumentor
+
+# 自动埋点是进程级的全局状态，只启用一次 / Auto-instrumentation is process-wide state, enable it only once
+_INSTRUMENTED = False
+
+# 进程内共享的TracerProvider，重复初始化时复用 / Process-wide TracerProvider, reused by repeated initialisation
+_PROVIDER = None
+
+
+def _load_opentelemetry() -> bool:
+    """按需导入OpenTelemetry依赖，结果只计算一次 / Import the OpenTelemetry dependencies on demand, once"""
+    global OPENTELEMETRY_AVAILABLE, AGNO_INSTRUMENTOR_AVAILABLE, trace, TracerProvider
+    global BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor, OTLPSpanExporter
+    global SERVICE_NAME, Resource, HTTPInstrumentor, AgnoInstrumentor
+    if OPENTELEMETRY_AVAILABLE is not None:
+        return OPENTELEMETRY_AVAILABLE
+    
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+        from opentelemetry.instrumentation.http import HTTPInstrumentor
+    except ImportError:
+        OPENTELEMETRY_AVAILABLE = False
+        return False
     
     # Agno Instrumentor 导入 / Agno Instrumentor import
     try:
@@ -27,15 +63,36 @@ try:
         AgnoInstrumentor = None
     
     OPENTELEMETRY_AVAILABLE = True
+    return True
+
+
+class _NullSpan:
+    """未启用追踪时使用的空Span / No-op span used when tracing is disabled"""
     
-    if TYPE_CHECKING:
-        from opentelemetry import trace
-except ImportError:
-    OPENTELEMETRY_AVAILABLE = False
-    AGNO_INSTRUMENTOR_AVAILABLE = False
-    # 为类型检查提供占位符 / Placeholder for type checking
-    if TYPE_CHECKING:
-        from typing import Any as trace
+    __slots__ = ()
+    
+    def set_attribute(self, key: str, value: Any):
+        pass
+    
+    def set_attributes(self, attributes: Dict[str, Any]):
+        pass
+    
+    def end(self):
+        pass
+    
+    def __bool__(self) -> bool:
+        # 保持 `if span:` 判断与返回None时一致 / Keep `if span:` checks behaving as they did with None
+        return False
+    
+    # 可直接用作 `with` 的上下文，禁用时无需创建生成器 / Usable directly in `with`, so the disabled path builds no generator
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
 
 
 class OpenTelemetryManager:
@@ -47,13 +104,13 @@ class OpenTelemetryManager:
         self.logger = logger
         self.tracer = None
         self.initialized = False
+        # 初始化成功后置为True，热路径只读取该布尔值 / Set once initialization succeeds; hot paths only read this bool
+        self._enabled = False
+        # 启用后绑定为tracer.start_span / Bound to tracer.start_span once enabled
+        self._start_span = None
         
     def init_opentelemetry(self, agent):
         """初始化OpenTelemetry追踪 / Initialize OpenTelemetry tracing"""
-        if not OPENTELEMETRY_AVAILABLE:
-            self.logger.info("OpenTelemetry 依赖未安装，将禁用分布式追踪功能")
-            return None
-            
         try:
             otel_config = self.config.get("opentelemetry", {})
             
@@ -63,6 +120,16 @@ class OpenTelemetryManager:
                 self.logger.info("OpenTelemetry 已禁用")
                 return None
             
+            # 确认启用后才导入SDK / Import the SDK only once tracing is known to be enabled
+            if not _load_opentelemetry():
+                self.logger.info("OpenTelemetry 依赖未安装，将禁用分布式追踪功能")
+                return None
+            
+            global _PROVIDER
+            if _PROVIDER is not None:
+                # 已初始化过：复用现有的Provider及其导出线程 / Already initialised: reuse the provider and its export thread
+                return self._bind_tracer(_PROVIDER.get_tracer(__name__))
+            
             # 创建资源 / Create resource
             resource = Resource.create({
                 SERVICE_NAME: otel_config.get("service_name", self.config.get("agent_name", "zephyr_mcp_agent")),
@@ -90,35 +157,46 @@ class OpenTelemetryManager:
                 
                 exporter = OTLPSpanExporter(endpoint=otlp_endpoint, headers=headers)
                 self.logger.info(f"使用OTLP导出器，端点: {otlp_endpoint}")
-                
-                # 使用SimpleSpanProcessor以获得更快的响应
-                # Use SimpleSpanProcessor for faster response
-                span_processor = SimpleSpanProcessor(exporter)
             else:
                 exporter = ConsoleSpanExporter()
                 self.logger.info("使用控制台导出器")
-                span_processor = BatchSpanProcessor(exporter)
+            
+            # 默认批量导出；simple在每个span结束时同步导出，仅用于调试
+            # Batch export by default; simple exports synchronously on every span end, for debugging only
+            if otel_config.get("processor", "batch") == "simple":
+                span_processor = SimpleSpanProcessor(exporter)
+            else:
+                span_processor = BatchSpanProcessor(
+                    exporter,
+                    max_queue_size=2048,
+                    max_export_batch_size=512,
+                    schedule_delay_millis=5000,
+                )
             
             tracer_provider.add_span_processor(span_processor)
             
             # 设置全局追踪提供者 / Set global tracer provider
             trace.set_tracer_provider(tracer_provider)
+            _PROVIDER = tracer_provider
             
             # 获取tracer / Get tracer
-            self.tracer = trace.get_tracer(__name__)
+            tracer = tracer_provider.get_tracer(__name__)
             
-            # 启用HTTP工具自动检测 / Enable HTTP instrumentation
-            HTTPInstrumentor().instrument()
-            
-            # 启用Agno的自动埋点（如果可用）
-            # Enable Agno auto-instrumentation (if available)
-            if AGNO_INSTRUMENTOR_AVAILABLE and AgnoInstrumentor:
-                AgnoInstrumentor().instrument()
-                self.logger.info("Agno Instrumentor 已启用")
-            else:
-                self.logger.info("Agno Instrumentor 不可用，使用标准OpenTelemetry")
+            global _INSTRUMENTED
+            if not _INSTRUMENTED:
+                # 启用HTTP工具自动检测 / Enable HTTP instrumentation
+                HTTPInstrumentor().instrument()
+                
+                # 启用Agno的自动埋点（如果可用）
+                # Enable Agno auto-instrumentation (if available)
+                if AGNO_INSTRUMENTOR_AVAILABLE and AgnoInstrumentor:
+                    AgnoInstrumentor().instrument()
+                    self.logger.info("Agno Instrumentor 已启用")
+                else:
+                    self.logger.info("Agno Instrumentor 不可用，使用标准OpenTelemetry")
+                _INSTRUMENTED = True
             
-            self.initialized = True
+            self._bind_tracer(tracer)
             self.logger.info("OpenTelemetry 初始化成功")
             return self.tracer
             
@@ -126,20 +204,44 @@ class OpenTelemetryManager:
             self.logger.error(f"OpenTelemetry 初始化失败: {str(e)}")
             return None
     
+    def _bind_tracer(self, tracer):
+        """记录tracer并启用Span创建 / Store the tracer and enable span creation"""
+        self.tracer = tracer
+        self.initialized = True
+        self._enabled = True
+        self._start_span = tracer.start_span
+        return tracer
+    
     def create_span(self, name: str, attributes: Dict[str, Any] = None):
-        """创建新的Span / Create new Span"""
-        if not self.initialized or not self.tracer:
-            return None
+        """创建新的Span，未启用时返回空Span / Create new Span, or a no-op span when disabled"""
+        if not self._enabled:
+            return _NULL_SPAN
             
         try:
-            span = self.tracer.start_span(name)
+            span = self._start_span(name)
             if attributes:
-                for key, value in attributes.items():
-                    span.set_attribute(key, value)
+                # 一次调用设置全部属性，只获取一次Span内部锁 / Set all attributes in one call, taking the span lock once
+                span.set_attributes(attributes)
             return span
         except Exception as e:
             self.logger.error(f"创建Span失败: {str(e)}")
-            return None
+            return _NULL_SPAN
+    
+    def span(self, name: str, attributes: Dict[str, Any] = None):
+        """创建Span并在退出时结束 / Create a Span and end it on exit"""
+        if not self._enabled:
+            # 空Span本身就是上下文管理器 / The null span is its own context manager
+            return _NULL_SPAN
+        return self._span_context(name, attributes)
+    
+    @contextmanager
+    def _span_context(self, name: str, attributes: Dict[str, Any] = None):
+        """启用追踪时的Span上下文 / Span context used when tracing is enabled"""
+        span = self.create_span(name, attributes)
+        try:
+            yield span
+        finally:
+            self.end_span(span)
     
     def end_span(self, span, status_code: int = None, error: bool = False, error_message: str = None):
         """结束Span / End Span"""
@@ -147,21 +249,25 @@ class OpenTelemetryManager:
             return
             
         try:
+            # 结束时的属性合并为一次SDK调用 / Closing attributes go to the SDK in one call
+            attributes = {}
             if status_code is not None:
-                span.set_attribute("http.status_code", status_code)
+                attributes["http.status_code"] = status_code
             
             if error:
-                span.set_attribute("error", True)
+                attributes["error"] = True
                 if error_message:
-                    span.set_attribute("error.message", error_message)
+                    attributes["error.message"] = error_message
             
+            if attributes:
+                span.set_attributes(attributes)
             span.end()
         except Exception as e:
             self.logger.error(f"结束Span失败: {str(e)}")
     
     def is_enabled(self) -> bool:
         """检查OpenTelemetry是否启用 / Check if OpenTelemetry is enabled"""
-        return self.initialized and self.tracer is not None
+        return self._enabled
 
 
 def init_opentelemetry(config: Dict[str, Any], agent, logger):
@@ -170,12 +276,22 @@ def init_opentelemetry(config: Dict[str, Any], agent, logger):
     return manager.init_opentelemetry(agent)
 
 
+def shutdown_opentelemetry():
+    """刷新并关闭共享的TracerProvider / Flush and shut down the shared TracerProvider"""
+    global _PROVIDER
+    provider, _PROVIDER = _PROVIDER, None
+    if provider is not None:
+        # 导出队列中剩余的Span并停止后台线程 / Export queued spans and stop the background thread
+        provider.shutdown()
+
+
 def get_default_opentelemetry_config() -> Dict[str, Any]:
     """获取默认的OpenTelemetry配置 / Get default OpenTelemetry configuration"""
     return {
         "enabled": False,
         "service_name": "zephyr_mcp_agent",
         "exporter": "console",  # console, otlp / 控制台, OTLP
+        "processor": "batch",  # batch, simple / 批量导出, 同步导出（调试用）
         "otlp_endpoint": "http://localhost:4318/v1/traces",
         "sampler": "always_on",
         "headers": {},  # OTLP导出器的自定义头部 / Custom headers for OTLP exporter
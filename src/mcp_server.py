@@ -20,8 +20,9 @@ if str(_repo_root) not in sys.path:
 from src.utils.logging_utils import (  # noqa: E402  # pylint: disable=wrong-import-position
     get_logger,
     capture_debug_logs,
-    print_to_logger,
     StdioLoggerWriter,
+    protect_stdio_transport,
+    redirect_print_to_logger,
     redirect_stdio_to_logger,
 )
 
@@ -135,13 +136,9 @@ def _wrap_tool_with_venv_step(func):
 
         with capture_debug_logs(debug):
             tool_logger = get_logger("tools." + wrapped_name)
-            old_print = __import__("builtins").print
 
-            def _tool_print(*print_args, **print_kwargs):
-                return print_to_logger(tool_logger, *print_args, **print_kwargs)
-
-            __import__("builtins").print = _tool_print
-            try:
+            # Context-local print/stdio redirects: concurrent tool calls keep their own loggers
+            with redirect_print_to_logger(tool_logger):
                 with redirect_stdio_to_logger(tool_logger, strict=strict_stdio):
                     ok, err_en, err_zh = _ensure_venv_ready_for_tool()
                     if not ok:
@@ -170,8 +167,6 @@ def _wrap_tool_with_venv_step(func):
                             "debug": debug,
                             "process_feedback": process_feedback,
                         }
-            finally:
-                __import__("builtins").print = old_print
 
         debug.append(
             "INFO mcp_server: Finished in " + str(round(time.time() - started, 3)) + "s"
@@ -521,7 +516,10 @@ if __name__ == "__main__":
     logger.info("[Starting] Starting MCP server %s...", mcp_name)
     logger.info("[启动] 正在启动 MCP 服务器 %s...", mcp_name)
     try:
-        mcp.run()
+        # Output from tool-spawned threads must not reach stdout, which carries JSON-RPC
+        # 工具启动的线程输出不能写入 stdout（stdout 承载 JSON-RPC 消息）
+        with protect_stdio_transport(logger):
+            mcp.run()
     except Exception as e:  # noqa: BLE001
         logger.exception("Server runtime error: %s", str(e))
         logger.error("服务器运行时出错: %s", str(e))
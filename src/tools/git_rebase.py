@@ -17,11 +17,14 @@ from src.utils.input_validation import (
 from src.utils.internal_helpers import _git_rebase_internal
 
 
-def _run_git_cmd(project_dir: str, args: List[str]) -> subprocess.CompletedProcess:
+def _run_git_cmd(
+    project_dir: str, args: List[str], input_text: Optional[str] = None
+) -> subprocess.CompletedProcess:
     """Run a git command in `project_dir` and return the CompletedProcess."""
     return subprocess.run(
         ["git", *args],
         cwd=project_dir,
+        input=input_text,
         capture_output=True,
         text=True,
         check=False,
@@ -94,13 +97,20 @@ def _verify_git_ref_exists(project_dir: str, ref: str) -> Optional[Dict[str, Any
         f"refs/remotes/origin/{ref}^{{commit}}",
     ]
 
-    for cand in candidates:
-        try:
-            process = _run_git_cmd(project_dir, ["rev-parse", "--verify", "--quiet", cand])
-            if process.returncode == 0:
-                return None
-        except Exception:
-            continue
+    # Resolve every candidate in one `git cat-file --batch-check` process instead of
+    # spawning one `rev-parse` per candidate. Unresolvable names are reported as
+    # "<name> missing" (or "<name> ambiguous" for short SHAs).
+    # 用一个 `git cat-file --batch-check` 进程解析所有候选引用，而不是每个候选启动一次 `rev-parse`
+    try:
+        process = _run_git_cmd(
+            project_dir, ["cat-file", "--batch-check"], "\n".join(candidates) + "\n"
+        )
+        if process.returncode == 0:
+            for line in process.stdout.splitlines():
+                if not line.endswith((" missing", " ambiguous")):
+                    return None
+    except Exception:
+        pass
 
     return _error(f"Git引用不存在(分支/标签/SHA): {ref}")
 
@@ -18,6 +18,7 @@ import sys
 from typing import Any, Dict
 
 from src.utils.common_tools import check_tools, format_error_message, run_command
+from src.utils.venv_manager import get_tool_executable
 from src.utils.logging_utils import get_logger, print_to_logger
 
 
@@ -109,7 +110,7 @@ def nxp_downstream_setup(
     else:
         _dbg(f"Running west init -m {manifest_url} ...")
         init_result = run_command(
-            ["west", "init", "-m", manifest_url],
+            [get_tool_executable("west"), "init", "-m", manifest_url],
             cwd=project_dir,
             retries=3,
             retry_backoff_seconds=2.0,
@@ -122,7 +123,7 @@ def nxp_downstream_setup(
     # 3) west update bifrost
     _dbg("Running west update bifrost ...")
     update_result = run_command(
-        ["west", "update", "bifrost"],
+        [get_tool_executable("west"), "update", "bifrost"],
         cwd=project_dir,
         retries=3,
         retry_backoff_seconds=2.0,
@@ -8,10 +8,11 @@ File Description: Twister test tool for Zephyr project
 
 import os
 import re
-import subprocess
 import sys
+import threading
+from contextlib import contextmanager
 from typing import Dict, Any, Optional, Union, List
-from src.utils.common_tools import check_tools
+from src.utils.common_tools import check_tools, run_streamed
 from src.utils.input_validation import (
     ValidationError,
     split_cli_args,
@@ -22,6 +23,37 @@ from src.utils.input_validation import (
 )
 from src.utils.logging_utils import get_logger, print_to_logger
 
+# twister本身会占满所有CPU，限制同时运行的数量；只有多个运行并发时才按运行数分配-j
+# twister already uses every core; cap concurrent runs and only split -j when runs overlap
+_CPU_COUNT = os.cpu_count() or 1
+_MAX_CONCURRENT_RUNS = max(1, _CPU_COUNT // 4)
+_TWISTER_SLOTS = threading.BoundedSemaphore(_MAX_CONCURRENT_RUNS)
+_ACTIVE_RUNS = 0
+_ACTIVE_RUNS_LOCK = threading.Lock()
+
+
+@contextmanager
+def _twister_slot():
+    """
+    Function Description: Hold a twister run slot and yield the -j value for this run
+    功能描述: 占用一个twister运行名额，并给出本次运行应使用的-j值
+
+    Returns:
+    返回值:
+    - Optional[int]: None when this is the only active run (twister uses every core), otherwise cores divided by active runs
+    - Optional[int]: 只有本次运行时为None（twister使用全部核心），否则为核心数除以当前运行数
+    """
+    global _ACTIVE_RUNS
+    with _TWISTER_SLOTS:
+        with _ACTIVE_RUNS_LOCK:
+            _ACTIVE_RUNS += 1
+            active = _ACTIVE_RUNS
+        try:
+            yield None if active == 1 else max(1, _CPU_COUNT // active)
+        finally:
+            with _ACTIVE_RUNS_LOCK:
+                _ACTIVE_RUNS -= 1
+
 
 def run_twister(
     platform: Optional[str] = None,
@@ -161,16 +193,28 @@ def run_twister(
             cmd.extend(extra_args_list)
             _dbg(f"[run_twister] Added extra args: {extra_args_list}")
 
-        _dbg(f"[run_twister] Final command: {' '.join(cmd)} (cwd={project_dir})")
+        jobs_given = any(arg.startswith("-j") or arg.startswith("--jobs") for arg in extra_args_list)
 
-        # 执行命令
-        process = subprocess.run(cmd, cwd=project_dir, capture_output=True, text=True, check=False)
-        _dbg(f"[run_twister] Command executed. Return code: {process.returncode}")
+        # 执行命令，输出逐行实时写入日志；统计解析需要完整输出，因此全部保留
+        with _twister_slot() as jobs:
+            # 与其他运行并发且未指定-j时，按当前运行数分配核心
+            if jobs is not None and not jobs_given:
+                cmd.extend(["-j", str(jobs)])
+                _dbg(f"[run_twister] Added jobs: {jobs}")
+            _dbg(f"[run_twister] Final command: {' '.join(cmd)} (cwd={project_dir})")
+            process = run_streamed(
+                cmd,
+                cwd=project_dir,
+                tail_lines=None,
+                on_output=lambda line: print_to_logger(logger, line),
+            )
+        returncode = process["returncode"]
+        _dbg(f"[run_twister] Command executed. Return code: {returncode}")
 
         # 解析输出，提取统计信息
-        stdout = process.stdout
-        stderr = process.stderr
-        _dbg(f"[run_twister] STDOUT:\n{stdout}")
+        stdout = process["stdout"]
+        stderr = process["stderr"]
+        debug.append(f"[run_twister] STDOUT:\n{stdout}")
         _dbg(f"[run_twister] STDERR:\n{stderr}")
 
         # 尝试从输出中提取测试统计信息
@@ -197,7 +241,7 @@ def run_twister(
                 stats[key] = int(match.group(1))
                 _dbg(f"[run_twister] {key}: {stats[key]}")
 
-        if process.returncode == 0:
+        if returncode == 0:
             _dbg("[run_twister] Twister run successful.")
             return {
                 "status": "success",
@@ -207,7 +251,7 @@ def run_twister(
                 "error": "",
             }
         else:
-            _dbg(f"[run_twister] Twister run failed with return code {process.returncode}.")
+            _dbg(f"[run_twister] Twister run failed with return code {returncode}.")
             return {
                 "status": "error",
                 "log": stdout,
@@ -69,6 +69,7 @@ from typing import Dict, Any, List, Optional
 
 from src.utils.logging_utils import get_logger
 from src.utils.common_tools import run_command
+from src.utils.venv_manager import get_tool_executable
 
 logger = get_logger(__name__)
 
@@ -1392,7 +1393,7 @@ def _get_environment_details(workspace_path: str) -> Dict[str, Any]:
         # Get West version
         try:
             west_version = subprocess.check_output(
-                ["west", "--version"], universal_newlines=True
+                [get_tool_executable("west"), "--version"], universal_newlines=True
             ).strip()
             details["west_version"] = west_version
         except:
@@ -1481,7 +1482,9 @@ def validate_zephyr_environment(workspace_path: str) -> Dict[str, Any]:
             try:
                 os.chdir(workspace_path)
                 subprocess.check_output(
-                    ["west", "list"], universal_newlines=True, stderr=subprocess.STDOUT
+                    [get_tool_executable("west"), "list"],
+                    universal_newlines=True,
+                    stderr=subprocess.STDOUT,
                 )
                 details["west_functionality"] = "working"
             except subprocess.CalledProcessError as e:
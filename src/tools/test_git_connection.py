@@ -8,11 +8,12 @@ Function Description: Test Git connection with provided credentials
 from __future__ import annotations
 
 import os
+import re
 import stat
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from urllib.parse import urlparse
 
 from src.utils.common_tools import check_tools
@@ -26,6 +27,9 @@ from src.utils.input_validation import (
 
 GIT_AUTH_HOSTS = {"github.com", "api.github.com"}
 
+# Git仓库URL格式，模块加载时编译一次 / Git repository URL format, compiled once at import
+_GIT_URL_RE = re.compile(r'^(https?|git)://[^\s/$.?#].[^\s]*$')
+
 
 def _create_askpass_script(username: str, password: str) -> tuple[str, dict[str, str]]:
     env = os.environ.copy()
@@ -66,6 +70,19 @@ def _create_askpass_script(username: str, password: str) -> tuple[str, dict[str,
 
 
 
+def validate_params(params: Dict[str, Any], get_text) -> Optional[str]:
+    """
+    Function Description: Check HTTP request parameters before test_git_connection runs
+    功能描述: 在执行test_git_connection前检查HTTP请求参数
+    """
+    if 'url' not in params:
+        return get_text('missing_required_param', 'url')
+    if not _GIT_URL_RE.match(params['url']):
+        return get_text('invalid_param_format', 'URL')
+    return None
+
+
+
 def test_git_connection(
     repo_url: str,
     username: str | None = None,
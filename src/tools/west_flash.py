@@ -5,9 +5,10 @@ Function Description: west flash tool for flashing firmware using west command
 功能描述: 使用 west 命令烧录固件的 west flash 工具
 """
 
+import os
 from typing import Dict, Any, Optional
-import subprocess
-from src.utils.common_tools import check_tools
+from src.utils.common_tools import check_tools, run_streamed
+from src.utils.venv_manager import get_tool_executable
 from src.utils.input_validation import (
     ValidationError,
     split_cli_args,
@@ -15,6 +16,25 @@ from src.utils.input_validation import (
     validate_simple_token,
 )
 
+# 完整输出写入的日志文件名，以及返回给调用方的输出末尾行数
+FLASH_LOG_NAME = "flash.log"
+FLASH_LOG_TAIL_LINES = 200
+
+
+def validate_params(params: Dict[str, Any], get_text) -> Optional[str]:
+    """
+    Function Description: Check HTTP request parameters before west_flash runs
+    功能描述: 在执行west_flash前检查HTTP请求参数
+
+    Returns:
+    返回值:
+    - Optional[str]: Localized error message, or None when the parameters are valid
+    - Optional[str]: 本地化的错误信息，参数有效时为None
+    """
+    if 'build_dir' not in params:
+        return get_text('parameter_required', 'west_flash', 'build_dir')
+    return None
+
 
 def west_flash(
     build_dir: str,
@@ -42,8 +62,8 @@ def west_flash(
 
     Returns:
     返回值:
-    - Dict[str, Any]: Contains status, log and error information
-    - Dict[str, Any]: 包含状态、日志和错误信息
+    - Dict[str, Any]: Contains status, log tail, error information and the path of the full log
+    - Dict[str, Any]: 包含状态、日志末尾、错误信息和完整日志路径
 
     Exception Handling:
     异常处理:
@@ -66,7 +86,7 @@ def west_flash(
         extra_args = split_cli_args(flash_extra_args, "flash_extra_args")
 
         # 构建west flash命令
-        cmd = ["west", "flash"]
+        cmd = [get_tool_executable("west"), "flash"]
 
         # 添加可选参数
         if board:
@@ -78,13 +98,20 @@ def west_flash(
         if extra_args:
             cmd.extend(extra_args)
 
-        # 执行命令
-        process = subprocess.run(cmd, cwd=build_dir, capture_output=True, text=True, check=False)
+        # 执行命令，完整输出写入build_dir/flash.log，返回值中只保留输出末尾
+        log_path = os.path.join(build_dir, FLASH_LOG_NAME)
+        process = run_streamed(cmd, cwd=build_dir, tail_lines=FLASH_LOG_TAIL_LINES, log_path=log_path)
 
-        if process.returncode == 0:
-            return {"status": "success", "log": process.stdout, "error": ""}
-        else:
-            return {"status": "error", "log": process.stdout, "error": process.stderr}
+        # 日志文件无法写入时log_path为None，并附带warning，不影响烧录
+        result = {
+            "status": "success" if process["returncode"] == 0 else "error",
+            "log": process["stdout"],
+            "error": "" if process["returncode"] == 0 else process["stderr"],
+            "log_path": process["log_path"],
+        }
+        if process["log_warning"]:
+            result["warning"] = process["log_warning"]
+        return result
     except ValidationError as e:
         return {"status": "error", "log": "", "error": str(e)}
     except Exception as e:
@@ -5,7 +5,7 @@ Function Description: Run west update command in Zephyr project directory
 功能描述: 在Zephyr项目目录中运行west update命令
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import os
 
 from src.utils.common_tools import check_tools
@@ -16,6 +16,21 @@ from src.utils.logging_utils import get_logger
 logger = get_logger(__name__)
 
 
+def validate_params(params: Dict[str, Any], get_text) -> Optional[str]:
+    """
+    Function Description: Check HTTP request parameters before west_update runs
+    功能描述: 在执行west_update前检查HTTP请求参数
+
+    Returns:
+    返回值:
+    - Optional[str]: Localized error message, or None when the parameters are valid
+    - Optional[str]: 本地化的错误信息，参数有效时为None
+    """
+    if 'project_dir' not in params:
+        return get_text('parameter_required', 'west_update', 'project_dir')
+    return None
+
+
 def west_update(project_dir: str) -> Dict[str, Any]:
     """
     Function Description: Run west update command in Zephyr project directory
@@ -5,8 +5,13 @@ Common utility functions for the project
 通用工具函数
 """
 
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
+from collections import deque
+import locale
+import shutil
 import subprocess
+import sys
+import threading
 import os
 import time
 import random
@@ -20,6 +25,11 @@ from src.utils.input_validation import (
 from src.utils.venv_manager import activate_venv
 
 
+# 已确认可用的工具；只缓存找到的结果，运行中安装的工具仍能被检测到
+# Tools already found on this process; misses are not cached so tools installed later are still detected
+_TOOL_CACHE: Dict[str, bool] = {}
+
+
 def check_tools(tools: list) -> Dict[str, bool]:
     """
     Check if specified tools are installed in the system
@@ -34,19 +44,28 @@ def check_tools(tools: list) -> Dict[str, bool]:
         Dict[str, bool]: 包含每个工具安装状态的字典
     """
     result = {}
-    activate_venv(True)
+    pending = [tool for tool in tools if tool not in _TOOL_CACHE]
+    if pending:
+        activate_venv(True)
     for tool in tools:
-        # Use 'where' on Windows, 'which' on other systems
-        # 在Windows上使用where，在其他系统上使用which
-        cmd = "where" if os.name == "nt" else "which"
-        try:
-            process = subprocess.run([cmd, tool], capture_output=True, text=True)
-            result[tool] = process.returncode == 0
-        except Exception:
-            result[tool] = False
+        if tool in _TOOL_CACHE:
+            result[tool] = True
+            continue
+        # PATH lookup without spawning which/where; also look next to the running
+        # interpreter, where get_tool_executable finds venv console scripts
+        # 直接查找PATH而不启动which/where进程；同时查找当前解释器所在目录，与get_tool_executable一致
+        result[tool] = (
+            shutil.which(tool) is not None
+            or shutil.which(tool, path=os.path.dirname(sys.executable)) is not None
+        )
+        if result[tool]:
+            _TOOL_CACHE[tool] = True
     return result
 
 
+check_tools.cache_clear = _TOOL_CACHE.clear
+
+
 def is_git_repository(project_dir: str) -> bool:
     """
     Check if the specified directory is a Git repository
@@ -172,7 +191,8 @@ def run_command(
 
     Supports bounded retries with exponential backoff for likely transient network
     errors. Timeouts are treated as transient and will also be retried when
-    ``retries`` is set.
+    ``retries`` is set. The child's stdin is /dev/null, so it cannot read the
+    server's stdio JSON-RPC stream or block waiting for input.
 
     Args:
         cmd (list): Command and its arguments list
@@ -250,6 +270,7 @@ def run_command(
                 cmd,
                 cwd=cwd,
                 env=env,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
@@ -328,6 +349,132 @@ def run_command(
     }
 
 
+def _decode_output(data: bytes) -> str:
+    """Decode child output like text=True would / 按text=True的方式解码子进程输出"""
+    text = data.decode(locale.getpreferredencoding(False), errors="replace")
+    return text.replace("\r\n", "\n")
+
+
+def _drain_lines(
+    stream,
+    tail: deque,
+    on_line: Optional[Callable[[str], None]] = None,
+    log_file=None,
+) -> None:
+    """Read a pipe to EOF keeping only the last lines / 读取管道直到EOF，仅保留最后若干行"""
+    with stream:
+        for line in stream:
+            tail.append(line)
+            if log_file is not None:
+                log_file.write(line)
+            if on_line is not None:
+                on_line(_decode_output(line))
+
+
+def run_streamed(
+    cmd: list,
+    cwd: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    tail_lines: Optional[int] = 2000,
+    on_output: Optional[Callable[[str], None]] = None,
+    log_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Execute a long-running command, keeping only the tail of its output.
+
+    Unlike run_command, output is consumed while the command runs and only the
+    last ``tail_lines`` lines of each stream are kept, so memory stays bounded
+    for builds and flashes that print a lot.
+    与run_command不同，命令运行期间持续读取输出，每个流只保留最后``tail_lines``行，
+    输出量大的编译和烧录也不会占用大量内存。
+
+    Args:
+        cmd (list): Command and its arguments list
+        cmd (list): 命令及其参数列表
+        cwd (Optional[str]): Working directory
+        cwd (Optional[str]): 工作目录
+        env (Optional[Dict[str, str]]): Environment variables
+        env (Optional[Dict[str, str]]): 环境变量
+        tail_lines (Optional[int]): Number of trailing lines kept per stream, None keeps all
+        tail_lines (Optional[int]): 每个流保留的末尾行数，为None时全部保留
+        on_output (Optional[Callable[[str], None]]): Called with each stdout line as it arrives
+        on_output (Optional[Callable[[str], None]]): 每读到一行标准输出即调用
+        log_path (Optional[str]): File that receives the complete stdout and stderr
+        log_path (Optional[str]): 写入完整标准输出和标准错误的文件
+
+    Returns:
+        Dict[str, Any]: status, returncode, stdout, stderr, log_path (None when no log
+            was written) and log_warning (why the log could not be written, or "")
+        Dict[str, Any]: 状态、返回码、标准输出、标准错误、log_path（未写日志时为None）
+            以及log_warning（日志无法写入的原因，否则为空字符串）
+    """
+    stdout_tail: deque = deque(maxlen=tail_lines)
+    stderr_tail: deque = deque(maxlen=tail_lines)
+    # The log file is optional: if it cannot be created the command still runs
+    # 日志文件是附加功能：无法创建时命令照常执行
+    log_file = None
+    log_warning = ""
+    if log_path:
+        try:
+            log_file = open(log_path, "wb")
+        except OSError as e:
+            log_path = None
+            log_warning = f"Could not write output log: {e}"
+    try:
+        try:
+            process = subprocess.Popen(
+                cmd,
+                cwd=cwd,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=65536,
+            )
+        except Exception as e:
+            return {
+                "status": "error",
+                "returncode": -1,
+                "stdout": "",
+                "stderr": str(e),
+                "log_path": log_path,
+                "log_warning": log_warning,
+            }
+
+        # stderr is drained on a helper thread so neither pipe can fill up and block the child
+        # 在辅助线程中读取stderr，避免任一管道写满导致子进程阻塞
+        stderr_reader = threading.Thread(
+            target=_drain_lines,
+            args=(process.stderr, stderr_tail, None, log_file),
+            daemon=True,
+        )
+        stderr_reader.start()
+        try:
+            _drain_lines(process.stdout, stdout_tail, on_output, log_file)
+        except BaseException:
+            # e.g. an on_output callback failed: stop the child so it and the stderr reader finish
+            # 例如on_output回调出错：结束子进程，使其和stderr读取线程都能退出
+            process.kill()
+            stderr_reader.join()
+            process.wait()
+            raise
+        stderr_reader.join()
+        returncode = process.wait()
+    finally:
+        if log_file is not None:
+            log_file.close()
+
+    # Lines are kept as bytes and only the retained tail is decoded
+    # 以字节保存各行，只解码最终保留的末尾部分
+    return {
+        "status": "success" if returncode == 0 else "error",
+        "returncode": returncode,
+        "stdout": _decode_output(b"".join(stdout_tail)),
+        "stderr": _decode_output(b"".join(stderr_tail)),
+        "log_path": log_path,
+        "log_warning": log_warning,
+    }
+
+
 def ensure_directory_exists(directory_path: str) -> bool:
     """
     Ensure directory exists, create if it doesn't
@@ -9,6 +9,7 @@ from typing import Dict, Any, Optional
 import os
 
 from src.utils.common_tools import run_command, format_error_message, is_git_repository
+from src.utils.venv_manager import get_tool_executable
 
 
 def _git_checkout_internal(project_dir: str, ref: str) -> Dict[str, Any]:
@@ -92,7 +93,7 @@ def _west_update_internal(project_dir: str) -> Dict[str, Any]:
     # Check if west tool is available
     # 检查west工具是否可用
     log.append("检查west工具是否可用...")
-    west_check_result = run_command(["west", "--version"], cwd=project_dir)
+    west_check_result = run_command([get_tool_executable("west"), "--version"], cwd=project_dir)
     if west_check_result["status"] != "success":
         return {
             "status": "error",
@@ -104,7 +105,7 @@ def _west_update_internal(project_dir: str) -> Dict[str, Any]:
     # 执行west update
     log.append("开始执行west update...")
     update_result = run_command(
-        ["west", "update"],
+        [get_tool_executable("west"), "update"],
         cwd=project_dir,
         retries=3,
         retry_backoff_seconds=2.0,
@@ -4,7 +4,11 @@
 语言资源模块 - 提供多语言支持
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
+
+from src.utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
 
 # 语言资源字典
 LANGUAGE_RESOURCES: Dict[str, Dict[str, Any]] = {
@@ -332,6 +336,9 @@ class LanguageManager:
     语言管理器类，用于处理多语言支持
     """
 
+    # 所有语言的资源表，模块导入时已加载到内存
+    _tables: Dict[str, Dict[str, Any]] = LANGUAGE_RESOURCES
+
     def __init__(self, language: str = "zh"):
         """
         初始化语言管理器
@@ -341,6 +348,8 @@ class LanguageManager:
         """
         self.language = language
         self.resources = LANGUAGE_RESOURCES.get(language, LANGUAGE_RESOURCES["zh"])
+        # 单槽缓存：最近一次查找的 (键, 模板)，作为一个元组整体替换，并发读取不会看到错配的键和值
+        self._slot = (None, None)
 
     def set_language(self, language: str):
         """
@@ -349,13 +358,17 @@ class LanguageManager:
         Args:
             language: 语言代码
         """
-        if language in LANGUAGE_RESOURCES:
-            self.language = language
-            self.resources = LANGUAGE_RESOURCES[language]
-        else:
+        if language not in LANGUAGE_RESOURCES:
             # 如果指定的语言不存在，使用中文作为默认语言
-            self.language = "zh"
-            self.resources = LANGUAGE_RESOURCES["zh"]
+            logger.warning("Unsupported language %r, falling back to zh", language)
+            logger.warning("不支持的语言 %r，使用中文", language)
+            language = "zh"
+        if language == self.language:
+            # 语言未变化，无需重新绑定资源表
+            return
+        self.language = language
+        self.resources = self._tables[language]
+        self._slot = (None, None)
 
     def get(self, key: str, *args, **kwargs) -> str:
         """
@@ -369,7 +382,35 @@ class LanguageManager:
         Returns:
             翻译后的文本
         """
-        text = self.resources.get(key, key)
+        slot = self._slot
+        if slot[0] is key:
+            # 同一个键连续查找（如循环中的日志）只做一次身份比较
+            text = slot[1]
+        else:
+            text = self.resources.get(key, key)
+            self._slot = (key, text)
+        if args or kwargs:
+            return text.format(*args, **kwargs)
+        return text
+
+    # language_manager的辅助函数按get_text调用，直接复用get的实现
+    get_text = get
+
+    def get_in(self, language: str, key: str, *args, **kwargs) -> str:
+        """
+        获取指定语言的翻译文本，不改变当前语言
+
+        Args:
+            language: 语言代码，不存在时使用中文
+            key: 资源键名
+            *args: 格式化参数
+            **kwargs: 格式化关键字参数
+
+        Returns:
+            翻译后的文本
+        """
+        table = self._tables.get(language, self._tables["zh"])
+        text = table.get(key, key)
         if args or kwargs:
             return text.format(*args, **kwargs)
         return text
@@ -412,6 +453,20 @@ def get_text(key: str, *args, **kwargs) -> str:
     return global_language_manager.get(key, *args, **kwargs)
 
 
+def get_texts(keys: Sequence[str]) -> Dict[str, str]:
+    """
+    一次获取多个未格式化的翻译文本
+
+    Args:
+        keys: 资源键名序列
+
+    Returns:
+        键名到翻译文本的字典
+    """
+    resources = global_language_manager.resources
+    return {key: resources.get(key, key) for key in keys}
+
+
 def set_language(language: str):
     """
     设置全局语言
@@ -10,17 +10,39 @@ configuration (no logging.basicConfig()).
 
 from __future__ import annotations
 
+import builtins
 import io
 from contextvars import ContextVar
 from contextlib import contextmanager
 import logging
 import os
+import sys
+import threading
 from pathlib import Path
 from typing import Any
 
 
 _DEBUG_BUFFER: ContextVar[list[str] | None] = ContextVar("zephyr_mcp_debug_buffer", default=None)
 
+# Per-context redirect targets. The process-wide sys.stdout/sys.stderr/print hooks
+# below look these up, so concurrent tool calls each write to their own logger.
+_STDIO_TARGET: ContextVar["tuple[StdioLoggerWriter, StdioLoggerWriter] | None"] = ContextVar(
+    "zephyr_mcp_stdio_target", default=None
+)
+_PRINT_TARGET: ContextVar[logging.Logger | None] = ContextVar("zephyr_mcp_print_target", default=None)
+
+# Process-wide targets for contexts without their own redirect, e.g. threads a tool starts
+# with plain threading.Thread (they do not inherit the ContextVars above). Only set while a
+# stdio transport owns the real stdout; see `protect_stdio_transport`.
+_STDIO_FALLBACK: "tuple[StdioLoggerWriter, StdioLoggerWriter] | None" = None
+_PRINT_FALLBACK: logging.Logger | None = None
+
+# The hooks are installed by the first active redirect and removed by the last one.
+_HOOK_LOCK = threading.Lock()
+_hook_users = 0
+_saved_hooks: tuple[Any, Any, Any] | None = None
+_fallback_print = builtins.print
+
 
 class _TruncatingListWriter(io.TextIOBase):
     def __init__(
@@ -168,6 +190,74 @@ class StdioLoggerWriter(io.TextIOBase):
         return len(s)
 
 
+class _ContextStream:
+    """Stand-in for sys.stdout/sys.stderr that forwards to the current context's writer.
+
+    Contexts without an active redirect (other threads, the server itself) write to the
+    process-wide fallback writer when a stdio transport is protected, otherwise to the
+    stream that was in place when the hooks were installed.
+
+    `buffer` outside a redirect always resolves to the original stream, because that is
+    where the stdio transport itself writes its messages.
+    """
+
+    def __init__(self, index: int, fallback: Any) -> None:
+        self._index = index
+        self._fallback = fallback
+
+    def _target(self) -> Any:
+        target = _STDIO_TARGET.get() or _STDIO_FALLBACK
+        return self._fallback if target is None else target[self._index]
+
+    @property
+    def buffer(self) -> Any:
+        target = _STDIO_TARGET.get()
+        return (self._fallback if target is None else target[self._index]).buffer
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return self._target().isatty()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+def _context_print(*args: Any, **kwargs: Any) -> None:
+    logger = _PRINT_TARGET.get() or _PRINT_FALLBACK
+    if logger is None:
+        return _fallback_print(*args, **kwargs)
+    return print_to_logger(logger, *args, **kwargs)
+
+
+@contextmanager
+def _context_hooks():
+    """Install the dispatching stdio/print hooks while at least one redirect is active."""
+
+    global _hook_users, _saved_hooks, _fallback_print
+
+    with _HOOK_LOCK:
+        if _hook_users == 0:
+            _saved_hooks = (sys.stdout, sys.stderr, builtins.print)
+            _fallback_print = builtins.print
+            sys.stdout = _ContextStream(0, sys.stdout)
+            sys.stderr = _ContextStream(1, sys.stderr)
+            builtins.print = _context_print
+        _hook_users += 1
+    try:
+        yield
+    finally:
+        with _HOOK_LOCK:
+            _hook_users -= 1
+            if _hook_users == 0 and _saved_hooks is not None:
+                sys.stdout, sys.stderr, builtins.print = _saved_hooks
+                _saved_hooks = None
+
+
 @contextmanager
 def redirect_stdio_to_logger(
     logger: logging.Logger,
@@ -178,34 +268,77 @@ def redirect_stdio_to_logger(
     stdout_prefix: str = "STDOUT: ",
     stderr_prefix: str = "STDERR: ",
 ):
-    """Temporarily redirect `sys.stdout`/`sys.stderr` to the provided `logger`.
+    """Redirect `sys.stdout`/`sys.stderr` to the provided `logger` for the current context.
 
     This ensures accidental writes to stdout/stderr do not leak to transports (e.g. MCP stdio),
     while still recording the messages to the repo log files and (when debug capture is enabled)
     returning them to callers.
-    """
 
-    import sys
+    The redirect is context-local: concurrent tool calls on other threads keep their own
+    targets, and code outside any redirect still reaches the real streams.
+    """
 
-    old_stdout = sys.stdout
-    old_stderr = sys.stderr
-    sys.stdout = StdioLoggerWriter(
-        logger,
-        level=stdout_level,
-        prefix=stdout_prefix,
-        strict=strict,
-    )
-    sys.stderr = StdioLoggerWriter(
-        logger,
-        level=stderr_level,
-        prefix=stderr_prefix,
-        strict=strict,
+    writers = (
+        StdioLoggerWriter(
+            logger,
+            level=stdout_level,
+            prefix=stdout_prefix,
+            strict=strict,
+        ),
+        StdioLoggerWriter(
+            logger,
+            level=stderr_level,
+            prefix=stderr_prefix,
+            strict=strict,
+        ),
     )
-    try:
-        yield
-    finally:
-        sys.stdout = old_stdout
-        sys.stderr = old_stderr
+    with _context_hooks():
+        token = _STDIO_TARGET.set(writers)
+        try:
+            yield
+        finally:
+            _STDIO_TARGET.reset(token)
+
+
+@contextmanager
+def redirect_print_to_logger(logger: logging.Logger):
+    """Route `print()` calls made in the current context to `logger` via `print_to_logger`.
+
+    Like `redirect_stdio_to_logger`, this is context-local and safe to use from
+    concurrent threads.
+    """
+
+    with _context_hooks():
+        token = _PRINT_TARGET.set(logger)
+        try:
+            yield
+        finally:
+            _PRINT_TARGET.reset(token)
+
+
+@contextmanager
+def protect_stdio_transport(logger: logging.Logger):
+    """Keep stray stdout/stderr/print output off a stdio transport for the whole server run.
+
+    Per-call redirects only cover the context a tool runs in. Output from threads the tool
+    starts itself, or from code running between calls, goes to `logger` instead of the
+    real stdout, which carries the JSON-RPC stream. These writes are only logged, never
+    rejected, since raising in an unrelated thread would not reach the tool's caller.
+    """
+
+    global _STDIO_FALLBACK, _PRINT_FALLBACK
+
+    with _context_hooks():
+        saved = (_STDIO_FALLBACK, _PRINT_FALLBACK)
+        _STDIO_FALLBACK = (
+            StdioLoggerWriter(logger, level=logging.INFO, prefix="STDOUT: ", strict=False),
+            StdioLoggerWriter(logger, level=logging.ERROR, prefix="STDERR: ", strict=False),
+        )
+        _PRINT_FALLBACK = logger
+        try:
+            yield
+        finally:
+            _STDIO_FALLBACK, _PRINT_FALLBACK = saved
 
 
 @contextmanager
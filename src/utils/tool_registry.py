@@ -6,9 +6,12 @@ Tool Registry Module - For managing and registering Zephyr MCP tools to agno age
 """
 
 import os
+import sys
 import importlib
 import inspect
 import re
+import subprocess
+import traceback
 
 from typing import Dict, Any, List, Optional
 from src.utils.tool_wrapper import create_agno_tool, ToolWrapper    
@@ -16,6 +19,29 @@ from src.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+
+def _inject_runtime_globals(func: Any) -> None:
+    """
+    Make the modules tools rely on available in the tool function's globals
+    将工具依赖的模块注入工具函数的全局命名空间
+
+    Done once at registration time instead of on every HTTP request.
+    在注册时执行一次，而不是在每个HTTP请求中执行。
+
+    Args:
+        func: Registered tool function
+        func: 已注册的工具函数
+    """
+    func_globals = getattr(func, "__globals__", None)
+    if func_globals is None:
+        return
+    func_globals.setdefault("subprocess", subprocess)
+    func_globals.setdefault("sys", sys)
+    func_globals.setdefault("os", os)
+    func_globals.setdefault("importlib", importlib)
+    func_globals.setdefault("traceback", traceback)
+
+
 class ToolRegistry:
     """
     Tool Registry, for managing and registering tools
@@ -36,6 +62,8 @@ class ToolRegistry:
         self.loaded_modules: Dict[str, Any] = {}
         # Store tool metadata
         self.tool_metadata: Dict[str, Dict[str, Any]] = {}  # 存储工具元数据
+        # Precomputed tool summaries for the HTTP API, rebuilt after registry changes
+        self._tools_info: Optional[List[Dict[str, Any]]] = None  # 预计算的工具摘要
 
     def discover_tools(self, include_hidden: bool = False) -> List[str]:
         """
@@ -127,8 +155,12 @@ class ToolRegistry:
 
         # 如果没有找到，尝试查找所有公共函数
         for name, obj in inspect.getmembers(module):
-            # 排除以下划线开头的私有/特殊属性
-            if not name.startswith("_") and name != "mcp" and not inspect.ismodule(obj):
+            # 排除以下划线开头的私有/特殊属性，以及参数验证钩子
+            if (
+                not name.startswith("_")
+                and name not in ("mcp", "validate_params")
+                and not inspect.ismodule(obj)
+            ):
                 # 检查是否是函数或可调用对象
                 if inspect.isfunction(obj) or callable(obj):
                     tools[name] = obj
@@ -161,6 +193,10 @@ class ToolRegistry:
             Dictionary mapping function names to registration status
             函数名到注册状态的映射字典
         """
+        # Registry is about to change, drop the precomputed summaries
+        # 注册表即将变化，丢弃预计算的摘要
+        self._tools_info = None
+
         # Load tool module
         # 加载工具模块
         module = self.load_tool_module(tool_name)
@@ -185,7 +221,11 @@ class ToolRegistry:
                         "original_name": tool_name,
                         "parameters": [],  # 添加parameters字段
                         "returns": [],  # 添加returns字段以避免警告
+                        # Optional HTTP parameter check defined by the tool module
+                        # 工具模块定义的可选HTTP参数检查
+                        "validator": getattr(module, "validate_params", None),
                     }
+                    _inject_runtime_globals(direct_func)
 
                     # Store metadata
                     # 存储元数据
@@ -238,7 +278,11 @@ class ToolRegistry:
                         "original_name": func_name,
                         "parameters": [],  # 添加parameters字段
                         "returns": [],  # 添加returns字段
+                        # Optional HTTP parameter check defined by the tool module
+                        # 工具模块定义的可选HTTP参数检查
+                        "validator": getattr(module, "validate_params", None),
                     }
+                    _inject_runtime_globals(actual_func)
 
                     # 存储元数据
                     self.tool_metadata[reg_name] = {
@@ -312,6 +356,10 @@ class ToolRegistry:
             total_tools - success_tools,
         )
 
+        # Build the tool summaries once now that registration is complete
+        # 注册完成后一次性构建工具摘要
+        self.get_tools_info()
+
         return results
 
     def get_registered_tools(self) -> Dict[str, Dict[str, Any]]:
@@ -325,6 +373,32 @@ class ToolRegistry:
         """
         return self.registry.copy()
 
+    def get_tools_info(self) -> List[Dict[str, Any]]:
+        """
+        Get the tool summaries served by the HTTP API
+        获取HTTP API返回的工具摘要
+
+        The list is built once and reused until the registry changes;
+        callers must not modify it.
+        列表只构建一次，注册表变化前一直复用，调用方不应修改。
+
+        Returns:
+            List of tool summaries (name, description, parameters, returns, module)
+            工具摘要列表（名称、描述、参数、返回值、模块）
+        """
+        if self._tools_info is None:
+            self._tools_info = [
+                {
+                    "name": tool_name,
+                    "description": str(tool_info.get("description", "")),
+                    "parameters": tool_info.get("parameters", []),
+                    "returns": tool_info.get("returns", []),
+                    "module": str(tool_info.get("module", "")),
+                }
+                for tool_name, tool_info in self.registry.items()
+            ]
+        return self._tools_info
+
     def get_tool_by_name(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """
         Get tool by name
@@ -5,6 +5,8 @@ venv_manager.py - Virtual Environment Manager
 venv_manager.py - 虚拟环境管理器
 """
 
+import os
+import shutil
 import sys
 import subprocess
 import platform
@@ -14,6 +16,10 @@ from src.utils.logging_utils import get_logger, print_to_logger
 
 logger = get_logger(__name__)
 
+# 依赖检查通过后模块已在sys.modules中，不会再变为缺失，之后的检查直接返回
+# Once the dependency check passes the modules stay importable, so later checks short-circuit
+_DEPENDENCIES_OK = False
+
 
 def _eprint(*args, **kwargs):
     """Print to stderr (avoid corrupting stdio JSON-RPC)."""
@@ -92,6 +98,35 @@ def get_venv_python_path(venv_path):
     return python_exe if python_exe.exists() else None
 
 
+# 已找到的工具路径；只缓存找到的结果，运行中安装到虚拟环境的工具仍能被找到
+# Resolved tool paths; misses are not cached so tools installed later are still found
+_TOOL_PATHS: dict = {}
+
+
+def get_tool_executable(tool: str) -> str:
+    """Resolve a console script once, preferring the running interpreter's bin dir
+    解析一次命令行工具路径，优先使用当前解释器所在的bin目录
+
+    Tools such as west are installed next to the venv Python, so they are found
+    there even when the venv was never activated in the calling shell. Falls back
+    to PATH, then to the bare name. Only found paths are cached.
+    west等工具安装在虚拟环境Python同一目录下，即使调用方shell未激活虚拟环境也能找到；
+    否则回退到PATH查找，最后返回原名称。只缓存找到的路径。
+    """
+    found = _TOOL_PATHS.get(tool)
+    if found is not None:
+        return found
+    bin_dir = os.path.dirname(sys.executable)
+    found = shutil.which(tool, path=bin_dir) or shutil.which(tool)
+    if found is None:
+        return tool
+    _TOOL_PATHS[tool] = found
+    return found
+
+
+get_tool_executable.cache_clear = _TOOL_PATHS.clear
+
+
 def activate_venv(allow_restart: bool = True):
     """Activate virtual environment if not already active
     如果虚拟环境未激活，则激活它"""
@@ -205,6 +240,10 @@ def check_venv_dependencies():
         _eprint("[Venv] 无法检查依赖: 虚拟环境未激活")
         return False
 
+    global _DEPENDENCIES_OK
+    if _DEPENDENCIES_OK:
+        return True
+
     import importlib
 
     # Map pip package name -> Python import module
@@ -231,6 +270,7 @@ def check_venv_dependencies():
 
     _eprint("[Venv] All required dependencies are available")
     _eprint("[Venv] 所有必需的依赖都可用")
+    _DEPENDENCIES_OK = True
     return True
 
 
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+agent_core工具注册单元测试
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import agent_core
+
+
+def _probe_with(add_tool):
+    agent_cls = type("ProbeAgent", (), {"add_tool": add_tool})
+    with mock.patch.object(agent_core, "Agent", agent_cls):
+        return agent_core._probe_add_tool_kwargs()
+
+
+class TestProbeAddToolKwargs(unittest.TestCase):
+    """测试add_tool签名检查"""
+
+    def test_kwargs_only_signature(self):
+        """只接受关键字字段的add_tool可跳过Tool包装"""
+        self.assertTrue(_probe_with(lambda self, **kwargs: None))
+
+    def test_required_tool_argument(self):
+        """add_tool(self, tool, **kwargs)仍需要tool参数，不能只传字段"""
+        self.assertFalse(_probe_with(lambda self, tool, **kwargs: None))
+
+    def test_named_fields_signature(self):
+        """显式列出所有字段的add_tool也可直接传字段"""
+        self.assertTrue(
+            _probe_with(
+                lambda self, name, description, function, parameters=None, returns=None: None
+            )
+        )
+
+
+class TestRegisterOne(unittest.TestCase):
+    """测试两种注册方式保存的值一致"""
+
+    def setUp(self):
+        self.tool_info = {
+            "name": "echo",
+            "description": "echo tool",
+            "function": print,
+            "parameters": [],
+            "returns": {},
+        }
+
+    def test_both_paths_store_registry_entry(self):
+        """无论是否经过Tool包装，都保存注册表条目"""
+        registered = []
+        direct = agent_core._register_one(None, lambda **fields: registered.append(fields), self.tool_info)
+        wrapped = agent_core._register_one(agent_core.Tool, registered.append, self.tool_info)
+
+        self.assertIs(direct, self.tool_info)
+        self.assertIs(wrapped, self.tool_info)
+        self.assertEqual(registered[0]["name"], "echo")
+        self.assertEqual(registered[1].name, "echo")
+
+
+if __name__ == "__main__":
+    unittest.main()
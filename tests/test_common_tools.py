@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+通用工具函数单元测试
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import common_tools
+
+
+class TestRunStreamed(unittest.TestCase):
+    """测试run_streamed的输出末尾保留"""
+
+    def test_keeps_only_tail_lines(self):
+        """只保留每个流的最后若干行"""
+        script = (
+            "import sys\n"
+            "for i in range(5000):\n"
+            "    print(i)\n"
+            "    print('e%d' % i, file=sys.stderr)\n"
+        )
+        result = common_tools.run_streamed([sys.executable, "-c", script], tail_lines=3)
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["returncode"], 0)
+        self.assertEqual(result["stdout"], "4997\n4998\n4999\n")
+        self.assertEqual(result["stderr"], "e4997\ne4998\ne4999\n")
+
+    def test_on_output_sees_every_line(self):
+        """on_output按顺序收到每一行，tail_lines为None时保留全部输出"""
+        seen = []
+        script = "for i in range(100):\n    print(i)\n"
+        result = common_tools.run_streamed(
+            [sys.executable, "-c", script], tail_lines=None, on_output=seen.append
+        )
+
+        expected = [f"{i}\n" for i in range(100)]
+        self.assertEqual(seen, expected)
+        self.assertEqual(result["stdout"], "".join(expected))
+
+    def test_crlf_output_is_normalised(self):
+        """与text=True一致，\\r\\n转换为\\n"""
+        script = "import sys\nsys.stdout.buffer.write(b'a\\r\\nb\\r\\n')\n"
+        result = common_tools.run_streamed([sys.executable, "-c", script])
+
+        self.assertEqual(result["stdout"], "a\nb\n")
+
+    def test_log_path_receives_full_output(self):
+        """log_path保存完整输出，返回值只含末尾"""
+        script = "for i in range(1000):\n    print(i)\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = os.path.join(tmp, "run.log")
+            result = common_tools.run_streamed(
+                [sys.executable, "-c", script], tail_lines=2, log_path=log_path
+            )
+            with open(log_path, "r", encoding="utf-8") as f:
+                full = f.read()
+
+        self.assertEqual(result["stdout"], "998\n999\n")
+        self.assertEqual(full.split(), [str(i) for i in range(1000)])
+
+    def test_child_stdin_is_empty(self):
+        """子进程读取stdin时立即得到EOF"""
+        script = "import sys\nprint(repr(sys.stdin.read()))\n"
+        result = common_tools.run_streamed([sys.executable, "-c", script])
+
+        self.assertEqual(result["stdout"], "''\n")
+
+    def test_unwritable_log_path_still_runs_command(self):
+        """日志文件无法创建时命令照常执行，log_path为None并给出警告"""
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = os.path.join(tmp, "missing", "run.log")
+            result = common_tools.run_streamed(
+                [sys.executable, "-c", "print('flashed')"], log_path=log_path
+            )
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["stdout"], "flashed\n")
+        self.assertIsNone(result["log_path"])
+        self.assertTrue(result["log_warning"])
+
+    def test_callback_error_kills_child(self):
+        """on_output抛出异常时结束子进程并向上抛出"""
+        script = "import time\nprint('start', flush=True)\ntime.sleep(60)\n"
+        started = []
+        popen = common_tools.subprocess.Popen
+
+        def spy(*args, **kwargs):
+            started.append(popen(*args, **kwargs))
+            return started[-1]
+
+        def fail(line):
+            raise ValueError(line)
+
+        with mock.patch.object(common_tools.subprocess, "Popen", side_effect=spy):
+            with self.assertRaises(ValueError):
+                common_tools.run_streamed([sys.executable, "-c", script], on_output=fail)
+
+        self.assertIsNotNone(started[0].returncode)
+
+    def test_failure_reports_returncode(self):
+        """非零退出码返回error状态"""
+        result = common_tools.run_streamed([sys.executable, "-c", "raise SystemExit(3)"])
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["returncode"], 3)
+
+    def test_missing_executable(self):
+        """命令无法启动时返回error而不是抛出异常"""
+        result = common_tools.run_streamed(["definitely-not-a-real-command-xyz"])
+
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["returncode"], -1)
+
+
+class TestCheckTools(unittest.TestCase):
+    """测试check_tools的结果缓存"""
+
+    def setUp(self):
+        common_tools.check_tools.cache_clear()
+        patcher = mock.patch.object(common_tools, "activate_venv")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(common_tools.check_tools.cache_clear)
+
+    def test_found_tool_is_probed_once(self):
+        """找到的工具只探测一次"""
+        with mock.patch.object(common_tools.shutil, "which", wraps=common_tools.shutil.which) as which:
+            first = common_tools.check_tools(["python3"])
+            second = common_tools.check_tools(["python3"])
+
+        self.assertEqual(first, {"python3": True})
+        self.assertEqual(second, {"python3": True})
+        self.assertEqual(which.call_count, 1)
+
+    def test_missing_tool_is_not_cached(self):
+        """未找到的工具每次重新检测"""
+        name = "definitely-not-a-real-command-xyz"
+        with mock.patch.object(common_tools.shutil, "which", wraps=common_tools.shutil.which) as which:
+            self.assertEqual(common_tools.check_tools([name]), {name: False})
+            self.assertEqual(common_tools.check_tools([name]), {name: False})
+
+        # PATH和解释器目录各查找一次 / once on PATH and once in the interpreter's directory
+        self.assertEqual(which.call_count, 4)
+
+    def test_does_not_spawn_processes(self):
+        """检测工具时不启动子进程"""
+        with mock.patch.object(common_tools.subprocess, "run") as run:
+            common_tools.check_tools(["python3", "definitely-not-a-real-command-xyz"])
+
+        run.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+配置管理模块单元测试
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config_manager
+
+
+class TestLoadConfigCache(unittest.TestCase):
+    """测试load_config的文件戳缓存"""
+
+    def setUp(self):
+        config_manager._CONFIG_CACHE.clear()
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"agent_name": "cached", "port": 9000}, f)
+
+    def tearDown(self):
+        config_manager._CONFIG_CACHE.clear()
+        os.remove(self.path)
+
+    def test_unchanged_file_is_parsed_once(self):
+        """文件未变化时只解析一次"""
+        with mock.patch.object(
+            config_manager, "_json_loads", wraps=config_manager._json_loads
+        ) as mock_load:
+            first = config_manager.load_config(self.path)
+            second = config_manager.load_config(self.path)
+
+        self.assertEqual(mock_load.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first["agent_name"], "cached")
+
+    def test_returned_config_is_independent_copy(self):
+        """修改返回值不影响缓存"""
+        first = config_manager.load_config(self.path)
+        first["agent_name"] = "mutated"
+        first["llm"]["enabled"] = True
+
+        second = config_manager.load_config(self.path)
+        self.assertEqual(second["agent_name"], "cached")
+        self.assertFalse(second["llm"]["enabled"])
+
+    def test_save_config_invalidates_cache(self):
+        """保存配置后重新加载新内容"""
+        config = config_manager.load_config(self.path)
+        config["port"] = 9100
+        self.assertTrue(config_manager.save_config(config, self.path))
+
+        self.assertEqual(config_manager.load_config(self.path)["port"], 9100)
+
+
+class TestSaveConfig(unittest.TestCase):
+    """测试save_config的原子写入"""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"agent_name": "original"}, f)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_failed_save_keeps_original_file(self):
+        """序列化失败时原文件保持不变且不留临时文件"""
+        with open(self.path, "rb") as f:
+            before = f.read()
+
+        self.assertFalse(config_manager.save_config({"bad": object()}, self.path))
+
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(), before)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+
+class TestValidateAndCompleteConfig(unittest.TestCase):
+    """测试配置补全"""
+
+    def test_input_is_not_mutated(self):
+        """补全返回新字典，不修改传入的配置"""
+        config = {"agent_name": "custom"}
+        completed = config_manager.validate_and_complete_config(config)
+
+        self.assertEqual(config, {"agent_name": "custom"})
+        self.assertEqual(completed["agent_name"], "custom")
+        self.assertEqual(completed["port"], 8001)
+
+    def test_defaults_are_not_shared(self):
+        """修改补全结果不影响之后的默认值"""
+        first = config_manager.validate_and_complete_config({})
+        first["llm"]["enabled"] = True
+
+        second = config_manager.validate_and_complete_config({})
+        self.assertFalse(second["llm"]["enabled"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GitSession单元测试
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from check.git_session import GitSession
+
+
+@unittest.skipUnless(shutil.which("git"), "需要git")
+class TestReadObject(unittest.TestCase):
+    """测试read_object的头部解析"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.repo = tmp.name
+        subprocess.run(["git", "init", "-q", self.repo], check=True)
+        with open(os.path.join(self.repo, "a b.txt"), "w", encoding="utf-8") as f:
+            f.write("hello\n")
+        subprocess.run(["git", "add", "a b.txt"], cwd=self.repo, check=True)
+
+    def test_existing_path_with_space(self):
+        """读取带空格路径的暂存对象"""
+        with GitSession(self.repo) as session:
+            obj = session.read_object(":0:a b.txt")
+
+        self.assertEqual(obj[1], "blob")
+        self.assertEqual(obj[2], b"hello\n")
+
+    def test_missing_path_with_space(self):
+        """带空格路径的缺失对象返回None而不是抛出异常"""
+        with GitSession(self.repo) as session:
+            self.assertIsNone(session.read_object(":1:a b"))
+            # 会话仍可继续使用
+            self.assertIsNotNone(session.read_object(":0:a b.txt"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP服务器辅助函数单元测试
+"""
+
+import os
+import sys
+import builtins
+import asyncio
+import concurrent.futures
+import contextlib
+import http.client
+import io
+import logging
+import threading
+import unittest
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import http_server
+from src.utils import logging_utils
+
+
+class TestRequestLanguage(unittest.TestCase):
+    """测试Accept-Language解析"""
+
+    def test_highest_quality_language_wins(self):
+        """选择q值最高的受支持语言，q值相同时取先列出的"""
+        self.assertEqual(http_server._request_language("en-US,zh;q=0.9", "zh"), "en")
+        self.assertEqual(http_server._request_language("fr, zh-CN;q=0.8", "en"), "zh")
+        self.assertEqual(http_server._request_language("ZH-cn", "en"), "zh")
+        self.assertEqual(http_server._request_language("en-US;q=0.1,zh-CN;q=0.9", "en"), "zh")
+
+    def test_unsupported_language_uses_default(self):
+        """没有受支持的语言标签时使用默认语言"""
+        self.assertEqual(http_server._request_language("", "en"), "en")
+        self.assertEqual(http_server._request_language("fr-FR,de", "zh"), "zh")
+        self.assertEqual(http_server._request_language("seven", "zh"), "zh")
+        self.assertEqual(http_server._request_language("en;q=0", "zh"), "zh")
+        self.assertEqual(http_server._request_language("eng", "zh"), "zh")
+
+
+class _FakeAgent:
+    """只提供参数验证所需属性的最小Agent"""
+
+    logger = logging.getLogger("test_http_server")
+
+    def get_text(self, key, *args):
+        return ":".join([key] + [str(arg) for arg in args])
+
+
+class TestCheckRequestParams(unittest.TestCase):
+    """测试按工具注册的参数验证器"""
+
+    def setUp(self):
+        self.agent = _FakeAgent()
+        self.tools = {
+            "plain": {"function": print},
+            "needs_dir": {
+                "function": print,
+                "validator": lambda params, get_text: (
+                    None if "dir" in params else get_text("missing_required_param", "dir")
+                ),
+            },
+        }
+
+    def test_unknown_tool(self):
+        """未注册的工具返回404"""
+        error = http_server._check_request_params(self.agent, "nope", {}, self.tools)
+        self.assertEqual(error, (404, "tool_not_found:nope"))
+
+    def test_validator_result_is_used(self):
+        """验证器返回的错误信息作为400响应"""
+        check = http_server._check_request_params
+        self.assertEqual(check(self.agent, "needs_dir", {}, self.tools),
+                         (400, "missing_required_param:dir"))
+        self.assertIsNone(check(self.agent, "needs_dir", {"dir": "."}, self.tools))
+        self.assertIsNone(check(self.agent, "plain", {}, self.tools))
+
+
+class TestInvokeToolConcurrency(unittest.TestCase):
+    """测试并发工具调用时print/stdio重定向互不干扰"""
+
+    def test_concurrent_calls_keep_their_own_print(self):
+        """两个重叠的调用各自记录自己的输出，结束后恢复print和stdio"""
+        agent = _FakeAgent()
+        barrier = threading.Barrier(2)
+        original = (builtins.print, sys.stdout, sys.stderr)
+        results = {}
+
+        def make_tool(name):
+            def tool():
+                barrier.wait()
+                print(f"hello from {name}")
+                barrier.wait()
+                return {"name": name}
+            return tool
+
+        def call(name):
+            results[name] = http_server._invoke_tool(
+                agent, name, make_tool(name), {}, "trace", []
+            )
+
+        threads = [threading.Thread(target=call, args=(name,)) for name in ("first", "second")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual((builtins.print, sys.stdout, sys.stderr), original)
+        for name, other in (("first", "second"), ("second", "first")):
+            debug = "\n".join(results[name]["debug"])
+            self.assertIn(f"hello from {name}", debug)
+            self.assertNotIn(f"hello from {other}", debug)
+
+    def test_pool_worker_is_clean_after_tool(self):
+        """线程池复用工作线程时，工具结束后该线程的print不再进入工具日志"""
+        agent = _FakeAgent()
+        barrier = threading.Barrier(2)
+        debugs = []
+
+        def tool():
+            barrier.wait()
+            print("inside tool")
+            return {}
+
+        def call():
+            debug = []
+            debugs.append(debug)
+            http_server._invoke_tool(agent, "pooled", tool, {}, "trace", debug)
+
+        def plain_print():
+            out = io.StringIO()
+            print("outside tool", file=out)
+            return out.getvalue()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+            for future in [pool.submit(call), pool.submit(call)]:
+                future.result()
+            outputs = [pool.submit(plain_print).result() for _ in range(2)]
+
+        self.assertEqual(outputs, ["outside tool\n"] * 2)
+        for debug in debugs:
+            self.assertIn("inside tool", "\n".join(debug))
+            self.assertNotIn("outside tool", "\n".join(debug))
+
+
+class TestStdioTransportGuard(unittest.TestCase):
+    """测试工具自行启动的线程不会写入stdio传输通道"""
+
+    def test_spawned_thread_output_stays_off_stdout(self):
+        """普通threading.Thread不继承ContextVar，其输出应进入后备日志而非真实stdout"""
+        agent = _FakeAgent()
+        real_stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+        logger = logging.getLogger("test_http_server.stdio_guard")
+        logger.propagate = False
+
+        def tool():
+            def worker():
+                print("print from worker")
+                sys.stdout.write("write from worker\n")
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            return {}
+
+        saved_stdout = sys.stdout
+        sys.stdout = real_stdout
+        try:
+            with self.assertLogs(logger, level="INFO") as logs:
+                with logging_utils.protect_stdio_transport(logger):
+                    http_server._invoke_tool(agent, "spawner", tool, {}, "trace", [])
+                    # 传输层自身仍通过buffer写入真实stdout
+                    # The transport itself still writes to the real stdout via buffer
+                    self.assertIs(sys.stdout.buffer, real_stdout.buffer)
+        finally:
+            sys.stdout = saved_stdout
+
+        real_stdout.flush()
+        self.assertEqual(real_stdout.buffer.getvalue(), b"")
+        output = "\n".join(logs.output)
+        self.assertIn("print from worker", output)
+        self.assertIn("write from worker", output)
+
+
+class _FakeRegistry:
+    """固定工具集的注册表"""
+
+    def __init__(self, tools):
+        self._tools = tools
+
+    def get_registered_tools(self):
+        return self._tools
+
+    def get_tools_info(self):
+        return [{"name": name} for name in sorted(self._tools)]
+
+
+class _ServerAgent(_FakeAgent):
+    """启动HTTP后端所需的Agent"""
+
+    config = {}
+    current_language = "zh"
+
+    def __init__(self):
+        self.tool_registry = _FakeRegistry({"echo": {"function": lambda **params: params}})
+
+
+class _RecordingSpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes or {})
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class _RecordingOtel:
+    """记录所有span的OpenTelemetryManager替身"""
+
+    spans = []
+
+    def __init__(self, config, logger):
+        pass
+
+    def is_enabled(self):
+        return True
+
+    @contextlib.contextmanager
+    def span(self, name, attributes=None):
+        span = _RecordingSpan(name, attributes)
+        self.spans.append(span)
+        yield span
+
+
+# 两个后端各自执行的请求：(方法, 路径, 请求头)
+_PARITY_REQUESTS = [
+    ("GET", "/api/tools", {}),
+    ("GET", "/api/docs", {"Accept-Language": "en"}),
+    ("GET", "/api/tool/info?name=echo", {}),
+    ("GET", "/api/tool/info/extra?name=echo", {}),
+    ("GET", "/api/tool/info?name=missing", {"X-Trace-ID": "t-1"}),
+    ("GET", "/api/unknown", {"X-Trace-ID": "t-2"}),
+]
+
+
+@unittest.skipIf(http_server.web is None, "aiohttp未安装")
+class TestBackendParity(unittest.TestCase):
+    """测试aiohttp后端与线程服务器的路由、ETag协商和span一致"""
+
+    def setUp(self):
+        _RecordingOtel.spans = []
+        patcher = mock.patch.object(http_server, "OpenTelemetryManager", _RecordingOtel)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.agent = _ServerAgent()
+
+    @staticmethod
+    def revalidation_requests(requests, results):
+        """带上首次响应ETag的同一组请求"""
+        return [
+            (method, path, dict(headers, **{"If-None-Match": etag}))
+            for (method, path, headers), (_, etag, _) in zip(requests, results)
+        ]
+
+    def threaded_responses(self, requests, revalidate=False):
+        agent = self.agent
+        server = http.server.ThreadingHTTPServer(
+            ("127.0.0.1", 0), lambda *args: http_server.JSONToolHandler(*args, agent=agent)
+        )
+        server.agent = agent
+        server.registered_tools = agent.tool_registry.get_registered_tools()
+        server.tools_cache = None
+        server.docs_cache = {}
+        server.otel_manager = _RecordingOtel(agent.config, agent.logger)
+        server.otel_enabled = True
+        self.address = server.server_address
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            def send(requests):
+                results = []
+                for method, path, headers in requests:
+                    conn = http.client.HTTPConnection(*server.server_address)
+                    conn.request(method, path, headers=headers)
+                    response = conn.getresponse()
+                    results.append((response.status, response.getheader("ETag"), response.read()))
+                    conn.close()
+                return results
+
+            results = send(requests)
+            if revalidate:
+                results = send(self.revalidation_requests(requests, results))
+            return results
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def aiohttp_responses(self, requests, revalidate=False):
+        from aiohttp.test_utils import TestClient, TestServer
+
+        async def run():
+            # 与线程服务器使用相同地址，/api/docs中的示例URL一致
+            app = http_server._create_aiohttp_app(self.agent, *self.address)
+            async with TestClient(TestServer(app)) as client:
+                async def send(requests):
+                    results = []
+                    for method, path, headers in requests:
+                        response = await client.request(method, path, headers=headers)
+                        results.append((response.status, response.headers.get("ETag"), await response.read()))
+                    return results
+
+                results = await send(requests)
+                if revalidate:
+                    results = await send(self.revalidation_requests(requests, results))
+                return results
+
+        return asyncio.run(run())
+
+    def spans(self):
+        spans = [(span.name, span.attributes.get("endpoint"), span.attributes.get("http.status_code"))
+                 for span in _RecordingOtel.spans]
+        _RecordingOtel.spans = []
+        return spans
+
+    def test_same_responses_and_spans(self):
+        """相同请求在两个后端得到相同的状态码、ETag、响应体和span"""
+        threaded = self.threaded_responses(_PARITY_REQUESTS)
+        threaded_spans = self.spans()
+        aio = self.aiohttp_responses(_PARITY_REQUESTS)
+        self.assertEqual(aio, threaded)
+        self.assertEqual(self.spans(), threaded_spans)
+        self.assertEqual(threaded_spans[3], ("HTTP_GET", "api_tool_info", 200))
+        self.assertEqual(threaded_spans[5], ("HTTP_GET", None, 404))
+
+    def test_etag_revalidation_returns_304(self):
+        """携带匹配的If-None-Match时两个后端都返回304"""
+        for responses in (self.threaded_responses, self.aiohttp_responses):
+            results = responses(_PARITY_REQUESTS[:2], revalidate=True)
+            self.assertEqual([(status, body) for status, _, body in results], [(304, b"")] * 2)
+
+
+class TestServerShutdown(unittest.TestCase):
+    """测试服务器关闭时刷新OpenTelemetry"""
+
+    def test_threaded_server_shuts_down_opentelemetry(self):
+        """线程服务器退出时调用shutdown_opentelemetry"""
+        agent = _ServerAgent()
+        agent.config = {"host": "127.0.0.1", "port": 0}
+        with mock.patch.object(http.server.ThreadingHTTPServer, "serve_forever",
+                               side_effect=KeyboardInterrupt), \
+                mock.patch.object(http_server, "shutdown_opentelemetry") as shutdown:
+            http_server.start_json_server(agent)
+        shutdown.assert_called_once_with()
+
+    @unittest.skipIf(http_server.web is None, "aiohttp未安装")
+    def test_aiohttp_server_shuts_down_opentelemetry(self):
+        """aiohttp后端退出时调用shutdown_opentelemetry"""
+        agent = _ServerAgent()
+        agent.config = {"host": "127.0.0.1", "port": 0, "http_backend": "aiohttp"}
+        with mock.patch.object(http_server.web, "run_app"), \
+                mock.patch.object(http_server, "shutdown_opentelemetry") as shutdown:
+            http_server.start_json_server(agent)
+        shutdown.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
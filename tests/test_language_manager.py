@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+语言管理模块单元测试
+"""
+
+import logging
+import os
+import sys
+import unittest
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import language_manager
+from src.utils.language_resources import LanguageManager, get_current_language, set_language
+
+
+class TestLanguageAwareText(unittest.TestCase):
+    """测试通过语言管理器获取文本"""
+
+    def test_language_aware_text(self):
+        """按管理器的语言返回格式化文本"""
+        manager = LanguageManager("en")
+        self.assertEqual(
+            language_manager.get_language_aware_text(manager, "server_started", "host:1"),
+            "JSON API server started: http://host:1",
+        )
+
+    def test_language_aware_logger(self):
+        """日志器按键名翻译后再记录"""
+        logger = mock.Mock()
+        wrapped = language_manager.create_language_aware_logger(logger, LanguageManager("zh"))
+        wrapped.info("server_started", "host:1")
+        logger.info.assert_called_once_with("JSON API服务器已启动: http://host:1")
+
+    def test_logger_passthrough(self):
+        """其他方法被缓存，普通属性始终读取当前值"""
+        logger = logging.getLogger("test_language_manager")
+        wrapped = language_manager.create_language_aware_logger(logger, LanguageManager("zh"))
+        wrapped.setLevel(logging.DEBUG)
+        self.assertIn("setLevel", vars(wrapped))
+        self.assertEqual(wrapped.level, logging.DEBUG)
+        wrapped.setLevel(logging.INFO)
+        self.assertEqual(wrapped.level, logging.INFO)
+
+
+class TestSwitchLanguage(unittest.TestCase):
+    """测试语言切换"""
+
+    def setUp(self):
+        self.global_language = get_current_language()
+
+    def tearDown(self):
+        set_language(self.global_language)
+
+    def test_unchanged_language_is_noop(self):
+        """语言未变化时不重新绑定资源表"""
+        manager = LanguageManager("en")
+        with mock.patch.object(manager, "_tables", {}):
+            # 资源表为空时若真的重新查找会抛出KeyError
+            manager.set_language("en")
+        self.assertEqual(manager.get_language(), "en")
+
+    def test_unsupported_language_is_logged_before_noop(self):
+        """不支持的语言先记录警告并回退到中文，再判断是否需要切换"""
+        manager = LanguageManager("zh")
+        with self.assertLogs("src.utils.language_resources", level="WARNING") as logs:
+            manager.set_language("fr")
+        self.assertEqual(manager.get_language(), "zh")
+        self.assertIn("'fr'", logs.output[0])
+
+        manager = LanguageManager("fr")
+        manager.set_language("fr")
+        self.assertEqual(manager.get_language(), "zh")
+
+    def test_switch_language(self):
+        """切换到另一种有效语言"""
+        manager = LanguageManager("en")
+        self.assertTrue(language_manager.switch_language("zh", manager))
+        self.assertEqual(manager.get_language(), "zh")
+        self.assertFalse(language_manager.switch_language("fr", manager))
+        self.assertEqual(manager.get_language(), "zh")
+
+    def test_repeated_key_follows_language_switch(self):
+        """同一个键连续查找时，切换语言后返回新语言的文本"""
+        manager = LanguageManager("en")
+        self.assertEqual(manager.get("enabled"), manager.get("enabled"))
+        english = manager.get("server_started")
+        manager.set_language("zh")
+        self.assertNotEqual(manager.get("server_started"), english)
+        self.assertEqual(manager.get("server_started"), "JSON API服务器已启动: http://{}")
+
+
+class TestAvailableLanguages(unittest.TestCase):
+    """测试可用语言常量"""
+
+    def test_available_languages_is_read_only(self):
+        """返回同一个只读映射"""
+        languages = language_manager.get_available_languages()
+        self.assertIs(languages, language_manager.get_available_languages())
+        with self.assertRaises(TypeError):
+            languages["fr"] = "Français"
+        self.assertTrue(language_manager.validate_language("en"))
+        self.assertFalse(language_manager.validate_language("fr"))
+
+    def test_language_info(self):
+        """可用语言的信息被复用，未知语言标记为不可用"""
+        info = language_manager.get_language_info("en")
+        self.assertIs(info, language_manager.get_language_info("en"))
+        self.assertEqual(dict(info), {"code": "en", "name": "English (英语)", "available": True})
+        self.assertFalse(language_manager.get_language_info("fr")["available"])
+        self.assertEqual(language_manager.format_language_display("fr"), "Unknown (fr)")
+
+
+class TestDetectLanguageFromRequest(unittest.TestCase):
+    """测试从Accept-Language检测语言"""
+
+    def detect(self, accept_language):
+        return language_manager.detect_language_from_request({"Accept-Language": accept_language})
+
+    def test_highest_quality_wins(self):
+        """选择q值最高的可用语言"""
+        self.assertEqual(self.detect("en-US;q=0.9,zh;q=0.1"), "en")
+        self.assertEqual(self.detect("zh;q=0.3,en-GB;q=0.8"), "en")
+        self.assertEqual(self.detect("fr, en;q=0.5"), "en")
+
+    def test_default_is_chinese(self):
+        """没有可用语言时默认中文"""
+        self.assertEqual(self.detect(""), "zh")
+        self.assertEqual(self.detect("fr-FR,de"), "zh")
+        self.assertEqual(self.detect("en;q=0"), "zh")
+
+    def test_longer_tags_do_not_match_by_prefix(self):
+        """三字母等更长的标签不会按前两个字母匹配"""
+        self.assertEqual(self.detect("eng, zh;q=0.5"), "zh")
+        self.assertEqual(self.detect("zho;q=0.9, en;q=0.2"), "en")
+
+    def test_public_detect_language_uses_given_default(self):
+        """公开的detect_language在没有可用语言时返回调用方给出的默认值"""
+        self.assertEqual(language_manager.detect_language("fr-FR,de", "en"), "en")
+        self.assertEqual(language_manager.detect_language("zh-CN;q=0.8", "en"), "zh")
+        self.assertEqual(language_manager.detect_language(""), "zh")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OpenTelemetry集成模块单元测试
+"""
+
+import logging
+import os
+import sys
+import unittest
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import opentelemetry_integration
+from opentelemetry_integration import OpenTelemetryManager
+
+
+def _enabled_manager(tracer):
+    """构造一个已启用、使用给定tracer的管理器"""
+    manager = OpenTelemetryManager({}, logging.getLogger("test_otel"))
+    manager.tracer = tracer
+    manager.initialized = True
+    manager._enabled = True
+    manager._start_span = tracer.start_span
+    return manager
+
+
+class TestSpanContext(unittest.TestCase):
+    """测试span上下文管理器"""
+
+    def test_disabled_returns_shared_null_span(self):
+        """未启用时返回共享的空Span"""
+        manager = OpenTelemetryManager({}, logging.getLogger("test_otel"))
+        with manager.span("request", {"http.method": "GET"}) as span:
+            span.set_attribute("http.status_code", 200)
+        self.assertIs(span, opentelemetry_integration._NULL_SPAN)
+        self.assertFalse(span)
+
+    def test_enabled_span_is_ended(self):
+        """启用时创建真实Span并在退出时结束"""
+        tracer = mock.Mock()
+        manager = _enabled_manager(tracer)
+        with manager.span("request", {"http.method": "GET"}) as span:
+            pass
+        tracer.start_span.assert_called_once_with("request")
+        self.assertIs(span, tracer.start_span.return_value)
+        span.end.assert_called_once_with()
+        span.set_attributes.assert_called_once_with({"http.method": "GET"})
+        span.set_attribute.assert_not_called()
+
+    def test_end_span_sets_attributes_once(self):
+        """结束Span时的属性一次设置"""
+        manager = _enabled_manager(mock.Mock())
+        span = mock.Mock()
+        manager.end_span(span, status_code=500, error=True, error_message="boom")
+        span.set_attributes.assert_called_once_with(
+            {"http.status_code": 500, "error": True, "error.message": "boom"}
+        )
+        span.end.assert_called_once_with()
+
+
+class TestProviderReuse(unittest.TestCase):
+    """测试重复初始化时复用TracerProvider"""
+
+    def setUp(self):
+        sdk = {
+            name: mock.MagicMock(name=name)
+            for name in ("trace", "TracerProvider", "BatchSpanProcessor", "ConsoleSpanExporter",
+                         "Resource", "HTTPInstrumentor")
+        }
+        patches = [mock.patch.object(opentelemetry_integration, name, value) for name, value in sdk.items()]
+        patches += [
+            mock.patch.object(opentelemetry_integration, "_load_opentelemetry", return_value=True),
+            mock.patch.object(opentelemetry_integration, "SERVICE_NAME", "service.name"),
+            mock.patch.object(opentelemetry_integration, "_PROVIDER", None),
+            mock.patch.object(opentelemetry_integration, "_INSTRUMENTED", False),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.sdk = sdk
+        self.config = {"opentelemetry": {"enabled": True}}
+
+    def test_second_init_reuses_provider(self):
+        """第二次初始化不再创建Provider，关闭时刷新一次"""
+        logger = logging.getLogger("test_otel")
+        first = OpenTelemetryManager(self.config, logger).init_opentelemetry(None)
+        second_manager = OpenTelemetryManager(self.config, logger)
+        second = second_manager.init_opentelemetry(None)
+
+        provider = self.sdk["TracerProvider"].return_value
+        self.sdk["TracerProvider"].assert_called_once()
+        self.sdk["trace"].set_tracer_provider.assert_called_once_with(provider)
+        self.sdk["HTTPInstrumentor"].return_value.instrument.assert_called_once_with()
+        self.assertIs(first, second)
+        self.assertTrue(second_manager.is_enabled())
+
+        opentelemetry_integration.shutdown_opentelemetry()
+        opentelemetry_integration.shutdown_opentelemetry()
+        provider.shutdown.assert_called_once_with()
+
+
+class TestDefaultConfig(unittest.TestCase):
+    """测试默认配置"""
+
+    def test_matches_config_manager_defaults(self):
+        """与config_manager中的OpenTelemetry默认配置键一致"""
+        import config_manager
+
+        self.assertEqual(
+            set(opentelemetry_integration.get_default_opentelemetry_config()),
+            set(config_manager.get_default_config()["opentelemetry"]),
+        )
+        self.assertEqual(
+            opentelemetry_integration.get_default_opentelemetry_config()["processor"], "batch"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
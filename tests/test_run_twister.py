@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+run_twister工具单元测试
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.tools import run_twister as run_twister_module
+
+
+class TestTwisterJobs(unittest.TestCase):
+    """测试并发运行时的-j分配"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.project_dir = tmp.name
+        os.makedirs(os.path.join(self.project_dir, "scripts"))
+        with open(os.path.join(self.project_dir, "scripts", "twister"), "w", encoding="utf-8") as f:
+            f.write("")
+
+        self.commands = []
+
+        def fake_run_streamed(cmd, **kwargs):
+            self.commands.append(cmd)
+            return {"status": "success", "returncode": 0, "stdout": "", "stderr": ""}
+
+        for target, value in (
+            ("run_streamed", fake_run_streamed),
+            ("_CPU_COUNT", 16),
+            ("_TWISTER_SLOTS", threading.BoundedSemaphore(4)),
+        ):
+            patcher = mock.patch.object(run_twister_module, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_single_run_uses_every_core(self):
+        """只有一个运行时不添加-j，由twister使用全部核心"""
+        result = run_twister_module.run_twister(project_dir=self.project_dir)
+
+        self.assertEqual(result["status"], "success")
+        self.assertNotIn("-j", self.commands[0])
+
+    def test_concurrent_run_gets_a_share(self):
+        """已有运行占用名额时按运行数分配-j"""
+        with run_twister_module._twister_slot():
+            run_twister_module.run_twister(project_dir=self.project_dir)
+
+        cmd = self.commands[0]
+        self.assertEqual(cmd[cmd.index("-j") + 1], "8")
+
+    def test_explicit_jobs_are_kept(self):
+        """调用方指定-j时不再添加"""
+        with run_twister_module._twister_slot():
+            run_twister_module.run_twister(project_dir=self.project_dir, extra_args="-j 3")
+
+        self.assertEqual(self.commands[0].count("-j"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
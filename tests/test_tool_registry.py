@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+工具注册表单元测试
+"""
+
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.tool_registry import ToolRegistry
+
+
+def _validate_params(params, get_text):
+    return None if "dir" in params else get_text("missing_required_param", "dir")
+
+
+def _make_module(name, **functions):
+    module = types.ModuleType(name)
+    for func_name, func in functions.items():
+        func.__doc__ = f"{func_name} tool"
+        setattr(module, func_name, func)
+    module.validate_params = _validate_params
+    return module
+
+
+class TestRegisterToolValidator(unittest.TestCase):
+    """测试每个注册分支都保存模块的参数验证器"""
+
+    def register(self, module):
+        registry = ToolRegistry()
+        with mock.patch.object(registry, "load_tool_module", return_value=module):
+            results = registry.register_tool(module.__name__)
+        return registry, results
+
+    def test_direct_function(self):
+        """模块中有同名函数时直接注册"""
+        registry, results = self.register(_make_module("single", single=lambda: None))
+        self.assertEqual(results, {"single": True})
+        self.assertIs(registry.registry["single"]["validator"], _validate_params)
+
+    def test_public_functions(self):
+        """没有同名函数时注册所有公共函数，验证钩子本身不作为工具注册"""
+        module = _make_module("multi", first=lambda: None, second=lambda: None)
+        registry, results = self.register(module)
+        self.assertEqual(results, {"first": True, "second": True})
+        for name in ("first", "second"):
+            self.assertIs(registry.registry[name]["validator"], _validate_params)
+
+
+if __name__ == "__main__":
+    unittest.main()
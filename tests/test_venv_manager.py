@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+虚拟环境管理模块单元测试
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# 添加项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import venv_manager
+
+
+class TestGetToolExecutable(unittest.TestCase):
+    """测试命令行工具路径解析的缓存"""
+
+    def setUp(self):
+        venv_manager.get_tool_executable.cache_clear()
+        self.addCleanup(venv_manager.get_tool_executable.cache_clear)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.bin_dir = tmp.name
+
+    @unittest.skipIf(os.name == "nt", "Windows按PATHEXT查找可执行文件")
+    def test_tool_installed_later_is_found(self):
+        """首次未找到时不缓存，之后安装的工具可以被找到"""
+        name = "zephyr-mcp-fake-tool"
+        with mock.patch.dict(os.environ, {"PATH": self.bin_dir}):
+            self.assertEqual(venv_manager.get_tool_executable(name), name)
+
+            path = os.path.join(self.bin_dir, name)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("#!/bin/sh\n")
+            os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+
+            self.assertEqual(venv_manager.get_tool_executable(name), path)
+            os.remove(path)
+            # 找到的路径被缓存
+            self.assertEqual(venv_manager.get_tool_executable(name), path)
+
+
+if __name__ == "__main__":
+    unittest.main()